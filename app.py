@@ -1,26 +1,46 @@
 """Entry point for the news monitoring application."""
 
+import atexit
 import os
+import signal
 from dotenv import load_dotenv
 
 load_dotenv()
 
+from catch_stock_news.config import reload_config
 from catch_stock_news.logging_setup import setup_logging
-from catch_stock_news.database import init_db
+from catch_stock_news.database import init_db, close_connections
+from catch_stock_news.dispatcher import start_dispatcher, dispatcher
+from catch_stock_news.retention import run_retention
+from catch_stock_news.runner import cycle_runner
 from catch_stock_news.scheduler import init_scheduler
-from catch_stock_news.services.news_checker import check_news_job
 from catch_stock_news.web import create_app
 
 logger = setup_logging()
 
+
+def _handle_sighup(signum, frame):
+    """Reload .env and the configuration snapshot on SIGHUP."""
+    try:
+        reload_config(reload_env_file=True)
+    except ValueError as e:
+        logger.error(f"Config reload failed: {e}")
+
+
 if __name__ == "__main__":
     init_db()
+    atexit.register(close_connections)
     logger.info("Database initialized")
 
-    init_scheduler(check_news_job)
+    start_dispatcher()
+    atexit.register(dispatcher.stop)
+
+    init_scheduler(cycle_runner.run_scheduled, run_retention)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, _handle_sighup)
 
     logger.info("Running initial news check...")
-    check_news_job()
+    cycle_runner.run_scheduled()
 
     app = create_app()
     port = int(os.environ.get("PORT", 5001))
@@ -0,0 +1,98 @@
+"""Benchmark database throughput under concurrent read/write load.
+
+Usage:
+    python benchmarks/bench_database.py [seconds] [readers]
+
+Runs reader threads (web UI queries: get_keywords + get_alerts) next to one
+writer thread (check cycle writes: save_alerts_and_mark_sent) against a fresh
+database, first with the legacy connection-per-call setup in the default
+rollback journal mode, then with the pooled WAL connection manager, and
+reports operations per second for each side.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catch_stock_news import database  # noqa: E402
+from catch_stock_news.models import MatchedNews, NewsItem  # noqa: E402
+
+
+def legacy_get_connection() -> sqlite3.Connection:
+    """Connection handling before the pool: a new rollback-journal connection per call."""
+    conn = sqlite3.connect(database.DATABASE_PATH)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def run(label: str, db_path: str, seconds: float, readers: int) -> None:
+    database.DATABASE_PATH = db_path
+    database.init_db()
+    for i in range(50):
+        database.add_keyword(f"키워드{i}")
+
+    stop = threading.Event()
+    counts = {"read": 0, "write": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def reader() -> None:
+        while not stop.is_set():
+            try:
+                database.get_keywords()
+                database.get_alerts(limit=50)
+                with lock:
+                    counts["read"] += 1
+            except sqlite3.OperationalError:
+                with lock:
+                    counts["errors"] += 1
+
+    def writer() -> None:
+        n = 0
+        while not stop.is_set():
+            batch = [
+                MatchedNews(NewsItem(title=f"벤치마크 뉴스 {n}-{i}", url=f"https://example.com/{n}/{i}",
+                                     time="12:00", source="한국경제"), ("키워드1",))
+                for i in range(5)
+            ]
+            n += 1
+            try:
+                database.save_alerts_and_mark_sent(batch)
+                with lock:
+                    counts["write"] += 1
+            except sqlite3.OperationalError:
+                with lock:
+                    counts["errors"] += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)] + [threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    print(f"{label:<8} reads/s {counts['read'] / seconds:>9.0f}   writes/s {counts['write'] / seconds:>7.0f}"
+          f"   errors {counts['errors']}")
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    pooled_get_connection = database.get_connection
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.get_connection = legacy_get_connection
+        run("before", str(Path(tmp) / "legacy.db"), seconds, readers)
+
+        database.get_connection = pooled_get_connection
+        run("after", str(Path(tmp) / "pooled.db"), seconds, readers)
+        database.close_connections()
+
+
+if __name__ == "__main__":
+    main()
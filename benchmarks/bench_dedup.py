@@ -0,0 +1,119 @@
+"""Benchmark article identity extraction and sent-news lookups.
+
+Usage:
+    python benchmarks/bench_dedup.py [rows] [repeat]
+
+- Extraction: canonicalizing list page hrefs with urlparse/parse_qs (the
+  previous convert_to_direct_news_url) against the regular expressions in
+  articles.py.
+- Storage: sent_news with rows (200,000 by default) Naver articles, indexed
+  by the previous unique TEXT index on news_url against the INTEGER
+  article_key index. Reports each index's size (dbstat) and the median time
+  of a 20-item "already sent?" lookup, the shape of one page of matches.
+"""
+
+import sqlite3
+import statistics
+import sys
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catch_stock_news.articles import canonical_article_url, url_article_key  # noqa: E402
+
+
+def legacy_convert(url: str) -> str:
+    parsed = urlparse(url)
+    if "news_read.naver" not in parsed.path:
+        return url
+    params = parse_qs(parsed.query)
+    article_id = params.get("article_id", [None])[0]
+    office_id = params.get("office_id", [None])[0]
+    if article_id and office_id:
+        return f"https://n.news.naver.com/mnews/article/{office_id}/{article_id}"
+    return url
+
+
+def hrefs(count: int):
+    return [
+        f"/news/news_read.naver?article_id={5_000_000_000 + n:010d}&office_id={1 + n % 120:03d}"
+        f"&mode=LSS2D&type=0&section_id=101&section_id2=258&page={1 + n % 5}"
+        for n in range(count)
+    ]
+
+
+def timed(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def build(rows: int, by_key: bool) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""
+        CREATE TABLE sent_news (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            news_url TEXT NOT NULL,
+            news_title TEXT,
+            article_key INTEGER,
+            sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    if by_key:
+        conn.execute("CREATE UNIQUE INDEX idx_key ON sent_news(article_key) WHERE article_key IS NOT NULL")
+        conn.execute("CREATE UNIQUE INDEX idx_url ON sent_news(news_url) WHERE article_key IS NULL")
+    else:
+        conn.execute("CREATE UNIQUE INDEX idx_url ON sent_news(news_url)")
+
+    urls = [canonical_article_url(href) for href in hrefs(rows)]
+    conn.executemany(
+        "INSERT INTO sent_news (news_url, news_title, article_key) VALUES (?, '', ?)",
+        ((url, url_article_key(url) if by_key else None) for url in urls)
+    )
+    conn.commit()
+    return conn
+
+
+def index_kb(conn: sqlite3.Connection, name: str) -> float:
+    return conn.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = ?", (name,)).fetchone()[0] / 1024
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    sample = hrefs(20_000)
+    legacy = timed(lambda: [legacy_convert(href) for href in sample], 5) / len(sample)
+    current = timed(lambda: [canonical_article_url(href) for href in sample], 5) / len(sample)
+    print(f"canonicalize href: urlparse/parse_qs {legacy * 1e6:.2f} us, regex {current * 1e6:.2f} us "
+          f"({legacy / current:.1f}x)")
+
+    # Half of every lookup batch was sent, half is new
+    urls = [canonical_article_url(href) for href in hrefs(rows + 10)]
+    batch_urls = urls[rows - 10:rows + 10]
+    batch_keys = [url_article_key(url) for url in batch_urls]
+
+    print(f"\nsent_news with {rows:,} rows")
+    print(f"{'dedup key':<14}{'index KB':>10}{'lookup us':>11}")
+    for label, by_key in (("news_url TEXT", False), ("article_key", True)):
+        conn = build(rows, by_key)
+        if by_key:
+            values, query = batch_keys, "SELECT article_key FROM sent_news WHERE article_key IN ({})"
+        else:
+            values, query = batch_urls, "SELECT news_url FROM sent_news WHERE news_url IN ({})"
+        sql = query.format(", ".join("?" for _ in values))
+        assert len(conn.execute(sql, values).fetchall()) == 10
+
+        lookup = timed(lambda: conn.execute(sql, values).fetchall(), repeat)
+        size = index_kb(conn, "idx_key" if by_key else "idx_url")
+        print(f"{label:<14}{size:>10.0f}{lookup * 1e6:>11.1f}")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark the memory held by scraped and matched news items.
+
+Usage:
+    python benchmarks/bench_models.py [items]
+
+Builds 100,000 items (by default) the way a cycle does, with fresh strings
+as a parser would produce them, and measures the traced memory of:
+
+- legacy: a plain NewsItem dataclass per article, plus a dict copy with a
+  matched keyword list for every match, as the pipeline used to carry.
+- current: the slotted, frozen NewsItem with an interned source and parsed
+  office/article ids, plus a MatchedNews wrapper holding a keyword tuple.
+
+Every item matches, which is the upper bound for the dict copies.
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catch_stock_news.articles import parse_article_id  # noqa: E402
+from catch_stock_news.models import MatchedNews, NewsItem  # noqa: E402
+
+SOURCES = ["연합뉴스", "한국경제", "매일경제", "이데일리", "머니투데이", "서울경제", "뉴스1", "아시아경제"]
+
+
+@dataclass
+class LegacyNewsItem:
+    title: str
+    url: str
+    time: str
+    source: str = ""
+    feed: str = ""
+
+
+def raw_records(count: int):
+    """(title, url, time, source) with distinct string objects, like parsed HTML."""
+    for n in range(count):
+        office = 1 + n % 100
+        yield (
+            f"삼성전자 실적 발표 {n} 시장 기대 상회",
+            f"https://n.news.naver.com/mnews/article/{office:03d}/{n:010d}",
+            f"2024.01.01 {n % 24:02d}:{n % 60:02d}",
+            "".join(SOURCES[n % len(SOURCES)]),
+        )
+
+
+def build_legacy(count: int):
+    items = [LegacyNewsItem(title, url, time_str, source, "realtime")
+             for title, url, time_str, source in raw_records(count)]
+    matched = [
+        {"title": item.title, "url": item.url, "time": item.time, "source": item.source,
+         "matched_keywords": ["삼성전자"]}
+        for item in items
+    ]
+    return items, matched
+
+
+def build_current(count: int):
+    keywords = ("삼성전자",)
+    items = []
+    for title, url, time_str, source in raw_records(count):
+        office_id, article_id = parse_article_id(url)
+        items.append(NewsItem(title, url, time_str, sys.intern(source), "realtime", office_id, article_id))
+    matched = [MatchedNews(item, keywords) for item in items]
+    return items, matched
+
+
+def measure(build, count: int):
+    """Returns (items MB, matches MB, build seconds)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    items, matched = build(count)
+    duration = time.perf_counter() - start
+    total = tracemalloc.get_traced_memory()[0]
+    del matched
+    items_only = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return items_only / 1024 / 1024, (total - items_only) / 1024 / 1024, duration
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    slotted = hasattr(NewsItem, "__slots__")
+
+    print(f"{count:,} items, every one matched (NewsItem slotted: {slotted})")
+    print(f"{'model':<10}{'items MB':>10}{'matches MB':>12}{'total MB':>10}{'build s':>9}")
+    for label, build in (("legacy", build_legacy), ("current", build_current)):
+        items_mb, matched_mb, duration = measure(build, count)
+        print(f"{label:<10}{items_mb:>10.1f}{matched_mb:>12.1f}{items_mb + matched_mb:>10.1f}{duration:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Microbenchmark for the news list parser backends.
+
+Usage:
+    python benchmarks/bench_parsers.py [iterations]
+
+Parses the saved list page fixture (its article blocks repeated to the size
+of a real 20-article page) with every installed backend and reports the
+per-page parse time, including NewsItem construction.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catch_stock_news.parsers import available_backends, get_backend  # noqa: E402
+from catch_stock_news.scraper import _build_items  # noqa: E402
+
+FIXTURE = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "news_list.html"
+
+
+def build_page(html: str, copies: int = 3) -> str:
+    """Repeat the fixture's news list blocks to approximate a full page."""
+    start = html.index('<ul class="realtimeNewsList">') + len('<ul class="realtimeNewsList">')
+    end = html.index("</ul>", start)
+    return html[:start] + html[start:end] * copies + html[end:]
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    html = build_page(FIXTURE.read_text(encoding="utf-8"))
+
+    print(f"{'backend':<12} {'items':>6} {'ms/page':>10} {'speedup':>8}")
+    baseline = None
+    for name in reversed(available_backends()):
+        _, parse = get_backend(name)
+        items = _build_items(parse(html))
+        seconds = timeit.timeit(lambda: _build_items(parse(html)), number=iterations) / iterations
+        baseline = baseline or seconds
+        print(f"{name:<12} {len(items):>6} {seconds * 1000:>10.3f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Benchmark first-alert latency and peak memory of the news check pipeline.
+
+Usage:
+    python benchmarks/bench_pipeline.py [pages] [latency_ms] [deep_pages]
+
+Serves synthetic 20-article list pages from a fake session that takes
+latency_ms per request, with one keyword match per page, and runs a news
+check two ways over a fresh database:
+
+- streaming: check_news_job as shipped, where every page is matched,
+  stored and queued for notification while later pages are downloading.
+- materialized: the same stages run once over all pages after the last one
+  has arrived, as the pipeline used to work.
+
+Reports the time from cycle start to the first queued notification, the
+cycle duration and, for a deep catch-up scan of deep_pages pages without
+latency, the peak traced memory.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.update(FETCH_RATE_LIMIT="0", INCREMENTAL_SCRAPING="false", FETCH_WORKERS="4", SLACK_WEBHOOK_URL="")
+
+from catch_stock_news import database, scraper  # noqa: E402
+from catch_stock_news.config import get_config, reload_config  # noqa: E402
+from catch_stock_news.keyword_registry import keyword_registry  # noqa: E402
+from catch_stock_news.scraper import fetch_news, merge_feed_items  # noqa: E402
+from catch_stock_news.services import news_checker  # noqa: E402
+from catch_stock_news.sources import resolve_feeds  # noqa: E402
+
+WORDS = ["실적", "발표", "수주", "증가", "전망", "상향", "투자", "확대", "출시", "공시", "매입", "회복",
+         "계약", "합병", "배당", "수출", "감소", "하락", "급등", "신고가", "목표가", "점검", "재개", "완화"]
+
+
+class _Response:
+    def __init__(self, content: bytes):
+        self.status_code = 200
+        self.content = content
+        self.headers = {}
+        self.encoding = None
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8")
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class PageSession:
+    """Fake session serving distinct 20-article pages, one 반도체 article per page."""
+
+    def __init__(self, pages: int, latency: float, seed: int):
+        self.pages = pages
+        self.latency = latency
+        self.seed = seed
+
+    def get(self, url, headers=None, timeout=None):
+        page = int(url.rsplit("page=", 1)[1])
+        time.sleep(self.latency)
+        if page > self.pages:
+            return _Response(b"<dl></dl>")
+
+        rng = random.Random(f"{self.seed}-{page}")
+        blocks = []
+        for n in range(20):
+            title = " ".join(rng.sample(WORDS, 5))
+            if n == 0:
+                title = f"반도체 {title}"
+            blocks.append(
+                f'<dd class="articleSubject"><a href="https://n.news.naver.com/mnews/article/001/'
+                f'{self.seed:03d}{page:04d}{n:03d}">{title} {page}-{n}</a></dd>'
+            )
+        return _Response(f"<dl>{''.join(blocks)}</dl>".encode("euc-kr"))
+
+
+def run_streaming() -> None:
+    news_checker.check_news_job()
+
+
+def run_materialized() -> None:
+    """The previous shape of a cycle: fetch everything, then process it as one batch."""
+    config = get_config()
+    matcher = keyword_registry.get_matcher()
+    result = fetch_news(resolve_feeds(config["news_feeds"]), max_pages=config["max_pages"],
+                        max_workers=config["fetch_workers"], parser=config["parser_backend"])
+    counts = {"fetched": 0, "matched": 0, "duplicate": 0, "queued": 0}
+    batches = news_checker._match_items(iter([merge_feed_items(result.items)]), matcher.keywords, matcher, counts)
+    batches = news_checker._drop_sent(batches, config["similarity_threshold"], counts, config["similarity_window"])
+    for outbox_ids, new_news in news_checker._persist(batches, True):
+        for outbox_id, news in zip(outbox_ids, new_news):
+            news_checker.dispatcher.enqueue(outbox_id, news)
+
+
+def measure(run, pages: int, latency: float, seed: int, trace: bool = False):
+    """Run one cycle. Returns (first alert s, cycle s, alerts queued, peak MB)."""
+    queued = []
+    news_checker.dispatcher.enqueue = lambda outbox_id, news: queued.append(time.perf_counter())
+    scraper.clear_page_cache()
+    scraper._feed_polled_at.clear()
+    scraper.get_session = lambda: PageSession(pages, latency, seed)
+
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    run()
+    duration = time.perf_counter() - start
+    peak = 0.0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+
+    first = queued[0] - start if queued else float("nan")
+    return first, duration, len(queued), peak
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 80) / 1000
+    deep_pages = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    news_checker.is_notification_time = lambda: True
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DATABASE_PATH = str(Path(tmp) / "bench.db")
+        database.init_db()
+        database.add_keyword("반도체")
+
+        print(f"{pages} pages at {latency * 1000:.0f} ms each, {get_config()['fetch_workers']} concurrent")
+        print(f"{'pipeline':<14}{'first alert ms':>16}{'cycle ms':>10}{'alerts':>8}")
+        seed = 0
+        for label, run in (("materialized", run_materialized), ("streaming", run_streaming)):
+            seed += 1
+            os.environ["MAX_PAGES"] = str(pages)
+            reload_config()
+            first, duration, alerts, _ = measure(run, pages, latency, seed)
+            print(f"{label:<14}{first * 1000:>16.1f}{duration * 1000:>10.1f}{alerts:>8}")
+
+        print(f"\nDeep catch-up scan: {deep_pages} pages, no latency")
+        print(f"{'pipeline':<14}{'peak MB':>10}{'cycle ms':>10}{'alerts':>8}")
+        for label, run in (("materialized", run_materialized), ("streaming", run_streaming)):
+            seed += 1
+            os.environ["MAX_PAGES"] = str(deep_pages)
+            reload_config()
+            _, duration, alerts, peak = measure(run, deep_pages, 0.0, seed, trace=True)
+            print(f"{label:<14}{peak:>10.2f}{duration * 1000:>10.1f}{alerts:>8}")
+
+        keyword_registry.close()
+        database.close_connections()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark alert title search at large history sizes.
+
+Usage:
+    python benchmarks/bench_search.py [alerts] [repeat]
+
+Fills a fresh database with synthetic alert titles (300,000 by default),
+then times search_alerts for common, rare, multi-term, short-term and
+no-hit queries through the FTS5 trigram index, next to the equivalent
+LIKE full scan. Ranking covers the newest
+database.SEARCH_RANK_WINDOW matches, so common terms stay bounded.
+"""
+
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catch_stock_news import database  # noqa: E402
+
+COMPANIES = ["삼성전자", "SK하이닉스", "현대차", "LG에너지솔루션", "카카오", "네이버", "셀트리온",
+             "POSCO홀딩스", "기아", "KB금융", "신한지주", "삼성바이오로직스", "에코프로", "한화오션"]
+EVENTS = ["실적 발표", "주가 급등", "목표주가 상향", "신규 수주", "자사주 매입", "배당 확대",
+          "유상증자 결정", "외국인 순매수", "공매도 증가", "신제품 출시", "합병 추진", "소송 제기"]
+DETAILS = ["시장 기대 상회", "전년 대비 증가", "업계 최초", "증권가 전망", "장 마감 후 공시",
+           "글로벌 수요 회복", "환율 영향", "2분기 연속", "사상 최대", "하반기 본격화"]
+
+QUERIES = {
+    "common (1 term)": "삼성전자",
+    "rare (1 term)": "한화오션 합병",
+    "multi-term": "현대차 신규 수주 사상 최대",
+    "short term only": "기아",
+    "mixed short+long": "배당 확대 KB",
+    "no hits": "존재하지않는검색어",
+}
+
+
+def fill(count: int) -> None:
+    rng = random.Random(42)
+    conn = database.get_connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO alerts (title, url, matched_keywords, news_time, news_source) VALUES (?, ?, ?, '', '')",
+            (
+                (f"{rng.choice(COMPANIES)}, {rng.choice(EVENTS)}… {rng.choice(DETAILS)} ({n})",
+                 f"https://n.news.naver.com/{n}", "")
+                for n in range(count)
+            )
+        )
+    conn.close()
+
+
+def like_scan(query: str, limit: int = 20) -> None:
+    conn = database.get_connection()
+    conditions = " AND ".join(["title LIKE ? ESCAPE '\\'"] * len(query.split()))
+    conn.execute(
+        f"SELECT id FROM alerts WHERE {conditions} ORDER BY id DESC LIMIT ?",
+        [database._like_pattern(term) for term in query.split()] + [limit]
+    ).fetchall()
+    conn.close()
+
+
+def timed(func, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DATABASE_PATH = str(Path(tmp) / "bench.db")
+        database.init_db()
+
+        start = time.perf_counter()
+        fill(count)
+        print(f"SQLite {sqlite3.sqlite_version}: inserted {count:,} alerts (indexed by triggers) "
+              f"in {time.perf_counter() - start:.1f}s")
+        print(f"{'query':<20}{'hits':>8}{'search ms':>12}{'LIKE ms':>10}")
+
+        for label, query in QUERIES.items():
+            hits = len(database.search_alerts(query, limit=20)["alerts"])
+            search_ms = timed(lambda: database.search_alerts(query, limit=20), repeat)
+            like_ms = timed(lambda: like_scan(query), max(1, repeat // 4))
+            print(f"{label:<20}{hits:>8}{search_ms:>12.2f}{like_ms:>10.2f}")
+
+        database.close_connections()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark near-duplicate title detection at 1k, 10k and 100k stored titles.
+
+Usage:
+    python benchmarks/bench_similarity.py [queries]
+
+Compares the per-title cost of TitleSimilarityIndex against the previous
+approach of running SequenceMatcher.ratio() against every stored title, and
+checks that both give the same answers. Brute force is only timed on a
+sample of queries at the larger sizes because it is too slow otherwise.
+"""
+
+import itertools
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from catch_stock_news.similarity import TitleSimilarityIndex  # noqa: E402
+
+THRESHOLD = 0.8
+
+HANGUL_START, HANGUL_COUNT = 0xAC00, 2350  # Rough size of the commonly used syllable set
+
+
+def build_vocabulary(rng: random.Random, size: int = 20_000) -> tuple:
+    """Random 1-4 syllable words standing in for headline vocabulary, with Zipf weights."""
+    words = [
+        "".join(chr(HANGUL_START + rng.randrange(HANGUL_COUNT) * 4) for _ in range(rng.randint(1, 4)))
+        for _ in range(size)
+    ]
+    cum_weights = list(itertools.accumulate(1.0 / rank for rank in range(1, size + 1)))
+    return words, cum_weights
+
+
+def random_title(rng: random.Random, vocabulary: tuple) -> str:
+    """Headline of 4-9 words drawn with a Zipf-like frequency distribution."""
+    words, cum_weights = vocabulary
+    title = rng.choices(words, cum_weights=cum_weights, k=rng.randint(4, 9))
+    if rng.random() < 0.2:
+        title.insert(0, rng.choice(["[속보]", "[특징주]", "[마감시황]"]))
+    return " ".join(title)
+
+
+def brute_force(title: str, stored: list) -> bool:
+    return any(SequenceMatcher(None, title, other).ratio() >= THRESHOLD for other in stored)
+
+
+def main() -> None:
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(7)
+    vocabulary = build_vocabulary(rng)
+
+    print(f"{'stored':>8} {'index us/title':>15} {'brute us/title':>15} {'speedup':>8}")
+    for size in (1_000, 10_000, 100_000):
+        stored = [random_title(rng, vocabulary) for _ in range(size)]
+        index = TitleSimilarityIndex(stored)
+
+        # Half fresh titles, half near-duplicates of stored ones
+        sample = [random_title(rng, vocabulary) for _ in range(queries // 2)]
+        sample += [rng.choice(stored) + "…" for _ in range(queries - len(sample))]
+
+        start = time.perf_counter()
+        results = [index.is_similar(title, THRESHOLD) for title in sample]
+        index_cost = (time.perf_counter() - start) / len(sample)
+
+        brute_sample = sample[:max(2, queries * 1_000 // size)]
+        start = time.perf_counter()
+        expected = [brute_force(title, stored) for title in brute_sample]
+        brute_cost = (time.perf_counter() - start) / len(brute_sample)
+
+        assert results[:len(brute_sample)] == expected, "index disagrees with brute force"
+        print(f"{size:>8} {index_cost * 1e6:>15.1f} {brute_cost * 1e6:>15.1f} {brute_cost / index_cost:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Canonical identity of Naver news articles.
+
+The same article shows up under several URLs: finance list pages link to
+news_read.naver with article_id/office_id query parameters (in either
+order, plus mode/page/section noise), ticker pages to item/news_read.naver,
+and direct links to n.news.naver.com/mnews/article/<office>/<article>,
+sometimes with ?sid=... appended. What identifies the article is the pair
+(office_id, article_id), which is packed into one integer article key:
+
+    key = office_id << ARTICLE_ID_BITS | article_id
+
+Naver article ids are ten digits (< 2**34) and office ids three, so keys
+fit SQLite's signed 64-bit INTEGER with room to spare. URLs that are not
+Naver articles have no key (0) and are identified by the URL itself.
+
+Extraction uses a few precompiled regular expressions instead of
+urlparse/parse_qs, since every link on every scraped page goes through it.
+"""
+
+import re
+from typing import Hashable, Optional, Tuple
+
+ARTICLE_ID_BITS = 40
+MAX_OFFICE_ID = (1 << (63 - ARTICLE_ID_BITS)) - 1
+MAX_ARTICLE_ID = (1 << ARTICLE_ID_BITS) - 1
+
+CANONICAL_URL = "https://n.news.naver.com/mnews/article/{office_id}/{article_id}"
+
+# n.news.naver.com/mnews/article/015/0005240919 (also m.news / news, with or without /mnews)
+_ARTICLE_PATH = re.compile(r"^(?:https?://)?(?:[nm]\.)?news\.naver\.com/(?:mnews/)?article/(\d+)/(\d+)")
+
+# .../news_read.naver?article_id=...&office_id=... and news.naver.com/main/read.naver?oid=...&aid=...
+_READ_PAGE = re.compile(r"read\.naver\?")
+_OFFICE_PARAM = re.compile(r"[?&](?:office_id|oid)=(\d+)")
+_ARTICLE_PARAM = re.compile(r"[?&](?:article_id|aid)=(\d+)")
+
+
+def extract_article_id(url: str) -> Optional[Tuple[str, str]]:
+    """(office_id, article_id) digit strings of a Naver article URL, as written in it, or None."""
+    match = _ARTICLE_PATH.match(url)
+    if match:
+        return match.group(1), match.group(2)
+
+    if _READ_PAGE.search(url):
+        office = _OFFICE_PARAM.search(url)
+        article = _ARTICLE_PARAM.search(url)
+        if office and article:
+            return office.group(1), article.group(1)
+
+    return None
+
+
+def parse_article_id(url: str) -> Tuple[int, int]:
+    """(office_id, article_id) of a Naver article URL, or (0, 0) for other URLs."""
+    ids = extract_article_id(url)
+    if ids is None:
+        return 0, 0
+    return int(ids[0]), int(ids[1])
+
+
+def article_key(office_id: int, article_id: int) -> int:
+    """Pack an article's ids into its key. 0 if either id is missing or out of range."""
+    if not (0 < office_id <= MAX_OFFICE_ID and 0 < article_id <= MAX_ARTICLE_ID):
+        return 0
+    return office_id << ARTICLE_ID_BITS | article_id
+
+
+def url_article_key(url: str) -> int:
+    """Article key of a URL, or 0 if it is not a Naver article."""
+    return article_key(*parse_article_id(url))
+
+
+def url_identity(url: str) -> Hashable:
+    """What identifies the article behind a URL: its article key, else the URL itself."""
+    return url_article_key(url) or url
+
+
+def canonical_article_url(url: str) -> str:
+    """The direct n.news.naver.com URL of a Naver article URL; other URLs are returned unchanged."""
+    return canonicalize(url)[0]
+
+
+def canonicalize(url: str) -> Tuple[str, int, int]:
+    """(canonical URL, office_id, article_id) of a URL in one pass; ids are 0 for other URLs."""
+    ids = extract_article_id(url)
+    if ids is None:
+        return url, 0, 0
+    return CANONICAL_URL.format(office_id=ids[0], article_id=ids[1]), int(ids[0]), int(ids[1])
@@ -0,0 +1,177 @@
+"""Per-host circuit breakers for scraper requests.
+
+A breaker counts consecutive failed requests to its host (network errors
+and 4xx/5xx responses). After failure_threshold of them it opens: requests
+are refused without touching the network for a cooldown period. Once the
+cooldown (with random jitter, so several processes do not probe in
+lockstep) has passed, one request at a time is let through as a half-open
+probe. A successful probe closes the breaker; a failed one reopens it with
+the cooldown doubled, up to max_cooldown.
+
+State changes are reported to listeners, which is how one outage produces
+a single notification instead of one per cycle.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from catch_stock_news.config import get_config
+from catch_stock_news.metrics import CIRCUIT_STATE
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Value of the scraper_circuit_state gauge per state
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Fraction of the cooldown added or removed at random
+COOLDOWN_JITTER = 0.2
+
+# Longest cooldown after repeated failed probes, in seconds
+MAX_COOLDOWN = 900.0
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the host's breaker is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Circuit open for {host}; retrying in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one host."""
+
+    def __init__(self, host: str, failure_threshold: int = 5, cooldown: float = 60.0,
+                 max_cooldown: float = MAX_COOLDOWN):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.opened_at: Optional[float] = None
+        self._cooldown = cooldown
+        self._retry_at = 0.0
+        self._probing = False
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent now."""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+
+            now = time.monotonic()
+            if self._probing or now < self._retry_at:
+                raise CircuitOpenError(self.host, max(0.0, self._retry_at - now))
+
+            self._probing = True
+            changed = self._set_state(HALF_OPEN)
+
+        self._notify(changed)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            self._cooldown = self.base_cooldown
+            changed = self._set_state(CLOSED)
+            if changed:
+                self.opened_at = None
+
+        self._notify(changed)
+
+    def record_failure(self, error: str) -> None:
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+
+            if self.state == OPEN:
+                return  # A request sent before the breaker opened
+            if self.state == HALF_OPEN:
+                self._cooldown = min(self._cooldown * 2, self.max_cooldown)
+            elif self.failures < self.failure_threshold:
+                return
+
+            self._probing = False
+            jitter = 1 + random.uniform(-COOLDOWN_JITTER, COOLDOWN_JITTER)
+            self._retry_at = time.monotonic() + self._cooldown * jitter
+            if self.state == CLOSED:
+                self.opened_at = time.time()
+            changed = self._set_state(OPEN)
+
+        self._notify(changed)
+
+    def _set_state(self, state: str) -> Optional[tuple]:
+        """Switch state. Caller holds _lock. Returns (old, new) if it changed."""
+        if state == self.state:
+            return None
+        old, self.state = self.state, state
+        return old, state
+
+    def _notify(self, changed: Optional[tuple]) -> None:
+        if changed is None:
+            return
+        old, new = changed
+        logger.info(f"Circuit for {self.host}: {old} -> {new}")
+        CIRCUIT_STATE.set(STATE_VALUES[new], host=self.host)
+        for listener in list(_listeners):
+            try:
+                listener(self, old, new)
+            except Exception as e:
+                logger.error(f"Circuit listener failed: {e}")
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "last_error": self.last_error,
+                "retry_in": round(max(0.0, self._retry_at - time.monotonic()), 1) if self.state != CLOSED else None,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_listeners: List[Callable[[CircuitBreaker, str, str], None]] = []
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Breaker for a host, created with the configured threshold and cooldown."""
+    breaker = _breakers.get(host)
+    if breaker is not None:
+        return breaker
+
+    config = get_config()
+    with _breakers_lock:
+        return _breakers.setdefault(host, CircuitBreaker(
+            host, config["breaker_failure_threshold"], config["breaker_cooldown"]
+        ))
+
+
+def add_state_listener(listener: Callable[[CircuitBreaker, str, str], None]) -> None:
+    """Register listener(breaker, old_state, new_state)."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def get_breaker_stats() -> Dict[str, Dict]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.host: breaker.get_stats() for breaker in breakers}
+
+
+def reset_breakers() -> None:
+    """Forget all breakers (they are recreated closed on next use)."""
+    with _breakers_lock:
+        _breakers.clear()
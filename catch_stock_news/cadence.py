@@ -0,0 +1,132 @@
+"""Adaptive polling cadence.
+
+With SCHEDULE_MODE=adaptive the news check interval is recomputed after
+every cycle from two signals:
+
+- The KRX trading session (local time, like the notification window):
+  pre-market, regular, after-hours, closed or weekend. The session sets the
+  longest interval allowed: CHECK_INTERVAL_MINUTES while the market is open
+  or about to open, three times that after hours and MAX_CHECK_INTERVAL_MINUTES
+  overnight and at weekends.
+- The arrival rate of new articles, as an exponentially weighted moving
+  average of new articles per minute. The interval is shortened so that a
+  cycle picks up about TARGET_ARTICLES_PER_CYCLE articles, down to
+  MIN_CHECK_INTERVAL_SECONDS during bursts.
+
+The rate is only measurable with incremental scraping, where every fetched
+article is new; otherwise the cadence follows the session alone.
+"""
+
+import threading
+from datetime import datetime, time
+from typing import Dict, Optional
+
+from catch_stock_news.config import Config, get_config
+
+# KRX session boundaries (start inclusive, end exclusive)
+PRE_MARKET = (time(8, 0), time(9, 0))
+REGULAR = (time(9, 0), time(15, 30))
+AFTER_HOURS = (time(15, 30), time(18, 0))
+
+# Longest interval per session, as a multiple of check_interval (None = max interval)
+SESSION_CEILING_FACTORS = {
+    "pre_market": 1,
+    "regular": 1,
+    "after_hours": 3,
+    "closed": None,
+    "weekend": None,
+}
+
+# New articles a cycle should pick up on average
+TARGET_ARTICLES_PER_CYCLE = 10
+
+# Weight of the newest observation in the arrival rate average
+RATE_SMOOTHING = 0.3
+
+
+def get_market_session(now: Optional[datetime] = None) -> str:
+    """KRX session at the given local time: pre_market, regular, after_hours, closed or weekend."""
+    now = now or datetime.now()
+
+    if now.weekday() >= 5:
+        return "weekend"
+
+    current = now.time()
+    for name, (start, end) in (("pre_market", PRE_MARKET), ("regular", REGULAR), ("after_hours", AFTER_HOURS)):
+        if start <= current < end:
+            return name
+    return "closed"
+
+
+def session_ceiling(session: str, config: Config) -> float:
+    """Longest interval in seconds allowed in a session."""
+    max_interval = max(config["max_check_interval"] * 60, config["check_interval"] * 60)
+    factor = SESSION_CEILING_FACTORS[session]
+    if factor is None:
+        return max_interval
+    return min(config["check_interval"] * 60 * factor, max_interval)
+
+
+class AdaptiveCadence:
+    """Tracks the article arrival rate and derives the next polling interval."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rate: Optional[float] = None  # New articles per minute (EWMA)
+        self._last_observed: Optional[datetime] = None
+
+    def observe(self, new_articles: Optional[int], now: Optional[datetime] = None) -> None:
+        """
+        Record the new articles found by a cycle.
+
+        None means the count is unknown (incremental scraping disabled); the
+        elapsed time still advances so the next rate sample is not inflated.
+        """
+        now = now or datetime.now()
+
+        with self._lock:
+            last, self._last_observed = self._last_observed, now
+            if new_articles is None or last is None:
+                return
+
+            minutes = (now - last).total_seconds() / 60
+            if minutes <= 0:
+                return
+
+            sample = new_articles / minutes
+            if self._rate is None:
+                self._rate = sample
+            else:
+                self._rate = RATE_SMOOTHING * sample + (1 - RATE_SMOOTHING) * self._rate
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Smoothed new articles per minute, or None before two observations."""
+        with self._lock:
+            return self._rate
+
+    def next_interval(self, now: Optional[datetime] = None, config: Optional[Config] = None) -> float:
+        """Interval in seconds until the next check."""
+        config = config or get_config()
+        ceiling = session_ceiling(get_market_session(now), config)
+        floor = min(config["min_check_interval"], ceiling)
+
+        rate = self.rate
+        if not rate:
+            return ceiling
+        return max(floor, min(ceiling, TARGET_ARTICLES_PER_CYCLE / rate * 60))
+
+    def get_stats(self, now: Optional[datetime] = None) -> Dict:
+        rate = self.rate
+        return {
+            "market_session": get_market_session(now),
+            "articles_per_minute": round(rate, 2) if rate is not None else None,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._rate = None
+            self._last_observed = None
+
+
+cadence = AdaptiveCadence()
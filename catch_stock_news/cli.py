@@ -0,0 +1,99 @@
+"""Command line keyword management.
+
+Usage:
+    python -m catch_stock_news.cli import watchlist.csv [--tag KOSPI]
+    python -m catch_stock_news.cli export [--format json] [--output keywords.csv]
+    python -m catch_stock_news.cli enable --tag KOSPI
+    python -m catch_stock_news.cli disable --pattern "*바이오*"
+    python -m catch_stock_news.cli vacuum
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from dotenv import load_dotenv
+
+from catch_stock_news.database import init_db, close_connections, set_keywords_enabled, vacuum_database
+from catch_stock_news.keyword_io import parse_csv, parse_json, import_keywords, export_csv, export_json
+
+
+def _import(args) -> int:
+    with open(args.file, encoding="utf-8-sig") as f:
+        text = f.read()
+
+    fmt = args.format or ("json" if args.file.lower().endswith(".json") else "csv")
+    rows = parse_json(text) if fmt == "json" else parse_csv(text)
+    summary = import_keywords(rows, default_tag=args.tag)
+
+    for result in summary["results"]:
+        if result["status"] == "invalid":
+            print(f"{result['row']}행: {result.get('error')} ({result['keyword']!r})", file=sys.stderr)
+
+    print(f"추가 {summary['added']}, 기존 {summary['exists']}, 중복 {summary['duplicate']}, 오류 {summary['invalid']}")
+    return 1 if summary["invalid"] else 0
+
+
+def _export(args) -> int:
+    chunks = export_json() if args.format == "json" else export_csv()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            f.writelines(chunks)
+    else:
+        sys.stdout.writelines(chunks)
+    return 0
+
+
+def _set_enabled(args) -> int:
+    if args.tag is None and args.pattern is None:
+        print("--tag 또는 --pattern을 지정해주세요.", file=sys.stderr)
+        return 2
+
+    updated = set_keywords_enabled(args.command == "enable", tag=args.tag, pattern=args.pattern)
+    print(f"{updated}개 키워드가 {'활성화' if args.command == 'enable' else '비활성화'}되었습니다.")
+    return 0
+
+
+def _vacuum(args) -> int:
+    vacuum_database()
+    print("데이터베이스 최적화가 완료되었습니다.")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m catch_stock_news.cli", description="키워드 일괄 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="CSV/JSON 파일에서 키워드 일괄 추가")
+    import_parser.add_argument("file")
+    import_parser.add_argument("--format", choices=["csv", "json"], help="기본값: 파일 확장자로 판단")
+    import_parser.add_argument("--tag", help="태그가 없는 행에 적용할 태그")
+    import_parser.set_defaults(handler=_import)
+
+    export_parser = subparsers.add_parser("export", help="키워드 내보내기")
+    export_parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    export_parser.add_argument("--output", help="기본값: 표준 출력")
+    export_parser.set_defaults(handler=_export)
+
+    for command, help_text in (("enable", "키워드 일괄 활성화"), ("disable", "키워드 일괄 비활성화")):
+        toggle_parser = subparsers.add_parser(command, help=help_text)
+        toggle_parser.add_argument("--tag")
+        toggle_parser.add_argument("--pattern", help='GLOB 패턴 (예: "*전자*")')
+        toggle_parser.set_defaults(handler=_set_enabled)
+
+    vacuum_parser = subparsers.add_parser("vacuum", help="DB 파일 재구성 (점진적 VACUUM 모드로 전환, 실행 중 잠금)")
+    vacuum_parser.set_defaults(handler=_vacuum)
+
+    args = parser.parse_args(argv)
+
+    init_db()
+    try:
+        return args.handler(args)
+    finally:
+        close_connections()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    sys.exit(main())
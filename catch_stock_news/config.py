@@ -1,16 +1,168 @@
-"""Configuration management from environment variables."""
+"""Configuration management from environment variables.
 
+The environment is parsed once into an immutable Config snapshot that
+get_config() returns from then on. reload_config() re-reads the
+environment, atomically swaps the snapshot and notifies listeners
+registered with add_reload_listener().
+"""
+
+import logging
 import os
+import threading
+from dataclasses import dataclass, fields
+from datetime import datetime, time
+from typing import Callable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_time(value: str) -> time:
+    return datetime.strptime(value, "%H:%M").time()
+
+
+@dataclass(frozen=True)
+class Config:
+    """Immutable configuration snapshot. Also supports config["key"] access."""
+
+    check_interval: int = 1
+    schedule_mode: str = "fixed"
+    min_check_interval: int = 30
+    max_check_interval: int = 30
+    notification_start: str = ""
+    notification_end: str = ""
+    enable_weekend: bool = False
+    allowed_sources: Tuple[str, ...] = ()
+    similarity_threshold: float = 0.8
+    similarity_window: int = 1000
+    news_feeds: Tuple[str, ...] = ("realtime",)
+    max_pages: int = 3
+    fetch_rate_limit: float = 5.0
+    breaker_failure_threshold: int = 5
+    breaker_cooldown: float = 60.0
+    fetch_workers: int = 4
+    parser_backend: str = "auto"
+    incremental_scraping: bool = False
+    notification_workers: int = 2
+    notification_queue_size: int = 1000
+    notification_max_attempts: int = 5
+    notification_batch_size: int = 10
+    notification_flush_seconds: float = 3.0
+    retention_interval: int = 60
+    sent_news_retention_days: int = 7
+    alert_retention_days: int = 0
+    alert_archive_dir: str = ""
+    # Notification window parsed from notification_start/end. None when no
+    # window is configured or the times are invalid (no time restriction).
+    notification_window: Optional[Tuple[time, time]] = None
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def keys(self) -> List[str]:
+        return [field.name for field in fields(self)]
+
+
+def load_config() -> Config:
+    """Build a Config from environment variables."""
+    notification_start = os.environ.get("NOTIFICATION_START_TIME", "")
+    notification_end = os.environ.get("NOTIFICATION_END_TIME", "")
+
+    notification_window = None
+    if notification_start and notification_end:
+        try:
+            notification_window = (_parse_time(notification_start), _parse_time(notification_end))
+        except ValueError as e:
+            logger.warning(f"Invalid time format in config: {e}")
+
+    return Config(
+        check_interval=int(os.environ.get("CHECK_INTERVAL_MINUTES", 1)),
+        schedule_mode=os.environ.get("SCHEDULE_MODE", "fixed").lower(),
+        min_check_interval=int(os.environ.get("MIN_CHECK_INTERVAL_SECONDS", 30)),
+        max_check_interval=int(os.environ.get("MAX_CHECK_INTERVAL_MINUTES", 30)),
+        notification_start=notification_start,
+        notification_end=notification_end,
+        enable_weekend=os.environ.get("ENABLE_WEEKEND_NOTIFICATIONS", "false").lower() == "true",
+        allowed_sources=tuple(s.strip() for s in os.environ.get("ALLOWED_NEWS_SOURCES", "").split(",") if s.strip()),
+        similarity_threshold=float(os.environ.get("TITLE_SIMILARITY_THRESHOLD", 0.8)),
+        similarity_window=int(os.environ.get("TITLE_SIMILARITY_WINDOW", 1000)),
+        news_feeds=tuple(s.strip() for s in os.environ.get("NEWS_FEEDS", "realtime").split(",") if s.strip()),
+        max_pages=int(os.environ.get("MAX_PAGES", 3)),
+        fetch_rate_limit=float(os.environ.get("FETCH_RATE_LIMIT", 5)),
+        breaker_failure_threshold=int(os.environ.get("BREAKER_FAILURE_THRESHOLD", 5)),
+        breaker_cooldown=float(os.environ.get("BREAKER_COOLDOWN_SECONDS", 60)),
+        fetch_workers=int(os.environ.get("FETCH_WORKERS", 4)),
+        parser_backend=os.environ.get("PARSER_BACKEND", "auto"),
+        incremental_scraping=os.environ.get("INCREMENTAL_SCRAPING", "false").lower() == "true",
+        notification_workers=int(os.environ.get("NOTIFICATION_WORKERS", 2)),
+        notification_queue_size=int(os.environ.get("NOTIFICATION_QUEUE_SIZE", 1000)),
+        notification_max_attempts=int(os.environ.get("NOTIFICATION_MAX_ATTEMPTS", 5)),
+        notification_batch_size=int(os.environ.get("NOTIFICATION_BATCH_SIZE", 10)),
+        notification_flush_seconds=float(os.environ.get("NOTIFICATION_FLUSH_SECONDS", 3)),
+        retention_interval=int(os.environ.get("RETENTION_INTERVAL_MINUTES", 60)),
+        sent_news_retention_days=int(os.environ.get("SENT_NEWS_RETENTION_DAYS", 7)),
+        alert_retention_days=int(os.environ.get("ALERT_RETENTION_DAYS", 0)),
+        alert_archive_dir=os.environ.get("ALERT_ARCHIVE_DIR", ""),
+        notification_window=notification_window,
+    )
+
+
+_config: Optional[Config] = None
+_config_lock = threading.Lock()
+_reload_listeners: List[Callable[[Config, Config], None]] = []
+
+
+def get_config() -> Config:
+    """Get the current configuration snapshot, loading it on first use."""
+    global _config
+
+    config = _config
+    if config is not None:
+        return config
+
+    with _config_lock:
+        if _config is None:
+            _config = load_config()
+        return _config
+
+
+def add_reload_listener(listener: Callable[[Config, Config], None]) -> None:
+    """Register listener(old, new) to be called after every reload."""
+    if listener not in _reload_listeners:
+        _reload_listeners.append(listener)
+
+
+def reload_config(reload_env_file: bool = False) -> Config:
+    """
+    Re-read the environment and swap in the new snapshot.
+
+    With reload_env_file, values from the .env file are re-applied to the
+    environment first, so edits made since startup take effect.
+
+    A configuration that fails to parse is rejected and the previous snapshot
+    stays active. Listeners run after the swap; a failing listener is logged
+    and does not prevent the others from running.
+    """
+    global _config
+
+    if reload_env_file:
+        load_dotenv(override=True)
+    new = load_config()
+
+    with _config_lock:
+        old = _config
+        _config = new
 
+    logger.info("Configuration reloaded")
+    if old is not None:
+        for listener in list(_reload_listeners):
+            try:
+                listener(old, new)
+            except Exception as e:
+                logger.error(f"Config reload listener failed: {e}")
 
-def get_config() -> dict:
-    """Get configuration from environment variables."""
-    return {
-        "check_interval": int(os.environ.get("CHECK_INTERVAL_MINUTES", 1)),
-        "notification_start": os.environ.get("NOTIFICATION_START_TIME", ""),
-        "notification_end": os.environ.get("NOTIFICATION_END_TIME", ""),
-        "enable_weekend": os.environ.get("ENABLE_WEEKEND_NOTIFICATIONS", "false").lower() == "true",
-        "allowed_sources": [s.strip() for s in os.environ.get("ALLOWED_NEWS_SOURCES", "").split(",") if s.strip()],
-        "similarity_threshold": float(os.environ.get("TITLE_SIMILARITY_THRESHOLD", 0.8)),
-        "max_pages": int(os.environ.get("MAX_PAGES", 3)),
-    }
+    return new
@@ -1,18 +1,160 @@
 """SQLite database management for keywords and sent news tracking."""
 
+import base64
+import binascii
+import json
+import logging
+import queue
 import sqlite3
-from datetime import datetime
-from typing import List, Optional
-from difflib import SequenceMatcher
+import threading
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from catch_stock_news.articles import url_article_key
+from catch_stock_news.models import MatchedNews
+from catch_stock_news.similarity import TitleSimilarityIndex
+
+logger = logging.getLogger(__name__)
 
 DATABASE_PATH = "news_alerts.db"
 
+# Connection tuning
+BUSY_TIMEOUT_MS = 5000
+CACHED_STATEMENTS = 256
+POOL_SIZE = 8
+
+# Maximum number of parameters bound in one IN (...) lookup
+SQL_CHUNK_SIZE = 500
+
+# Alert search ranks only this many of the newest matches by relevance
+SEARCH_RANK_WINDOW = 1000
+
+# Rows deleted per transaction by retention cleanup, to keep write locks short
+RETENTION_BATCH_SIZE = 500
+
+# Titles are compared against this many of the newest sent_news rows
+SIMILARITY_WINDOW = 1000
+
+# In-memory similarity index over the newest sent_news titles. sent_news is
+# the persisted source of truth: the index is loaded from it lazily and then
+# kept in sync by reading rows with an id above the last one indexed, evicting
+# the oldest beyond the window. It has its own connection, whose PRAGMA
+# data_version tells when another connection (or process) has committed, e.g.
+# retention or the CLI deleting rows; the index is then rebuilt if indexed
+# rows disappeared.
+_title_index: Optional[TitleSimilarityIndex] = None
+_title_index_ids: Deque[int] = deque()
+_title_index_path: Optional[str] = None
+_title_index_window = 0
+_title_index_max_id = 0
+_title_index_conn: Optional[sqlite3.Connection] = None
+_title_index_data_version: Optional[int] = None
+_title_index_lock = threading.Lock()
+
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection whose close() returns it to its pool for reuse."""
+
+    pool: Optional["ConnectionPool"] = None
+    idle = False
+
+    def close(self) -> None:
+        if self.pool is None:
+            super().close()
+            return
+
+        if self.idle:
+            return  # Already released
+        if self.in_transaction:
+            self.rollback()
+        self.pool.release(self)
+
+    def close_for_real(self) -> None:
+        self.pool = None
+        super().close()
+
+
+class ConnectionPool:
+    """
+    Small pool of tuned connections to one database file.
+
+    Connections use WAL journaling so readers (web requests) never block the
+    background writer, synchronous=NORMAL (durable in WAL mode up to the last
+    checkpoint), a busy timeout instead of immediate "database is locked"
+    errors, and a prepared statement cache.
+    """
+
+    def __init__(self, path: str, size: int = POOL_SIZE):
+        self.path = path
+        self._idle: "queue.LifoQueue[PooledConnection]" = queue.LifoQueue(maxsize=size)
+
+    def _open(self) -> PooledConnection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            factory=PooledConnection,
+            cached_statements=CACHED_STATEMENTS,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        # Only takes effect on a new database file, so it must precede WAL setup.
+        # Existing files keep their mode until converted with a full VACUUM.
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.pool = self
+        return conn
+
+    def acquire(self) -> PooledConnection:
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._open()
+        conn.idle = False
+        return conn
+
+    def release(self, conn: PooledConnection) -> None:
+        conn.idle = True
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close_for_real()
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close_for_real()
+            except queue.Empty:
+                return
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
 
 def get_connection() -> sqlite3.Connection:
-    """Get a database connection."""
-    conn = sqlite3.connect(DATABASE_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Get a database connection from the pool. close() hands it back."""
+    pool = _pools.get(DATABASE_PATH)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(DATABASE_PATH, ConnectionPool(DATABASE_PATH))
+    return pool.acquire()
+
+
+def close_connections() -> None:
+    """Close every pooled connection, e.g. at shutdown."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close_all()
+
+    with _title_index_lock:
+        _close_title_index()
 
 
 def init_db() -> None:
@@ -36,12 +178,42 @@ def init_db() -> None:
     except sqlite3.OperationalError:
         pass  # Column already exists
 
-    # Sent news table for duplicate prevention
+    # Add tag column if it doesn't exist (for migration)
+    try:
+        cursor.execute("ALTER TABLE keywords ADD COLUMN tag TEXT")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_keywords_tag ON keywords(tag)
+    """)
+
+    # Keyword version, bumped by triggers on every keyword change so caches
+    # in any process can tell when to reload
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS keyword_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    """)
+    cursor.execute("INSERT OR IGNORE INTO keyword_version (id, version) VALUES (1, 0)")
+
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS keywords_version_{event.lower()} AFTER {event} ON keywords
+            BEGIN
+                UPDATE keyword_version SET version = version + 1 WHERE id = 1;
+            END
+        """)
+
+    # Sent news table for duplicate prevention. Naver articles are identified
+    # by their integer article key (see articles.py), other news by URL.
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS sent_news (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             news_url TEXT NOT NULL,
             news_title TEXT,
+            article_key INTEGER,
             sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
@@ -52,9 +224,25 @@ def init_db() -> None:
     except sqlite3.OperationalError:
         pass  # Column already exists
 
-    # Create unique index on news_url to prevent duplicates
+    # Add article_key column if it doesn't exist (for migration)
+    try:
+        cursor.execute("ALTER TABLE sent_news ADD COLUMN article_key INTEGER")
+        _backfill_article_keys(cursor)
+        # The URL index used to cover every row; it is rebuilt below for keyless rows only
+        cursor.execute("DROP INDEX IF EXISTS idx_sent_news_url")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+
+    # Unique article keys: the main duplicate check
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_sent_news_article_key ON sent_news(article_key)
+        WHERE article_key IS NOT NULL
+    """)
+
+    # Unique URLs for news without an article key
     cursor.execute("""
         CREATE UNIQUE INDEX IF NOT EXISTS idx_sent_news_url ON sent_news(news_url)
+        WHERE article_key IS NULL
     """)
 
     # Create index for faster title search
@@ -62,6 +250,28 @@ def init_db() -> None:
         CREATE INDEX IF NOT EXISTS idx_sent_news_title ON sent_news(news_title)
     """)
 
+    # Index for retention cleanup by age
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sent_news_sent_at ON sent_news(sent_at)
+    """)
+
+    # Scrape checkpoints: newest article URLs seen per feed, for incremental
+    # scraping, with the keyword version they were matched against
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS scrape_checkpoints (
+            feed TEXT PRIMARY KEY,
+            last_seen_urls TEXT NOT NULL,
+            keyword_version INTEGER,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Add keyword_version column if it doesn't exist (for migration)
+    try:
+        cursor.execute("ALTER TABLE scrape_checkpoints ADD COLUMN keyword_version INTEGER")
+    except sqlite3.OperationalError:
+        pass  # Column already exists
+
     # Alerts table for storing matched news history
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS alerts (
@@ -81,17 +291,112 @@ def init_db() -> None:
     except sqlite3.OperationalError:
         pass  # Column already exists
 
+    # Index for newest-first keyset pagination of alert history
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_alerts_created_at ON alerts(created_at, id)
+    """)
+
+    # Alert <-> keyword links, so per-keyword queries use an index instead of
+    # scanning the comma-joined matched_keywords text
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'alert_keywords'")
+    backfill_alert_keywords = cursor.fetchone() is None
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS alert_keywords (
+            alert_id INTEGER NOT NULL REFERENCES alerts(id) ON DELETE CASCADE,
+            keyword_id INTEGER NOT NULL REFERENCES keywords(id) ON DELETE CASCADE,
+            PRIMARY KEY (alert_id, keyword_id)
+        ) WITHOUT ROWID
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_alert_keywords_keyword ON alert_keywords(keyword_id, alert_id)
+    """)
+
+    # Migration: link existing alerts to the keywords named in matched_keywords
+    if backfill_alert_keywords:
+        cursor.execute("""
+            INSERT OR IGNORE INTO alert_keywords (alert_id, keyword_id)
+            SELECT a.id, k.id FROM alerts a JOIN keywords k
+            ON instr(', ' || a.matched_keywords || ', ', ', ' || k.keyword || ', ') > 0
+        """)
+
+    _init_alerts_fts(cursor)
+
+    # Durable outbox of Slack notifications waiting to be delivered
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS notification_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL DEFAULT 0,
+            last_error TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_outbox_due ON notification_outbox(status, next_attempt_at)
+    """)
+
     conn.commit()
     conn.close()
 
 
-def add_keyword(keyword: str) -> bool:
+def _init_alerts_fts(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the alerts_fts full-text index over alert titles, kept in sync by triggers.
+
+    The trigram tokenizer indexes every 3-character sequence, which suits
+    Korean titles without word segmentation. If this SQLite build lacks FTS5
+    or the trigram tokenizer (SQLite < 3.34), search falls back to LIKE.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'alerts_fts'")
+    if cursor.fetchone() is not None:
+        return
+
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE alerts_fts USING fts5(
+                title, content='alerts', content_rowid='id', tokenize='trigram'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text search unavailable ({e}). Alert search will use LIKE.")
+        return
+
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS alerts_fts_insert AFTER INSERT ON alerts
+        BEGIN
+            INSERT INTO alerts_fts (rowid, title) VALUES (new.id, new.title);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS alerts_fts_delete AFTER DELETE ON alerts
+        BEGIN
+            INSERT INTO alerts_fts (alerts_fts, rowid, title) VALUES ('delete', old.id, old.title);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS alerts_fts_update AFTER UPDATE OF title ON alerts
+        BEGIN
+            INSERT INTO alerts_fts (alerts_fts, rowid, title) VALUES ('delete', old.id, old.title);
+            INSERT INTO alerts_fts (rowid, title) VALUES (new.id, new.title);
+        END
+    """)
+
+    # Index alerts stored before the table existed
+    cursor.execute("INSERT INTO alerts_fts (alerts_fts) VALUES ('rebuild')")
+
+
+def add_keyword(keyword: str, tag: Optional[str] = None) -> bool:
     """Add a new keyword. Returns True if successful, False if already exists."""
     conn = get_connection()
     cursor = conn.cursor()
 
     try:
-        cursor.execute("INSERT INTO keywords (keyword, enabled) VALUES (?, 1)", (keyword.strip(),))
+        cursor.execute("INSERT INTO keywords (keyword, enabled, tag) VALUES (?, 1, ?)", (keyword.strip(), tag))
         conn.commit()
         return True
     except sqlite3.IntegrityError:
@@ -139,9 +444,9 @@ def get_keywords(only_enabled: bool = False) -> List[dict]:
     cursor = conn.cursor()
 
     if only_enabled:
-        cursor.execute("SELECT id, keyword, enabled, created_at FROM keywords WHERE enabled = 1 ORDER BY created_at DESC")
+        cursor.execute("SELECT id, keyword, enabled, tag, created_at FROM keywords WHERE enabled = 1 ORDER BY created_at DESC")
     else:
-        cursor.execute("SELECT id, keyword, enabled, created_at FROM keywords ORDER BY created_at DESC")
+        cursor.execute("SELECT id, keyword, enabled, tag, created_at FROM keywords ORDER BY created_at DESC")
 
     keywords = [dict(row) for row in cursor.fetchall()]
     conn.close()
@@ -149,40 +454,407 @@ def get_keywords(only_enabled: bool = False) -> List[dict]:
     return keywords
 
 
+def add_keywords_bulk(entries: List[Dict]) -> Set[str]:
+    """
+    Insert many keywords in a single transaction, skipping existing ones.
+
+    Args:
+        entries: Dicts with keyword and optional tag and enabled. Keywords
+            must already be normalized and unique within entries.
+
+    Returns the set of keywords that were newly inserted.
+    """
+    if not entries:
+        return set()
+
+    conn = get_connection()
+    try:
+        with conn:
+            # Take the write lock up front so the existence check stays valid
+            conn.execute("BEGIN IMMEDIATE")
+
+            keywords = [entry["keyword"] for entry in entries]
+            existing = set()
+            for start in range(0, len(keywords), SQL_CHUNK_SIZE):
+                chunk = keywords[start:start + SQL_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(f"SELECT keyword FROM keywords WHERE keyword IN ({placeholders})", chunk)
+                existing.update(row["keyword"] for row in cursor.fetchall())
+
+            conn.executemany(
+                "INSERT OR IGNORE INTO keywords (keyword, enabled, tag) VALUES (?, ?, ?)",
+                [
+                    (entry["keyword"], 1 if entry.get("enabled", True) else 0, entry.get("tag"))
+                    for entry in entries
+                ]
+            )
+    finally:
+        conn.close()
+
+    return set(keywords) - existing
+
+
+def iter_keywords(batch_size: int = 500) -> Iterator[dict]:
+    """Yield all keywords ordered by id, reading batch_size rows at a time."""
+    conn = get_connection()
+    try:
+        cursor = conn.execute("SELECT id, keyword, enabled, tag, created_at FROM keywords ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+    finally:
+        conn.close()
+
+
+def set_keywords_enabled(enabled: bool, tag: Optional[str] = None, pattern: Optional[str] = None) -> int:
+    """
+    Enable or disable every keyword with the given tag and/or matching a GLOB
+    pattern (e.g. "*전자*"). At least one filter is required.
+
+    Returns the number of keywords updated.
+    """
+    if tag is None and pattern is None:
+        raise ValueError("tag or pattern is required")
+
+    conditions = []
+    params: List = [1 if enabled else 0]
+    if tag is not None:
+        conditions.append("tag = ?")
+        params.append(tag)
+    if pattern is not None:
+        conditions.append("keyword GLOB ?")
+        params.append(pattern)
+
+    conn = get_connection()
+    cursor = conn.execute(
+        f"UPDATE keywords SET enabled = ? WHERE {' AND '.join(conditions)} AND enabled != ?",
+        params + [1 if enabled else 0]
+    )
+    updated = cursor.rowcount
+    conn.commit()
+    conn.close()
+
+    return updated
+
+
+def get_keyword_version() -> int:
+    """Get the keyword version, which changes whenever keywords are modified."""
+    conn = get_connection()
+    row = conn.execute("SELECT version FROM keyword_version WHERE id = 1").fetchone()
+    conn.close()
+
+    return row["version"]
+
+
+def _backfill_article_keys(cursor: sqlite3.Cursor) -> None:
+    """Fill article_key for existing sent_news rows. Later rows for an already keyed article stay keyless."""
+    keys = {}
+    cursor.execute("SELECT id, news_url FROM sent_news ORDER BY id")
+    for row in cursor.fetchall():
+        key = url_article_key(row["news_url"])
+        if key and key not in keys:
+            keys[key] = row["id"]
+    cursor.executemany("UPDATE sent_news SET article_key = ? WHERE id = ?", keys.items())
+
+
 def is_news_sent(news_url: str) -> bool:
-    """Check if a news URL has already been sent."""
+    """Check if a news URL (or another URL of the same article) has already been sent."""
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT id FROM sent_news WHERE news_url = ?", (news_url,))
+    key = url_article_key(news_url)
+    if key:
+        cursor.execute("SELECT id FROM sent_news WHERE article_key = ?", (key,))
+    else:
+        cursor.execute("SELECT id FROM sent_news WHERE news_url = ? AND article_key IS NULL", (news_url,))
     exists = cursor.fetchone() is not None
     conn.close()
 
     return exists
 
 
-def is_similar_news_sent(news_title: str, threshold: float = 0.8) -> bool:
-    """Check if a similar news title has already been sent."""
+def _close_title_index() -> None:
+    """Drop the title index and its connection. Caller holds _title_index_lock."""
+    global _title_index, _title_index_conn, _title_index_path, _title_index_data_version
+
+    if _title_index_conn is not None:
+        _title_index_conn.close()
+    _title_index = None
+    _title_index_conn = None
+    _title_index_path = None
+    _title_index_data_version = None
+
+
+def _refresh_title_index(window: int = SIMILARITY_WINDOW) -> TitleSimilarityIndex:
+    """Bring the title index up to date with the newest window sent_news rows. Caller holds _title_index_lock."""
+    global _title_index, _title_index_path, _title_index_window, _title_index_max_id
+    global _title_index_conn, _title_index_data_version
+
+    window = max(1, window)
+    if _title_index_conn is None or _title_index_path != DATABASE_PATH:
+        _close_title_index()
+        _title_index_conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False)
+        _title_index_path = DATABASE_PATH
+    conn = _title_index_conn
+
+    data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+    if _title_index is not None and _title_index_window == window:
+        if data_version == _title_index_data_version:
+            return _title_index
+        if _title_index_ids:
+            # Rows in the indexed id range are only ever deleted; new rows get higher ids
+            remaining = conn.execute("""
+                SELECT COUNT(*) FROM sent_news
+                WHERE id BETWEEN ? AND ? AND news_title IS NOT NULL AND news_title != ''
+            """, (_title_index_ids[0], _title_index_max_id)).fetchone()[0]
+            if remaining != len(_title_index_ids):
+                _title_index = None
+
+    if _title_index is None or _title_index_window != window:
+        _title_index = TitleSimilarityIndex()
+        _title_index_ids.clear()
+        _title_index_window = window
+        rows = conn.execute("""
+            SELECT id, news_title FROM sent_news
+            WHERE news_title IS NOT NULL AND news_title != ''
+            ORDER BY id DESC
+            LIMIT ?
+        """, (window,)).fetchall()
+        rows.reverse()
+        _title_index_max_id = rows[-1][0] if rows else 0
+    else:
+        rows = conn.execute("""
+            SELECT id, news_title FROM sent_news
+            WHERE id > ? AND news_title IS NOT NULL AND news_title != ''
+            ORDER BY id
+        """, (_title_index_max_id,)).fetchall()
+
+    for news_id, news_title in rows:
+        _title_index.add(news_title, key=news_id)
+        _title_index_ids.append(news_id)
+        _title_index_max_id = news_id
+    while len(_title_index_ids) > window:
+        _title_index.remove(_title_index_ids.popleft())
+
+    _title_index_data_version = data_version
+    return _title_index
+
+
+def is_similar_news_sent(news_title: str, threshold: float = 0.8, window: int = SIMILARITY_WINDOW) -> bool:
+    """Check if a similar news title has already been sent.
+
+    Uses the in-memory similarity index over the titles of the newest window
+    sent_news rows, which only verifies plausible candidates with the exact
+    SequenceMatcher ratio.
+    """
+    with _title_index_lock:
+        return _refresh_title_index(window).is_similar(news_title, threshold)
+
+
+def get_sent_article_keys(article_keys: List[int]) -> Set[int]:
+    """Return the subset of article_keys that have already been sent, in one lookup."""
+    return set(_select_in("SELECT article_key FROM sent_news WHERE article_key IN ({})", article_keys))
+
+
+def get_sent_urls(news_urls: List[str]) -> Set[str]:
+    """
+    Return the subset of news_urls that have already been sent, in one lookup.
+
+    Naver article URLs are looked up by article key, so a URL counts as sent
+    if any URL of the same article was.
+    """
+    keys = {url: url_article_key(url) for url in news_urls}
+    sent_keys = get_sent_article_keys([key for key in keys.values() if key])
+    sent_urls = set(_select_in(
+        "SELECT news_url FROM sent_news WHERE article_key IS NULL AND news_url IN ({})",
+        [url for url, key in keys.items() if not key]
+    ))
+    return {url for url, key in keys.items() if (key in sent_keys if key else url in sent_urls)}
+
+
+def _select_in(query: str, values: List) -> List:
+    """Run a single-column query with an IN ({}) placeholder list, chunked under SQLite's parameter limit."""
+    if not values:
+        return []
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    results = []
+    for start in range(0, len(values), SQL_CHUNK_SIZE):
+        chunk = values[start:start + SQL_CHUNK_SIZE]
+        cursor.execute(query.format(", ".join("?" for _ in chunk)), chunk)
+        results.extend(row[0] for row in cursor.fetchall())
+    conn.close()
+
+    return results
+
+
+def are_similar_news_sent(news_titles: List[str], threshold: float = 0.8,
+                          window: int = SIMILARITY_WINDOW) -> List[bool]:
+    """
+    Check a batch of titles for similar already-sent titles.
+
+    Titles are checked in order against one snapshot of the newest window
+    sent_news titles, and every title not flagged counts as sent for the
+    titles after it, as if the batch had been processed one item at a time.
+    """
+    batch_index = TitleSimilarityIndex()
+    flags = []
+
+    with _title_index_lock:
+        index = _refresh_title_index(window)
+        for title in news_titles:
+            similar = index.is_similar(title, threshold) or batch_index.is_similar(title, threshold)
+            if not similar:
+                batch_index.add(title)
+            flags.append(similar)
+
+    return flags
+
+
+def save_alerts_and_mark_sent(news_list: List[MatchedNews], queue_notifications: bool = False) -> List[int]:
+    """
+    Save alerts and mark their URLs as sent for a batch of news, in one transaction.
+
+    If queue_notifications is True, a Slack notification for every item is
+    added to the outbox in the same transaction. Returns the outbox IDs.
+    """
+    if not news_list:
+        return []
+
+    outbox_ids = []
+    conn = get_connection()
+    try:
+        with conn:
+            links = []
+            for news in news_list:
+                cursor = conn.execute(
+                    "INSERT INTO alerts (title, url, matched_keywords, news_time, news_source) VALUES (?, ?, ?, ?, ?)",
+                    (news.title, news.url, ", ".join(news.matched_keywords), news.time, news.source)
+                )
+                links.extend((cursor.lastrowid, keyword) for keyword in news.matched_keywords)
+            _link_alert_keywords(conn, links)
+
+            conn.executemany(
+                "INSERT OR IGNORE INTO sent_news (news_url, news_title, article_key) VALUES (?, ?, ?)",
+                [(news.url, news.title, news.item.article_key or None) for news in news_list]
+            )
+            if queue_notifications:
+                for news in news_list:
+                    cursor = conn.execute(
+                        "INSERT INTO notification_outbox (payload) VALUES (?)",
+                        (json.dumps(news.to_dict(), ensure_ascii=False),)
+                    )
+                    outbox_ids.append(cursor.lastrowid)
+    finally:
+        conn.close()
+
+    return outbox_ids
+
+
+def _link_alert_keywords(conn: sqlite3.Connection, links: List[Tuple[int, str]]) -> None:
+    """Insert alert_keywords rows for (alert_id, keyword) pairs. Unknown keywords are skipped."""
+    conn.executemany(
+        "INSERT OR IGNORE INTO alert_keywords (alert_id, keyword_id) SELECT ?, id FROM keywords WHERE keyword = ?",
+        links
+    )
+
+
+def get_due_notifications(now: float, limit: int = 100) -> List[dict]:
+    """Get pending outbox notifications whose next attempt is due, oldest first."""
     conn = get_connection()
     cursor = conn.cursor()
 
-    # Get recent titles (last 24 hours worth, approximately 1000 items)
     cursor.execute("""
-        SELECT news_title FROM sent_news
-        WHERE news_title IS NOT NULL
-        ORDER BY sent_at DESC
-        LIMIT 1000
-    """)
-    rows = cursor.fetchall()
+        SELECT id, payload, attempts FROM notification_outbox
+        WHERE status = 'pending' AND next_attempt_at <= ?
+        ORDER BY id
+        LIMIT ?
+    """, (now, limit))
+    rows = [
+        {"id": row["id"], "news_info": json.loads(row["payload"]), "attempts": row["attempts"]}
+        for row in cursor.fetchall()
+    ]
+    conn.close()
+
+    return rows
+
+
+def claim_notifications(notification_ids: List[int]) -> List[int]:
+    """
+    Mark pending notifications as being sent. Returns the IDs claimed.
+
+    A row is claimed only if it is still pending, so a notification that was
+    delivered (and deleted) or taken by another worker since it was read from
+    the outbox is not sent twice.
+    """
+    conn = get_connection()
+    claimed = []
+    try:
+        with conn:
+            for notification_id in notification_ids:
+                cursor = conn.execute(
+                    "UPDATE notification_outbox SET status = 'sending' WHERE id = ? AND status = 'pending'",
+                    (notification_id,)
+                )
+                if cursor.rowcount == 1:
+                    claimed.append(notification_id)
+    finally:
+        conn.close()
+
+    return claimed
+
+
+def release_notifications(notification_ids: Optional[List[int]] = None) -> int:
+    """Return claimed notifications (all of them if no IDs are given) to pending. Returns the count."""
+    conn = get_connection()
+    if notification_ids is None:
+        cursor = conn.execute("UPDATE notification_outbox SET status = 'pending' WHERE status = 'sending'")
+    else:
+        cursor = conn.executemany(
+            "UPDATE notification_outbox SET status = 'pending' WHERE id = ? AND status = 'sending'",
+            [(notification_id,) for notification_id in notification_ids]
+        )
+    released = cursor.rowcount
+    conn.commit()
     conn.close()
 
-    for row in rows:
-        if row["news_title"]:
-            similarity = SequenceMatcher(None, news_title, row["news_title"]).ratio()
-            if similarity >= threshold:
-                return True
+    return released
 
-    return False
+
+def delete_notification(notification_id: int) -> None:
+    """Remove a delivered (or dropped) notification from the outbox."""
+    conn = get_connection()
+    conn.execute("DELETE FROM notification_outbox WHERE id = ?", (notification_id,))
+    conn.commit()
+    conn.close()
+
+
+def reschedule_notification(notification_id: int, attempts: int, next_attempt_at: float, error: str) -> None:
+    """Record a failed delivery attempt and when to try again."""
+    conn = get_connection()
+    conn.execute(
+        "UPDATE notification_outbox SET status = 'pending', attempts = ?, next_attempt_at = ?, last_error = ? "
+        "WHERE id = ?",
+        (attempts, next_attempt_at, error, notification_id)
+    )
+    conn.commit()
+    conn.close()
+
+
+def fail_notification(notification_id: int, attempts: int, error: str) -> None:
+    """Give up on a notification. It stays in the outbox with status 'failed'."""
+    conn = get_connection()
+    conn.execute(
+        "UPDATE notification_outbox SET status = 'failed', attempts = ?, last_error = ? WHERE id = ?",
+        (attempts, error, notification_id)
+    )
+    conn.commit()
+    conn.close()
 
 
 def mark_news_sent(news_url: str, news_title: str = None) -> None:
@@ -192,8 +864,8 @@ def mark_news_sent(news_url: str, news_title: str = None) -> None:
 
     try:
         cursor.execute(
-            "INSERT INTO sent_news (news_url, news_title) VALUES (?, ?)",
-            (news_url, news_title)
+            "INSERT INTO sent_news (news_url, news_title, article_key) VALUES (?, ?, ?)",
+            (news_url, news_title, url_article_key(news_url) or None)
         )
         conn.commit()
     except sqlite3.IntegrityError:
@@ -202,23 +874,118 @@ def mark_news_sent(news_url: str, news_title: str = None) -> None:
         conn.close()
 
 
-def cleanup_old_sent_news(days: int = 7) -> int:
-    """Remove sent news records older than specified days. Returns count of deleted records."""
+def cleanup_old_sent_news(days: int = 7, batch_size: int = RETENTION_BATCH_SIZE) -> int:
+    """
+    Remove sent news records older than specified days. Returns count of deleted records.
+
+    Rows are deleted oldest first in transactions of at most batch_size rows,
+    so the write lock is released between batches.
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("""
-        DELETE FROM sent_news
-        WHERE sent_at < datetime('now', ? || ' days')
-    """, (f"-{days}",))
+    cursor.execute("SELECT datetime('now', ? || ' days')", (f"-{days}",))
+    cutoff = cursor.fetchone()[0]
+
+    deleted = 0
+    while True:
+        cursor.execute("""
+            SELECT id FROM sent_news
+            WHERE sent_at < ?
+            ORDER BY sent_at
+            LIMIT ?
+        """, (cutoff, batch_size))
+        ids = [row["id"] for row in cursor.fetchall()]
+        if not ids:
+            break
+
+        placeholders = ",".join("?" * len(ids))
+        cursor.execute(f"DELETE FROM sent_news WHERE id IN ({placeholders})", ids)
+        conn.commit()
+        deleted += len(ids)
 
-    deleted = cursor.rowcount
-    conn.commit()
     conn.close()
 
     return deleted
 
 
+def get_scrape_checkpoint(feed: str = "realtime") -> List[str]:
+    """Get the newest article URLs seen by the previous run of a feed (newest first)."""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT last_seen_urls FROM scrape_checkpoints WHERE feed = ?", (feed,))
+    row = cursor.fetchone()
+    conn.close()
+
+    if not row or not row["last_seen_urls"]:
+        return []
+
+    return row["last_seen_urls"].split("\n")
+
+
+def save_scrape_checkpoint(urls: List[str], feed: str = "realtime") -> None:
+    """Save the newest article URLs seen by a feed (newest first)."""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        INSERT INTO scrape_checkpoints (feed, last_seen_urls, updated_at)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(feed) DO UPDATE SET
+            last_seen_urls = excluded.last_seen_urls,
+            updated_at = excluded.updated_at
+    """, (feed, "\n".join(urls)))
+    conn.commit()
+    conn.close()
+
+
+def get_scrape_checkpoints(feeds: List[str], keyword_version: Optional[int] = None) -> Dict[str, List[str]]:
+    """
+    Get the checkpoints of several feeds at once. Feeds without one map to [].
+
+    If keyword_version is given, checkpoints saved under another keyword
+    version also map to []: articles behind them were never matched against
+    the current keywords, so the feed is scanned in full once.
+    """
+    checkpoints = {feed: [] for feed in feeds}
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    for start in range(0, len(feeds), SQL_CHUNK_SIZE):
+        chunk = feeds[start:start + SQL_CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(
+            f"SELECT feed, last_seen_urls, keyword_version FROM scrape_checkpoints WHERE feed IN ({placeholders})",
+            chunk
+        )
+        for row in cursor.fetchall():
+            if keyword_version is not None and row["keyword_version"] != keyword_version:
+                continue
+            checkpoints[row["feed"]] = row["last_seen_urls"].split("\n") if row["last_seen_urls"] else []
+    conn.close()
+
+    return checkpoints
+
+
+def save_scrape_checkpoints(checkpoints: Dict[str, List[str]], keyword_version: Optional[int] = None) -> None:
+    """Save the checkpoints of several feeds in one transaction, with the keyword version they were matched against."""
+    if not checkpoints:
+        return
+
+    conn = get_connection()
+    conn.executemany("""
+        INSERT INTO scrape_checkpoints (feed, last_seen_urls, keyword_version, updated_at)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(feed) DO UPDATE SET
+            last_seen_urls = excluded.last_seen_urls,
+            keyword_version = excluded.keyword_version,
+            updated_at = excluded.updated_at
+    """, [(feed, "\n".join(urls), keyword_version) for feed, urls in checkpoints.items()])
+    conn.commit()
+    conn.close()
+
+
 def save_alert(title: str, url: str, matched_keywords: List[str], news_time: str, news_source: str = None) -> int:
     """Save a matched news alert. Returns the alert ID."""
     conn = get_connection()
@@ -230,6 +997,7 @@ def save_alert(title: str, url: str, matched_keywords: List[str], news_time: str
         (title, url, keywords_str, news_time, news_source)
     )
     alert_id = cursor.lastrowid
+    _link_alert_keywords(conn, [(alert_id, keyword) for keyword in matched_keywords])
     conn.commit()
     conn.close()
 
@@ -242,7 +1010,8 @@ def get_alerts(limit: int = 50) -> List[dict]:
     cursor = conn.cursor()
 
     cursor.execute(
-        "SELECT id, title, url, matched_keywords, news_time, news_source, created_at FROM alerts ORDER BY created_at DESC LIMIT ?",
+        "SELECT id, title, url, matched_keywords, news_time, news_source, created_at FROM alerts "
+        "ORDER BY created_at DESC, id DESC LIMIT ?",
         (limit,)
     )
     alerts = [dict(row) for row in cursor.fetchall()]
@@ -251,6 +1020,234 @@ def get_alerts(limit: int = 50) -> List[dict]:
     return alerts
 
 
+def encode_alert_cursor(created_at: str, alert_id: int) -> str:
+    """Encode the position after an alert as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(f"{created_at}|{alert_id}".encode("utf-8")).decode("ascii")
+
+
+def decode_alert_cursor(cursor: str) -> Tuple[str, int]:
+    """Decode a pagination cursor. Raises ValueError if it is malformed."""
+    try:
+        created_at, alert_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").rsplit("|", 1)
+        return created_at, int(alert_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def _date_bound(value: str, upper: bool) -> str:
+    """
+    Turn a date or timestamp into a created_at bound. Upper bounds given as a
+    date include the whole day. Raises ValueError for other formats.
+    """
+    if len(value) == 10:
+        bound = datetime.strptime(value, "%Y-%m-%d")
+        if upper:
+            bound += timedelta(days=1)
+    else:
+        bound = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+    return bound.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def get_alerts_page(limit: int = 50, cursor: Optional[str] = None, keyword: Optional[str] = None,
+                    source: Optional[str] = None, since: Optional[str] = None,
+                    until: Optional[str] = None) -> Dict:
+    """
+    Get one page of alerts, newest first, using keyset pagination.
+
+    Args:
+        limit: Page size
+        cursor: next_cursor from the previous page, or None for the first page
+        keyword: Only alerts that matched this keyword
+        source: Only alerts from this news source
+        since: Only alerts created at or after this date/timestamp (YYYY-MM-DD[ HH:MM:SS], UTC)
+        until: Only alerts created before the end of this date, or before this timestamp
+
+    Returns a dict with "alerts" and "next_cursor" (None on the last page).
+    Raises ValueError for a malformed cursor or date.
+    """
+    conditions = []
+    params: List = []
+
+    if cursor:
+        conditions.append("(created_at, id) < (?, ?)")
+        params.extend(decode_alert_cursor(cursor))
+    if source:
+        conditions.append("news_source = ?")
+        params.append(source)
+    if since:
+        conditions.append("created_at >= ?")
+        params.append(_date_bound(since, upper=False))
+    if until:
+        conditions.append("created_at < ?")
+        params.append(_date_bound(until, upper=True))
+
+    conn = get_connection()
+    try:
+        if keyword:
+            row = conn.execute("SELECT id FROM keywords WHERE keyword = ?", (keyword,)).fetchone()
+            if row:
+                conditions.append("id IN (SELECT alert_id FROM alert_keywords WHERE keyword_id = ?)")
+                params.append(row["id"])
+            else:
+                # Keyword no longer registered: match the stored keyword list
+                conditions.append("instr(', ' || matched_keywords || ', ', ?) > 0")
+                params.append(f", {keyword}, ")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        result = conn.execute(
+            f"SELECT id, title, url, matched_keywords, news_time, news_source, created_at FROM alerts {where} "
+            f"ORDER BY created_at DESC, id DESC LIMIT ?",
+            params + [limit + 1]
+        )
+        alerts = [dict(row) for row in result.fetchall()]
+    finally:
+        conn.close()
+
+    next_cursor = None
+    if len(alerts) > limit:
+        alerts = alerts[:limit]
+        next_cursor = encode_alert_cursor(alerts[-1]["created_at"], alerts[-1]["id"])
+
+    return {"alerts": alerts, "next_cursor": next_cursor}
+
+
+def _fts_available(conn: sqlite3.Connection) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'alerts_fts'"
+    ).fetchone() is not None
+
+
+def _like_pattern(term: str) -> str:
+    """LIKE pattern matching term as a substring (used with ESCAPE '\\')."""
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def search_alerts(query: str, limit: int = 20, offset: int = 0) -> Dict:
+    """
+    Search alert titles.
+
+    Every whitespace-separated term must appear in the title (substring
+    match). Terms of 3+ characters are looked up in the trigram index;
+    shorter terms, which trigrams cannot index, filter the indexed results.
+    The newest SEARCH_RANK_WINDOW matches come first, ordered by bm25
+    relevance, followed by any older matches, newest first. This bounds the
+    ranking cost for very common terms. A query made only of short terms
+    scans titles with LIKE, newest first.
+
+    Returns a dict with "alerts" and "next_offset" (None on the last page).
+    """
+    terms = []
+    for term in query.split():
+        if term not in terms:
+            terms.append(term)
+    if not terms:
+        return {"alerts": [], "next_offset": None}
+
+    long_terms = [term for term in terms if len(term) >= 3]
+    short_terms = [term for term in terms if len(term) < 3]
+    columns = "a.id, a.title, a.url, a.matched_keywords, a.news_time, a.news_source, a.created_at"
+
+    conn = get_connection()
+    try:
+        if long_terms and _fts_available(conn):
+            match = " AND ".join('"' + term.replace('"', '""') + '"' for term in long_terms)
+            where = " AND ".join(["alerts_fts MATCH ?"] + ["title LIKE ? ESCAPE '\\'"] * len(short_terms))
+            params = [match] + [_like_pattern(term) for term in short_terms]
+
+            # Oldest rowid within the ranking window. FTS5 walks the doclist
+            # newest first and stops after SEARCH_RANK_WINDOW hits.
+            row = conn.execute(
+                f"SELECT min(rowid), count(*) FROM ("
+                f"SELECT rowid FROM alerts_fts WHERE {where} ORDER BY rowid DESC LIMIT ?)",
+                params + [SEARCH_RANK_WINDOW]
+            ).fetchone()
+            window_start, window_size = row[0], row[1]
+
+            alerts = []
+            if offset < window_size:
+                cursor = conn.execute(
+                    f"SELECT {columns}, hits.rank AS score FROM ("
+                    f"SELECT rowid, rank FROM alerts_fts WHERE {where} AND rowid >= ? "
+                    f"ORDER BY rank LIMIT ? OFFSET ?"
+                    f") hits JOIN alerts a ON a.id = hits.rowid ORDER BY hits.rank",
+                    params + [window_start, limit + 1, offset]
+                )
+                alerts = [dict(row) for row in cursor.fetchall()]
+
+            if window_size == SEARCH_RANK_WINDOW and len(alerts) <= limit:
+                cursor = conn.execute(
+                    f"SELECT {columns}, NULL AS score FROM ("
+                    f"SELECT rowid FROM alerts_fts WHERE {where} AND rowid < ? "
+                    f"ORDER BY rowid DESC LIMIT ? OFFSET ?"
+                    f") hits JOIN alerts a ON a.id = hits.rowid ORDER BY a.id DESC",
+                    params + [window_start, limit + 1 - len(alerts), max(0, offset - window_size)]
+                )
+                alerts.extend(dict(row) for row in cursor.fetchall())
+        else:
+            where = " AND ".join(["a.title LIKE ? ESCAPE '\\'"] * len(terms))
+            cursor = conn.execute(
+                f"SELECT {columns}, NULL AS score FROM alerts a WHERE {where} "
+                f"ORDER BY a.id DESC LIMIT ? OFFSET ?",
+                [_like_pattern(term) for term in terms] + [limit + 1, offset]
+            )
+            alerts = [dict(row) for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+    next_offset = None
+    if len(alerts) > limit:
+        alerts = alerts[:limit]
+        next_offset = offset + limit
+
+    return {"alerts": alerts, "next_offset": next_offset}
+
+
+def get_keyword_stats() -> List[dict]:
+    """
+    Get alert hit counts per keyword, with the time of the latest hit.
+
+    Counts come from the alert_keywords index, without touching alert rows
+    except for one lookup per keyword's latest alert.
+    """
+    conn = get_connection()
+    cursor = conn.execute("""
+        SELECT s.id, s.keyword, s.enabled, s.tag, s.hits, a.created_at AS last_hit_at
+        FROM (
+            SELECT k.id, k.keyword, k.enabled, k.tag,
+                   COUNT(ak.alert_id) AS hits, MAX(ak.alert_id) AS last_alert_id
+            FROM keywords k
+            LEFT JOIN alert_keywords ak ON ak.keyword_id = k.id
+            GROUP BY k.id
+        ) s
+        LEFT JOIN alerts a ON a.id = s.last_alert_id
+        ORDER BY s.hits DESC, s.keyword
+    """)
+    stats = [dict(row) for row in cursor.fetchall()]
+    conn.close()
+
+    return stats
+
+
+def get_keyword_alerts(keyword_id: int, limit: int = 20, before_id: Optional[int] = None) -> List[dict]:
+    """Get the most recent alerts for a keyword, optionally those older than before_id."""
+    conn = get_connection()
+    cursor = conn.execute(
+        """
+        SELECT a.id, a.title, a.url, a.matched_keywords, a.news_time, a.news_source, a.created_at
+        FROM alert_keywords ak
+        JOIN alerts a ON a.id = ak.alert_id
+        WHERE ak.keyword_id = ? AND ak.alert_id < ?
+        ORDER BY ak.alert_id DESC
+        LIMIT ?
+        """,
+        (keyword_id, before_id if before_id is not None else 2 ** 63 - 1, limit)
+    )
+    alerts = [dict(row) for row in cursor.fetchall()]
+    conn.close()
+
+    return alerts
+
+
 def delete_alert(alert_id: int) -> bool:
     """Delete an alert by ID."""
     conn = get_connection()
@@ -264,6 +1261,80 @@ def delete_alert(alert_id: int) -> bool:
     return deleted
 
 
+def get_alerts_before(cutoff: str, limit: int = RETENTION_BATCH_SIZE) -> List[dict]:
+    """Get up to limit alerts created before cutoff ("YYYY-MM-DD HH:MM:SS"), oldest first."""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT id, title, url, matched_keywords, news_time, news_source, created_at
+        FROM alerts
+        WHERE created_at < ?
+        ORDER BY created_at, id
+        LIMIT ?
+    """, (cutoff, limit))
+    alerts = [dict(row) for row in cursor.fetchall()]
+    conn.close()
+
+    return alerts
+
+
+def delete_alerts(alert_ids: List[int]) -> int:
+    """Delete alerts by ID in one transaction. Keyword links and the search index follow."""
+    if not alert_ids:
+        return 0
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    deleted = 0
+    for start in range(0, len(alert_ids), SQL_CHUNK_SIZE):
+        chunk = alert_ids[start:start + SQL_CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        cursor.execute(f"DELETE FROM alerts WHERE id IN ({placeholders})", chunk)
+        deleted += cursor.rowcount
+    conn.commit()
+    conn.close()
+
+    return deleted
+
+
+def compact_database() -> Dict:
+    """
+    Return free pages to the file system and refresh query planner statistics.
+
+    Free pages are only reclaimed incrementally when the database uses
+    auto_vacuum=INCREMENTAL (every database created by this version does);
+    older files report their free pages but are left as they are.
+    """
+    conn = get_connection()
+
+    auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    if auto_vacuum == 2 and free_pages:
+        # executescript steps the pragma to completion; execute() would only
+        # free the first page because incremental_vacuum returns no rows
+        conn.executescript("PRAGMA incremental_vacuum;")
+    conn.execute("PRAGMA optimize")
+    remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    conn.close()
+
+    return {"incremental": auto_vacuum == 2, "freed_pages": free_pages - remaining, "free_pages": remaining}
+
+
+def vacuum_database() -> None:
+    """
+    Rebuild the database file with a full VACUUM, switching it to incremental auto_vacuum.
+
+    Locks the database for the whole rebuild; meant to be run offline once to
+    convert files created before incremental vacuum was enabled.
+    """
+    conn = get_connection()
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("VACUUM")
+    conn.close()
+
+
 def clear_all_alerts() -> int:
     """Clear all alerts. Returns count of deleted records."""
     conn = get_connection()
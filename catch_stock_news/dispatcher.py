@@ -0,0 +1,307 @@
+"""Asynchronous Slack notification dispatcher.
+
+Notifications are written to the ``notification_outbox`` table in the same
+transaction that saves the alert, then handed to an in-process queue.
+Worker threads deliver them over a shared keep-alive session and delete the
+outbox rows once Slack accepts the message. A worker first claims each row
+(pending -> sending) in the database and skips rows it cannot claim, so a
+stale sweep that re-queues an already delivered notification does not post
+it twice. Notifications that arrive
+within the flush window are coalesced into a single digest message.
+Failed deliveries are retried with exponential backoff; a 429 response
+pauses all workers for the ``Retry-After`` period. A sweeper thread
+periodically reloads due rows from the outbox, so messages that were queued
+before a restart, or that did not fit in the queue, are still delivered.
+"""
+
+import logging
+import queue
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from catch_stock_news.config import get_config
+from catch_stock_news.database import (
+    get_due_notifications, claim_notifications, release_notifications,
+    delete_notification, reschedule_notification, fail_notification
+)
+from catch_stock_news.metrics import STAGE_DURATION, SLACK_POSTS
+from catch_stock_news.models import NewsInfo, as_news_info
+from catch_stock_news.notifier import (
+    get_webhook_url, build_news_message, build_digest_message, MAX_DIGEST_ITEMS
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between outbox sweeps for due retries and leftover rows
+SWEEP_INTERVAL = 5.0
+
+# Retry delay when a 429 response carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 30.0
+
+
+class NotificationDispatcher:
+    """Bounded queue of outbox notifications drained by worker threads."""
+
+    def __init__(self, workers: int = 2, queue_size: int = 1000, max_attempts: int = 5,
+                 base_backoff: float = 2.0, max_backoff: float = 300.0,
+                 batch_size: int = 1, flush_seconds: float = 0.0,
+                 session: Optional[requests.Session] = None):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.session = session
+
+        self._queue: Optional[queue.Queue] = None
+        self._inflight: Set[int] = set()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._stop = threading.Event()
+        self._paused_until = 0.0
+        self._stats = {"sent": 0, "messages": 0, "retried": 0, "failed": 0}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._threads)
+
+    def start(self) -> None:
+        """Start the worker and sweeper threads."""
+        if self.running:
+            return
+
+        if self.session is None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(self.workers, 1))
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+        self._queue = queue.Queue(maxsize=self.queue_size)
+        self._stop.clear()
+
+        # Rows claimed by a previous run that stopped mid-delivery
+        released = release_notifications()
+        if released:
+            logger.info(f"Returned {released} interrupted notifications to the outbox")
+
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"notifier-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+        sweeper = threading.Thread(target=self._sweeper, name="notifier-sweeper", daemon=True)
+        sweeper.start()
+        self._threads.append(sweeper)
+
+        logger.info(f"Notification dispatcher started with {self.workers} workers")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop all threads. Undelivered notifications stay in the outbox."""
+        if not self.running:
+            return
+
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+        with self._lock:
+            self._inflight.clear()
+
+        logger.info("Notification dispatcher stopped")
+
+    def enqueue(self, outbox_id: int, news_info: NewsInfo, attempts: int = 0) -> bool:
+        """
+        Queue an outbox notification for delivery without blocking.
+
+        Returns False if the dispatcher is not running, the notification is
+        already queued, or the queue is full. The row stays in the outbox in
+        every case and is picked up by a later sweep.
+        """
+        if not self.running:
+            return False
+
+        with self._lock:
+            if outbox_id in self._inflight:
+                return False
+            self._inflight.add(outbox_id)
+
+        try:
+            self._queue.put_nowait((outbox_id, news_info, attempts))
+            return True
+        except queue.Full:
+            with self._lock:
+                self._inflight.discard(outbox_id)
+            logger.warning(f"Notification queue full. Deferring notification {outbox_id} to the outbox.")
+            return False
+
+    def get_stats(self) -> Dict:
+        """Get queue depth and delivery counters."""
+        with self._lock:
+            stats = dict(self._stats)
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "paused_for": max(0.0, round(self._paused_until - time.time(), 1)),
+            **stats,
+        }
+
+    def _count(self, **increments: int) -> None:
+        """Add to the delivery counters; workers update them concurrently."""
+        with self._lock:
+            for name, value in increments.items():
+                self._stats[name] += value
+
+    def _sweeper(self) -> None:
+        while not self._stop.is_set():
+            try:
+                for row in get_due_notifications(time.time(), limit=self.queue_size):
+                    if not self.enqueue(row["id"], row["news_info"], row["attempts"]):
+                        if self._queue.full():
+                            break
+            except Exception as e:
+                logger.error(f"Failed to load notifications from the outbox: {e}")
+
+            self._stop.wait(SWEEP_INTERVAL)
+
+    def _collect_batch(self, first: Tuple[int, NewsInfo, int]) -> List[Tuple[int, NewsInfo, int]]:
+        """Gather up to batch_size queued notifications, waiting at most flush_seconds."""
+        batch = [first]
+        deadline = time.time() + self.flush_seconds
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.time()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _worker(self) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            batch = self._collect_batch(first)
+            claimed = []
+            try:
+                # Honor a rate limit reported to any worker
+                delay = self._paused_until - time.time()
+                if delay > 0 and self._stop.wait(delay):
+                    break
+                claimed = claim_notifications([outbox_id for outbox_id, _, _ in batch])
+                if claimed:
+                    claimed_ids = set(claimed)
+                    self._deliver([entry for entry in batch if entry[0] in claimed_ids])
+            except Exception as e:
+                logger.error(f"Unexpected error delivering {len(batch)} notifications: {e}")
+                if claimed:
+                    release_notifications(claimed)
+            finally:
+                with self._lock:
+                    for outbox_id, _, _ in batch:
+                        self._inflight.discard(outbox_id)
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _backoff(self, attempts: int) -> float:
+        """Exponential backoff with jitter for the given attempt number."""
+        delay = min(self.max_backoff, self.base_backoff * (2 ** (attempts - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _retry(self, outbox_id: int, attempts: int, delay: float, error: str) -> None:
+        if attempts >= self.max_attempts:
+            fail_notification(outbox_id, attempts, error)
+            self._count(failed=1)
+            logger.error(f"Giving up on notification {outbox_id} after {attempts} attempts: {error}")
+            return
+
+        reschedule_notification(outbox_id, attempts, time.time() + delay, error)
+        self._count(retried=1)
+        logger.warning(f"Notification {outbox_id} failed ({error}). Retrying in {delay:.1f}s.")
+
+    def _deliver(self, batch: List[Tuple[int, NewsInfo, int]]) -> None:
+        """Send a batch of (outbox_id, news_info, attempts) as one Slack message."""
+        webhook_url = get_webhook_url()
+
+        if not webhook_url:
+            logger.warning("SLACK_WEBHOOK_URL not set. Skipping notification.")
+            for outbox_id, _, _ in batch:
+                delete_notification(outbox_id)
+            return
+
+        news_list = [as_news_info(news_info) for _, news_info, _ in batch]
+        if len(news_list) == 1:
+            message = build_news_message(news_list[0])
+        else:
+            message = build_digest_message(news_list)
+
+        try:
+            with STAGE_DURATION.time(stage="slack_post"):
+                response = self.session.post(webhook_url, json=message, timeout=10)
+        except requests.RequestException as e:
+            SLACK_POSTS.inc(result="network_error")
+            for outbox_id, _, attempts in batch:
+                self._retry(outbox_id, attempts + 1, self._backoff(attempts + 1), str(e))
+            return
+
+        if response.status_code < 300:
+            SLACK_POSTS.inc(result="ok")
+            for outbox_id, _, _ in batch:
+                delete_notification(outbox_id)
+            self._count(sent=len(batch), messages=1)
+            logger.info(f"Slack notification sent: {len(batch)} news items ({news_list[0]['title'][:50]}...)")
+
+        elif response.status_code == 429:
+            SLACK_POSTS.inc(result="rate_limited")
+            try:
+                retry_after = float(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER))
+            except ValueError:
+                retry_after = DEFAULT_RETRY_AFTER
+            self._paused_until = max(self._paused_until, time.time() + retry_after)
+            # Rate limiting is not the message's fault, so it does not count as an attempt
+            for outbox_id, _, attempts in batch:
+                self._retry(outbox_id, attempts, retry_after, "429 Too Many Requests")
+
+        elif response.status_code >= 500:
+            SLACK_POSTS.inc(result="server_error")
+            for outbox_id, _, attempts in batch:
+                self._retry(outbox_id, attempts + 1, self._backoff(attempts + 1), f"HTTP {response.status_code}")
+
+        else:
+            SLACK_POSTS.inc(result="rejected")
+            error = f"HTTP {response.status_code}: {response.text[:200]}"
+            for outbox_id, _, attempts in batch:
+                fail_notification(outbox_id, attempts + 1, error)
+            self._count(failed=len(batch))
+            logger.error(f"Slack rejected {len(batch)} notifications: HTTP {response.status_code}")
+
+
+dispatcher = NotificationDispatcher()
+
+
+def start_dispatcher() -> NotificationDispatcher:
+    """Configure the shared dispatcher from the environment and start it."""
+    config = get_config()
+
+    dispatcher.workers = config["notification_workers"]
+    dispatcher.queue_size = config["notification_queue_size"]
+    dispatcher.max_attempts = config["notification_max_attempts"]
+    dispatcher.batch_size = max(1, min(config["notification_batch_size"], MAX_DIGEST_ITEMS))
+    dispatcher.flush_seconds = config["notification_flush_seconds"]
+    dispatcher.start()
+
+    return dispatcher
@@ -0,0 +1,152 @@
+"""Bulk keyword import and export.
+
+Imports accept CSV (``keyword[,tag[,enabled]]``, optional header row) or
+JSON (a list of strings or of objects with keyword/tag/enabled, optionally
+wrapped as ``{"keywords": [...]}``). Rows are normalized and deduplicated,
+then inserted in a single transaction; every input row gets a result.
+"""
+
+import csv
+import io
+import json
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from catch_stock_news.database import add_keywords_bulk, iter_keywords
+
+MAX_KEYWORD_LENGTH = 100
+
+EXPORT_FIELDS = ["keyword", "tag", "enabled", "created_at"]
+
+_TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+_FALSE_VALUES = {"0", "false", "no", "n", "off"}
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Trim and collapse internal whitespace."""
+    return " ".join(str(keyword).split())
+
+
+def _parse_enabled(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    if value is None or str(value).strip() == "":
+        return True
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"enabled 값이 올바르지 않습니다: {value}")
+
+
+def parse_csv(text: str) -> List[Dict]:
+    """Parse CSV text into raw import rows."""
+    rows = []
+
+    for values in csv.reader(io.StringIO(text)):
+        if not values or not any(value.strip() for value in values):
+            continue
+        if not rows and values[0].strip().lower() == "keyword":
+            continue  # Header row
+        rows.append({
+            "keyword": values[0],
+            "tag": values[1] if len(values) > 1 else None,
+            "enabled": values[2] if len(values) > 2 else None,
+        })
+
+    return rows
+
+
+def parse_json(data) -> List[Dict]:
+    """Parse decoded JSON (or JSON text) into raw import rows."""
+    if isinstance(data, (str, bytes)):
+        data = json.loads(data)
+    if isinstance(data, dict):
+        data = data.get("keywords", [])
+    if not isinstance(data, list):
+        raise ValueError("JSON은 키워드 목록이어야 합니다.")
+
+    rows = []
+    for item in data:
+        if isinstance(item, dict):
+            rows.append({"keyword": item.get("keyword", ""), "tag": item.get("tag"), "enabled": item.get("enabled")})
+        else:
+            rows.append({"keyword": item, "tag": None, "enabled": None})
+
+    return rows
+
+
+def import_keywords(rows: Iterable[Dict], default_tag: Optional[str] = None) -> Dict:
+    """
+    Validate, normalize, dedup and insert keyword rows in one transaction.
+
+    Returns counts per status and a result for every row, in input order:
+    added, exists (already stored), duplicate (repeated in the input) or invalid.
+    """
+    results = []
+    entries = []
+    seen = set()
+
+    for number, row in enumerate(rows, start=1):
+        keyword = normalize_keyword(row.get("keyword") or "")
+        tag = normalize_keyword(row.get("tag") or "") or default_tag
+        result = {"row": number, "keyword": keyword}
+        results.append(result)
+
+        if not keyword:
+            result.update(status="invalid", error="키워드가 비어 있습니다.")
+            continue
+        if len(keyword) > MAX_KEYWORD_LENGTH:
+            result.update(status="invalid", error=f"키워드는 {MAX_KEYWORD_LENGTH}자 이하로 입력해주세요.")
+            continue
+        try:
+            enabled = _parse_enabled(row.get("enabled"))
+        except ValueError as e:
+            result.update(status="invalid", error=str(e))
+            continue
+        if keyword in seen:
+            result["status"] = "duplicate"
+            continue
+
+        seen.add(keyword)
+        entries.append({"keyword": keyword, "tag": tag, "enabled": enabled})
+        result["status"] = "pending"
+
+    added = add_keywords_bulk(entries)
+    for result in results:
+        if result["status"] == "pending":
+            result["status"] = "added" if result["keyword"] in added else "exists"
+
+    counts = {status: 0 for status in ("added", "exists", "duplicate", "invalid")}
+    for result in results:
+        counts[result["status"]] += 1
+
+    return {**counts, "results": results}
+
+
+def export_csv() -> Iterator[str]:
+    """Stream all keywords as CSV, one line per chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_FIELDS)
+    for keyword in iter_keywords():
+        writer.writerow([
+            keyword["keyword"], keyword["tag"] or "", "true" if keyword["enabled"] else "false", keyword["created_at"]
+        ])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.getvalue():
+        yield buffer.getvalue()
+
+
+def export_json() -> Iterator[str]:
+    """Stream all keywords as a JSON array, one element per chunk."""
+    yield "["
+    for index, keyword in enumerate(iter_keywords()):
+        item = {field: keyword[field] for field in EXPORT_FIELDS}
+        item["enabled"] = bool(item["enabled"])
+        yield ("," if index else "") + json.dumps(item, ensure_ascii=False)
+    yield "]"
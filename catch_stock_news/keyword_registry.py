@@ -0,0 +1,105 @@
+"""In-memory keyword cache with version-stamped invalidation.
+
+Every change to the keywords table bumps ``keyword_version.version``
+through triggers, whichever process or connection makes it. The registry
+keeps its own connection and first asks SQLite for ``PRAGMA data_version``,
+which only changes when another connection has committed to the database
+file. While it is unchanged the cache is served without touching any table.
+Otherwise the single version row is read, and the keywords are only reloaded
+when the version differs.
+"""
+
+import sqlite3
+import threading
+from typing import List, Optional, Tuple
+
+from catch_stock_news import database
+from catch_stock_news.matcher import KeywordMatcher
+
+
+class KeywordRegistry:
+    """Cached keyword rows, enabled keywords and their compiled matcher."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._path: Optional[str] = None
+        self._data_version: Optional[int] = None
+        self._version: Optional[int] = None
+        self._keywords: List[dict] = []
+        self._enabled: Tuple[str, ...] = ()
+        self._matcher = KeywordMatcher(())
+        self.loads = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the registry's own connection, reopening it if the database moved."""
+        if self._conn is not None and self._path == database.DATABASE_PATH:
+            return self._conn
+
+        self.close()
+        self._path = database.DATABASE_PATH
+        self._conn = sqlite3.connect(self._path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        return self._conn
+
+    def _refresh(self) -> None:
+        """Reload the cache if the keywords changed. Caller holds _lock."""
+        conn = self._connect()
+
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            return
+
+        version = conn.execute("SELECT version FROM keyword_version WHERE id = 1").fetchone()[0]
+        if version != self._version:
+            cursor = conn.execute("SELECT id, keyword, enabled, tag, created_at FROM keywords ORDER BY created_at DESC")
+            keywords = [dict(row) for row in cursor.fetchall()]
+            enabled = tuple(k["keyword"] for k in keywords if k["enabled"])
+
+            if enabled != self._enabled:
+                self._matcher = KeywordMatcher(enabled)
+            self._keywords = keywords
+            self._enabled = enabled
+            self._version = version
+            self.loads += 1
+
+        self._data_version = data_version
+
+    @property
+    def version(self) -> int:
+        """Current keyword version."""
+        with self._lock:
+            self._refresh()
+            return self._version
+
+    def get_keywords(self, only_enabled: bool = False) -> List[dict]:
+        """Same result as database.get_keywords, served from the cache. Treat the dicts as read-only."""
+        with self._lock:
+            self._refresh()
+            if only_enabled:
+                return [k for k in self._keywords if k["enabled"]]
+            return list(self._keywords)
+
+    def get_enabled_keywords(self) -> Tuple[str, ...]:
+        """Enabled keyword strings, newest first."""
+        with self._lock:
+            self._refresh()
+            return self._enabled
+
+    def get_matcher(self) -> KeywordMatcher:
+        """Matcher compiled from the enabled keywords."""
+        with self._lock:
+            self._refresh()
+            return self._matcher
+
+    def close(self) -> None:
+        """Close the registry connection. The cache is reloaded on next use."""
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+        self._path = None
+        self._data_version = None
+        self._version = None
+
+
+keyword_registry = KeywordRegistry()
@@ -0,0 +1,85 @@
+"""Multi-keyword title matcher based on an Aho-Corasick automaton."""
+
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class KeywordMatcher:
+    """
+    Match many keywords against a text in a single pass.
+
+    Semantics are those of ``keyword.lower() in text.lower()`` for every
+    keyword: case-insensitive substring matching. Matched keywords are
+    returned in the order they were given, duplicates included.
+    """
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+
+        # Trie of lowercased keywords: goto transitions, failure links and the
+        # keyword indices recognized in each state (merged along failure links)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        outputs: List[List[int]] = [[]]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(index)
+
+        # Breadth-first construction of failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+
+        self._output = [tuple(indices) for indices in outputs]
+
+    def match(self, text: str) -> List[str]:
+        """Return the keywords contained in text, in keyword order."""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        # Empty keywords match every text
+        found = set(output[0])
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+
+        return [self.keywords[index] for index in sorted(found)]
+
+
+_matcher: Optional[KeywordMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def get_matcher(keywords: Sequence[str]) -> KeywordMatcher:
+    """Get a compiled matcher for keywords, rebuilding only when they change."""
+    global _matcher
+
+    keywords = tuple(keywords)
+    with _matcher_lock:
+        if _matcher is None or _matcher.keywords != keywords:
+            _matcher = KeywordMatcher(keywords)
+        return _matcher
@@ -1,12 +1,75 @@
 """Data models for the application."""
 
+import sys
 from dataclasses import dataclass
+from typing import Dict, Hashable, Tuple, Union
 
+from catch_stock_news.articles import article_key
 
-@dataclass
+# Slotted dataclasses need Python 3.10; on 3.9 the models keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class NewsItem:
-    """Represents a news article."""
+    """Represents a news article. Immutable, as parsed pages are cached and shared between cycles."""
     title: str
     url: str
     time: str
-    source: str = ""
+    source: str = ""  # Interned by the scraper: a handful of press names repeat on every page
+    feed: str = ""  # Name of the feed the article was listed in
+    office_id: int = 0  # Naver press office id, e.g. 15 for .../article/015/... (0: not a Naver article)
+    article_id: int = 0  # Naver article id within the office
+
+    @property
+    def article_key(self) -> int:
+        """Canonical article key (see articles.article_key), or 0 if not a Naver article."""
+        return article_key(self.office_id, self.article_id)
+
+    @property
+    def identity(self) -> Hashable:
+        """What makes two items the same article: the article key, else the URL."""
+        return article_key(self.office_id, self.article_id) or self.url
+
+
+@dataclass(frozen=True, **_SLOTS)
+class MatchedNews:
+    """A news article that matched one or more keywords."""
+    item: NewsItem
+    matched_keywords: Tuple[str, ...]
+
+    @property
+    def title(self) -> str:
+        return self.item.title
+
+    @property
+    def url(self) -> str:
+        return self.item.url
+
+    @property
+    def time(self) -> str:
+        return self.item.time
+
+    @property
+    def source(self) -> str:
+        return self.item.source
+
+    def to_dict(self) -> Dict:
+        """The news_info dict used by the notifier and stored in the notification outbox."""
+        return {
+            "title": self.item.title,
+            "url": self.item.url,
+            "time": self.item.time,
+            "source": self.item.source,
+            "matched_keywords": list(self.matched_keywords),
+        }
+
+
+# Matched news as passed to the notifier: a MatchedNews, or a news_info dict
+# (e.g. loaded back from the notification outbox)
+NewsInfo = Union[MatchedNews, Dict]
+
+
+def as_news_info(news: NewsInfo) -> Dict:
+    """Dict view of matched news for the dict-based notifier API."""
+    return news.to_dict() if isinstance(news, MatchedNews) else news
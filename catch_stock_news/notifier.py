@@ -6,33 +6,42 @@ from typing import Dict, List
 from datetime import datetime
 import logging
 
+from catch_stock_news.models import NewsInfo, as_news_info
+
 logger = logging.getLogger(__name__)
 
+# Slack accepts at most 50 blocks per message. A digest uses a header and a
+# footer block, and at worst a keyword heading plus one section per item.
+MAX_MESSAGE_BLOCKS = 50
+MAX_DIGEST_ITEMS = (MAX_MESSAGE_BLOCKS - 2) // 2
+
+
+# Slack mrkdwn control characters. A "|" would end the label of a <url|label> link.
+_MRKDWN_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "|": "｜"})
+
+
+def escape_mrkdwn(text: str) -> str:
+    """Make scraped or error text safe to put into Slack mrkdwn, e.g. "<속보> S&P500" as a link label."""
+    return text.translate(_MRKDWN_ESCAPES)
+
 
 def get_webhook_url() -> str:
     """Get Slack webhook URL from environment variable."""
     return os.environ.get("SLACK_WEBHOOK_URL", "")
 
 
-def send_slack_notification(news_info: Dict) -> bool:
+def build_news_message(news_info: NewsInfo) -> Dict:
     """
-    Send a Slack notification for a matched news item.
+    Build the Slack message payload for a matched news item.
 
     Args:
-        news_info: Dict containing title, url, time, source, and matched_keywords
-
-    Returns:
-        True if sent successfully, False otherwise
+        news_info: MatchedNews, or dict containing title, url, time, source, and matched_keywords
     """
-    webhook_url = get_webhook_url()
-
-    if not webhook_url:
-        logger.warning("SLACK_WEBHOOK_URL not set. Skipping notification.")
-        return False
-
-    keywords_str = ", ".join(news_info.get("matched_keywords", []))
-    time_str = news_info.get("time", "")
-    source_str = news_info.get("source", "")
+    news_info = as_news_info(news_info)
+    title = escape_mrkdwn(news_info["title"])
+    keywords_str = escape_mrkdwn(", ".join(news_info.get("matched_keywords", [])))
+    time_str = escape_mrkdwn(news_info.get("time", ""))
+    source_str = escape_mrkdwn(news_info.get("source", ""))
 
     # Format the message
     fields = [
@@ -67,7 +76,7 @@ def send_slack_notification(news_info: Dict) -> bool:
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": f"*{news_info['title']}*"
+                    "text": f"*{title}*"
                 }
             },
             {
@@ -93,9 +102,96 @@ def send_slack_notification(news_info: Dict) -> bool:
                 "type": "divider"
             }
         ],
-        "text": f"증권 뉴스 알림: {news_info['title']}"  # Fallback text
+        "text": f"증권 뉴스 알림: {title}"  # Fallback text
     }
 
+    return message
+
+
+def build_digest_message(news_list: List[NewsInfo]) -> Dict:
+    """
+    Build one Slack message listing several matched news items, grouped by keyword.
+
+    Args:
+        news_list: Up to MAX_DIGEST_ITEMS items shaped like build_news_message's input
+    """
+    if len(news_list) > MAX_DIGEST_ITEMS:
+        raise ValueError(f"A digest holds at most {MAX_DIGEST_ITEMS} items, got {len(news_list)}")
+    news_list = [as_news_info(news) for news in news_list]
+
+    # Group by matched keywords, keeping first-seen order
+    groups: Dict[str, List[Dict]] = {}
+    for news in news_list:
+        keywords_str = ", ".join(news.get("matched_keywords", [])) or "기타"
+        groups.setdefault(keywords_str, []).append(news)
+
+    blocks = [
+        {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": f"📰 증권 뉴스 알림 ({len(news_list)}건)",
+                "emoji": True
+            }
+        }
+    ]
+
+    for keywords_str, items in groups.items():
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"*🔑 {escape_mrkdwn(keywords_str)}*"
+            }
+        })
+        for news in items:
+            details = escape_mrkdwn(" · ".join(part for part in (news.get("time", ""), news.get("source", "")) if part))
+            text = f"• <{news['url']}|{escape_mrkdwn(news['title'])}>"
+            if details:
+                text += f"\n   _{details}_"
+            blocks.append({
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": text
+                }
+            })
+
+    blocks.append({
+        "type": "context",
+        "elements": [
+            {
+                "type": "mrkdwn",
+                "text": f"키워드 {len(groups)}개 · 뉴스 {len(news_list)}건"
+            }
+        ]
+    })
+
+    return {
+        "blocks": blocks,
+        "text": f"증권 뉴스 알림 {len(news_list)}건: {escape_mrkdwn(news_list[0]['title'])}"  # Fallback text
+    }
+
+
+def send_slack_notification(news_info: NewsInfo) -> bool:
+    """
+    Send a Slack notification for a matched news item.
+
+    Args:
+        news_info: MatchedNews, or dict containing title, url, time, source, and matched_keywords
+
+    Returns:
+        True if sent successfully, False otherwise
+    """
+    webhook_url = get_webhook_url()
+
+    if not webhook_url:
+        logger.warning("SLACK_WEBHOOK_URL not set. Skipping notification.")
+        return False
+
+    news_info = as_news_info(news_info)
+    message = build_news_message(news_info)
+
     try:
         response = requests.post(
             webhook_url,
@@ -144,7 +240,7 @@ def send_error_notification(error_message: str, error_details: str = None) -> bo
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": f"*오류 내용:*\n{error_message}"
+                "text": f"*오류 내용:*\n{escape_mrkdwn(error_message)}"
             }
         }
     ]
@@ -154,7 +250,7 @@ def send_error_notification(error_message: str, error_details: str = None) -> bo
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": f"*상세 정보:*\n```{error_details[:500]}```"
+                "text": f"*상세 정보:*\n```{escape_mrkdwn(error_details[:500])}```"
             }
         })
 
@@ -170,7 +266,7 @@ def send_error_notification(error_message: str, error_details: str = None) -> bo
 
     message = {
         "blocks": blocks,
-        "text": f"뉴스 알림 시스템 오류: {error_message}"
+        "text": f"뉴스 알림 시스템 오류: {escape_mrkdwn(error_message)}"
     }
 
     try:
@@ -187,16 +283,39 @@ def send_error_notification(error_message: str, error_details: str = None) -> bo
         return False
 
 
-def send_batch_notification(news_list: List[Dict]) -> int:
+def send_batch_notification(news_list: List[NewsInfo]) -> int:
     """
-    Send notifications for multiple news items.
+    Send notifications for multiple news items as digest messages.
+
+    Items are packed MAX_DIGEST_ITEMS at a time into a single webhook call;
+    a lone item is sent as a regular notification.
 
-    Returns the count of successfully sent notifications.
+    Returns the count of successfully sent news items.
     """
+    if len(news_list) <= 1:
+        return sum(1 for news in news_list if send_slack_notification(news))
+
+    webhook_url = get_webhook_url()
+
+    if not webhook_url:
+        logger.warning("SLACK_WEBHOOK_URL not set. Skipping notification.")
+        return 0
+
     sent_count = 0
-    for news in news_list:
-        if send_slack_notification(news):
-            sent_count += 1
+    for start in range(0, len(news_list), MAX_DIGEST_ITEMS):
+        chunk = news_list[start:start + MAX_DIGEST_ITEMS]
+        try:
+            response = requests.post(
+                webhook_url,
+                json=build_digest_message(chunk),
+                timeout=10
+            )
+            response.raise_for_status()
+            logger.info(f"Slack digest sent: {len(chunk)} news items")
+            sent_count += len(chunk)
+        except requests.RequestException as e:
+            logger.error(f"Failed to send Slack digest: {e}")
+
     return sent_count
 
 
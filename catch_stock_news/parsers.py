@@ -0,0 +1,221 @@
+"""Pluggable HTML parser backends for the Naver news list page.
+
+Every backend extracts the same raw records from a list page:
+(title, href, time, source), in document order. URL normalization and
+source filtering are applied afterwards by the scraper, so all backends
+produce identical NewsItem output.
+
+Backends, fastest first:
+    selectolax  - lexbor engine (optional dependency)
+    lxml        - libxml2 engine (optional dependency)
+    html.parser - BeautifulSoup with the standard library parser (always available)
+"""
+
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    lxml_html = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+# (title, href, time, source)
+NewsRecord = Tuple[str, str, str, str]
+
+DEFAULT_BACKEND = "html.parser"
+
+
+def extract_soup_records(soup: BeautifulSoup) -> List[NewsRecord]:
+    """Extract news records from a parsed BeautifulSoup document."""
+    records = []
+
+    for link_tag in soup.select("dd.articleSubject a, dt.articleSubject a"):
+        title = link_tag.get("title") or link_tag.get_text(strip=True)
+        href = link_tag.get("href", "")
+
+        # Find time and source elements in sibling dd.articleSummary
+        parent = link_tag.find_parent("dd") or link_tag.find_parent("dt")
+        time_str = ""
+        source_str = ""
+
+        if parent:
+            next_sibling = parent.find_next_sibling("dd", class_="articleSummary")
+            if next_sibling:
+                time_tag = next_sibling.select_one(".wdate")
+                time_str = time_tag.get_text(strip=True) if time_tag else ""
+
+                source_tag = next_sibling.select_one(".press")
+                source_str = source_tag.get_text(strip=True) if source_tag else ""
+
+        records.append((title, href, time_str, source_str))
+
+    return records
+
+
+def parse_item_news(html: str) -> List[NewsRecord]:
+    """
+    Extract news records from a per-ticker news page (item/news_news.naver).
+
+    Articles are rows of table.type5 with td.title, td.info (press) and td.date cells.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    records = []
+
+    for row in soup.select("table.type5 tr"):
+        link_tag = row.select_one("td.title a")
+        if link_tag is None:
+            continue
+
+        source_tag = row.select_one("td.info")
+        time_tag = row.select_one("td.date")
+        records.append((
+            link_tag.get("title") or link_tag.get_text(strip=True),
+            link_tag.get("href", ""),
+            time_tag.get_text(strip=True) if time_tag else "",
+            source_tag.get_text(strip=True) if source_tag else "",
+        ))
+
+    return records
+
+
+def _parse_html_parser(html: str) -> List[NewsRecord]:
+    """html.parser backend: the reference implementation."""
+    return extract_soup_records(BeautifulSoup(html, "html.parser"))
+
+
+def _lxml_text(element) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
+
+def _lxml_classes(element) -> List[str]:
+    return element.get("class", "").split()
+
+
+def _lxml_first_with_class(element, class_name: str):
+    for child in element.iterdescendants():
+        if isinstance(child.tag, str) and class_name in _lxml_classes(child):
+            return child
+    return None
+
+
+def _parse_lxml(html: str) -> List[NewsRecord]:
+    """lxml backend: single linear pass over dl blocks."""
+    if not html.strip():
+        return []
+
+    root = lxml_html.fromstring(html)
+    records = []
+
+    for dl in root.iter("dl"):
+        block = []
+        pending = []
+
+        for child in dl:
+            if child.tag not in ("dt", "dd"):
+                continue
+            classes = _lxml_classes(child)
+
+            if "articleSubject" in classes:
+                for link in child.iter("a"):
+                    record = [link.get("title") or _lxml_text(link), link.get("href", ""), "", ""]
+                    block.append(record)
+                    pending.append(record)
+
+            elif child.tag == "dd" and "articleSummary" in classes:
+                time_tag = _lxml_first_with_class(child, "wdate")
+                source_tag = _lxml_first_with_class(child, "press")
+                for record in pending:
+                    record[2] = _lxml_text(time_tag) if time_tag is not None else ""
+                    record[3] = _lxml_text(source_tag) if source_tag is not None else ""
+                pending = []
+
+        records.extend(tuple(record) for record in block)
+
+    return records
+
+
+def _selectolax_text(node) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True)."""
+    return node.text(deep=True, separator="", strip=True)
+
+
+def _selectolax_classes(node) -> List[str]:
+    return (node.attributes.get("class") or "").split()
+
+
+def _parse_selectolax(html: str) -> List[NewsRecord]:
+    """selectolax (lexbor) backend: single linear pass over dl blocks."""
+    tree = LexborHTMLParser(html)
+    records = []
+
+    for dl in tree.css("dl"):
+        block = []
+        pending = []
+
+        for child in dl.iter():
+            if child.tag not in ("dt", "dd"):
+                continue
+            classes = _selectolax_classes(child)
+
+            if "articleSubject" in classes:
+                for link in child.css("a"):
+                    title = link.attributes.get("title") or _selectolax_text(link)
+                    record = [title, link.attributes.get("href") or "", "", ""]
+                    block.append(record)
+                    pending.append(record)
+
+            elif child.tag == "dd" and "articleSummary" in classes:
+                time_tag = child.css_first(".wdate")
+                source_tag = child.css_first(".press")
+                for record in pending:
+                    record[2] = _selectolax_text(time_tag) if time_tag is not None else ""
+                    record[3] = _selectolax_text(source_tag) if source_tag is not None else ""
+                pending = []
+
+        records.extend(tuple(record) for record in block)
+
+    return records
+
+
+BACKENDS: Dict[str, Callable[[str], List[NewsRecord]]] = {
+    "selectolax": _parse_selectolax,
+    "lxml": _parse_lxml,
+    "html.parser": _parse_html_parser,
+}
+
+_AVAILABLE = {
+    "selectolax": LexborHTMLParser is not None,
+    "lxml": lxml_html is not None,
+    "html.parser": True,
+}
+
+
+def available_backends() -> List[str]:
+    """Get the installed backends, fastest first."""
+    return [name for name in BACKENDS if _AVAILABLE[name]]
+
+
+def get_backend(name: Optional[str] = "auto") -> Tuple[str, Callable[[str], List[NewsRecord]]]:
+    """
+    Resolve a backend name to (name, parse function).
+
+    "auto" (or empty) picks the fastest installed backend. An unknown or
+    uninstalled backend falls back to html.parser with a warning.
+    """
+    if not name or name == "auto":
+        name = available_backends()[0]
+    elif not _AVAILABLE.get(name):
+        logger.warning(f"Parser backend '{name}' is not available. Falling back to {DEFAULT_BACKEND}.")
+        name = DEFAULT_BACKEND
+
+    return name, BACKENDS[name]
@@ -0,0 +1,61 @@
+"""Per-host request rate limiting for outbound scraping."""
+
+import threading
+import time
+from typing import Dict, Optional
+
+from catch_stock_news.config import get_config
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: allows bursts of up to capacity requests and
+    rate requests per second on average. acquire() blocks until a token is free.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is free. Returns 0, or the seconds until one will be."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is taken. Returns the seconds spent waiting."""
+        if self.rate <= 0:
+            return 0.0  # Unlimited
+
+        waited = 0.0
+        while True:
+            delay = self.try_acquire()
+            if not delay:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+
+_host_limiters: Dict[str, TokenBucket] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> TokenBucket:
+    """Limiter for one host, rebuilt when FETCH_RATE_LIMIT changes."""
+    rate = get_config()["fetch_rate_limit"]
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None or limiter.rate != rate:
+            limiter = _host_limiters[host] = TokenBucket(rate)
+        return limiter
@@ -0,0 +1,125 @@
+"""Retention and compaction of stored history.
+
+Runs on its own low-frequency schedule instead of inside every news check.
+sent_news rows older than SENT_NEWS_RETENTION_DAYS are deleted in bounded
+batches. When ALERT_RETENTION_DAYS is set, older alerts are pruned the same
+way, after being appended to gzip-compressed monthly JSON Lines files
+(``alerts-YYYY-MM.jsonl.gz``) if ALERT_ARCHIVE_DIR is configured. Each run
+ends by reclaiming free pages with an incremental VACUUM and running
+``PRAGMA optimize``.
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from catch_stock_news.config import get_config
+from catch_stock_news.database import (
+    cleanup_old_sent_news, get_alerts_before, delete_alerts, compact_database,
+    RETENTION_BATCH_SIZE
+)
+
+logger = logging.getLogger(__name__)
+
+_run_lock = threading.Lock()
+_last_run: Optional[Dict] = None
+
+
+def archive_alerts(alerts: List[dict], archive_dir: str) -> None:
+    """
+    Append alerts to the monthly archive file of their creation date.
+
+    Each call appends a new gzip member, which gzip readers decompress as one
+    continuous stream. Files are flushed to disk before returning, so alerts
+    are only deleted once they are safely archived.
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+
+    by_month: Dict[str, List[dict]] = {}
+    for alert in alerts:
+        by_month.setdefault(alert["created_at"][:7], []).append(alert)
+
+    for month, month_alerts in by_month.items():
+        path = os.path.join(archive_dir, f"alerts-{month}.jsonl.gz")
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as f:
+                for alert in month_alerts:
+                    f.write((json.dumps(alert, ensure_ascii=False) + "\n").encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+
+
+def prune_alerts(days: int, archive_dir: str = "", batch_size: int = RETENTION_BATCH_SIZE) -> Dict:
+    """Archive (optionally) and delete alerts older than days, batch by batch.
+
+    created_at is stored in UTC (CURRENT_TIMESTAMP), so the cutoff is too.
+    """
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
+    archived = 0
+    deleted = 0
+
+    while True:
+        alerts = get_alerts_before(cutoff, limit=batch_size)
+        if not alerts:
+            break
+
+        if archive_dir:
+            archive_alerts(alerts, archive_dir)
+            archived += len(alerts)
+        deleted += delete_alerts([alert["id"] for alert in alerts])
+
+        if len(alerts) < batch_size:
+            break
+
+    return {"archived": archived, "deleted": deleted}
+
+
+def run_retention() -> Dict:
+    """Apply the configured retention and compact the database. Skips if a run is in progress."""
+    global _last_run
+
+    if not _run_lock.acquire(blocking=False):
+        logger.info("Retention already running. Skipping.")
+        return {"skipped": True}
+
+    try:
+        config = get_config()
+        start = time.monotonic()
+        result: Dict = {"sent_news_deleted": 0, "alerts_archived": 0, "alerts_deleted": 0}
+
+        if config["sent_news_retention_days"] > 0:
+            result["sent_news_deleted"] = cleanup_old_sent_news(days=config["sent_news_retention_days"])
+
+        if config["alert_retention_days"] > 0:
+            pruned = prune_alerts(config["alert_retention_days"], config["alert_archive_dir"])
+            result["alerts_archived"] = pruned["archived"]
+            result["alerts_deleted"] = pruned["deleted"]
+
+        result.update(compact_database())
+        result["duration_seconds"] = round(time.monotonic() - start, 3)
+        result["finished_at"] = datetime.now().isoformat(timespec="seconds")
+
+        logger.info(
+            f"Retention: deleted {result['sent_news_deleted']} sent news, "
+            f"{result['alerts_deleted']} alerts ({result['alerts_archived']} archived), "
+            f"freed {result['freed_pages']} pages in {result['duration_seconds']}s"
+        )
+        _last_run = result
+        return result
+    except Exception as e:
+        logger.error(f"Retention run failed: {e}")
+        logger.error(traceback.format_exc())
+        return {"error": str(e)}
+    finally:
+        _run_lock.release()
+
+
+def get_last_run() -> Optional[Dict]:
+    """Summary of the last completed retention run, or None."""
+    return _last_run
@@ -0,0 +1,167 @@
+"""Single-flight runner for news check cycles.
+
+Scheduled ticks and manual triggers both go through one CycleRunner, so at
+most one cycle is in flight at any time:
+
+- A scheduled tick that arrives while a cycle is still running is skipped;
+  the interval trigger is anchored to its start time, so the next tick stays
+  on the original cadence instead of drifting by the overrun.
+- A manual trigger starts a cycle in the background when idle. While a
+  cycle is running it is queued to run right after it, and further triggers
+  coalesce into that same queued run.
+
+Every run gets an id whose status can be polled until it is done.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+
+from catch_stock_news.metrics import CYCLES
+from catch_stock_news.scheduler import get_effective_interval
+from catch_stock_news.services.news_checker import check_news_job
+
+logger = logging.getLogger(__name__)
+
+# Finished runs kept for polling
+RUN_HISTORY_SIZE = 50
+
+
+class CycleRunner:
+    """Runs job_func with at most one run in flight and at most one queued."""
+
+    def __init__(self, job_func: Callable[[], Optional[str]], history_size: int = RUN_HISTORY_SIZE):
+        self.job_func = job_func
+        self.history_size = history_size
+
+        self._lock = threading.Lock()
+        self._finished = threading.Condition(self._lock)
+        self._current: Optional[Dict] = None
+        self._pending: Optional[Dict] = None
+        self._runs: "OrderedDict[str, Dict]" = OrderedDict()
+        self._stats = {"runs": 0, "overlaps_skipped": 0, "coalesced": 0}
+        self._last_duration: Optional[float] = None
+
+    def _new_run(self, trigger: str) -> Dict:
+        """Register a queued run. Caller holds _lock."""
+        run = {
+            "id": uuid.uuid4().hex,
+            "trigger": trigger,
+            "status": "queued",
+            "result": None,
+            "queued_at": datetime.now().isoformat(timespec="seconds"),
+            "started_at": None,
+            "finished_at": None,
+            "duration_seconds": None,
+        }
+        self._runs[run["id"]] = run
+        while len(self._runs) > self.history_size:
+            self._runs.popitem(last=False)
+        return run
+
+    def run_scheduled(self) -> Optional[str]:
+        """Run a cycle on the calling thread, unless one is already in flight. Returns the run id."""
+        with self._lock:
+            if self._current is not None:
+                self._stats["overlaps_skipped"] += 1
+                CYCLES.inc(result="overlapped")
+                logger.warning("Previous news check is still running. Skipping this scheduled run.")
+                return None
+            run = self._current = self._new_run("scheduled")
+
+        self._drain(run)
+        return run["id"]
+
+    def trigger(self) -> Tuple[Dict, bool]:
+        """
+        Request a manual cycle. Returns its run record and whether it started right away.
+
+        Starts it in the background when idle; otherwise it is queued behind the
+        running cycle, coalescing with any run already queued.
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._stats["coalesced"] += 1
+                return dict(self._pending), False
+
+            run = self._new_run("manual")
+            if self._current is not None:
+                self._pending = run
+                return dict(run), False
+
+            self._current = run
+            threading.Thread(target=self._drain, args=(run,), name="news-check-manual", daemon=True).start()
+            return dict(run), True
+
+    def _drain(self, run: Dict) -> None:
+        """Execute run, then any run queued meanwhile, until none is left."""
+        while run is not None:
+            self._execute(run)
+            with self._lock:
+                run = self._current = self._pending
+                self._pending = None
+                self._finished.notify_all()
+
+    def _execute(self, run: Dict) -> None:
+        with self._lock:
+            run["status"] = "running"
+            run["started_at"] = datetime.now().isoformat(timespec="seconds")
+
+        start = time.perf_counter()
+        try:
+            result = self.job_func()
+            status = "failed" if result == "error" else "done"
+        except Exception as e:
+            logger.error(f"News check run {run['id']} failed: {e}")
+            result, status = "error", "failed"
+        duration = time.perf_counter() - start
+
+        with self._lock:
+            run.update(
+                status=status,
+                result=result,
+                finished_at=datetime.now().isoformat(timespec="seconds"),
+                duration_seconds=round(duration, 3),
+            )
+            self._stats["runs"] += 1
+            self._last_duration = duration
+
+        interval = get_effective_interval()
+        if duration > interval:
+            logger.warning(f"News check took {duration:.1f}s, longer than the {interval:g}s interval")
+
+    def get_run(self, run_id: str) -> Optional[Dict]:
+        """Status of a recent run, or None if unknown."""
+        with self._lock:
+            run = self._runs.get(run_id)
+            return dict(run) if run is not None else None
+
+    def wait(self, run_id: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Block until the run is finished (or timeout). Returns its record."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while True:
+                run = self._runs.get(run_id)
+                if run is None or run["status"] in ("done", "failed"):
+                    return dict(run) if run is not None else None
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return dict(run)
+                self._finished.wait(remaining)
+
+    def get_stats(self) -> Dict:
+        """Counters plus the in-flight and queued run ids and the last run duration."""
+        with self._lock:
+            return {
+                **self._stats,
+                "running": self._current["id"] if self._current else None,
+                "queued": self._pending["id"] if self._pending else None,
+                "last_duration_seconds": round(self._last_duration, 3) if self._last_duration is not None else None,
+            }
+
+
+cycle_runner = CycleRunner(check_news_job)
@@ -1,37 +1,148 @@
-"""APScheduler initialization."""
+"""APScheduler initialization.
+
+In the default fixed mode the news check runs every CHECK_INTERVAL_MINUTES.
+With SCHEDULE_MODE=adaptive the interval is recomputed by the cadence module
+after every run; when it changes, the next run is moved to the last scheduled
+start plus the new interval.
+"""
 
 import atexit
 import logging
+from datetime import timedelta
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
 
-from catch_stock_news.config import get_config
+from catch_stock_news.cadence import cadence
+from catch_stock_news.config import Config, get_config, add_reload_listener
 
 logger = logging.getLogger(__name__)
 
 scheduler = BackgroundScheduler()
 
+JOB_ID = "news_check_job"
+RETENTION_JOB_ID = "retention_job"
+
+# Interval the news check job currently runs at, in seconds
+_effective_interval: float = 0.0
+
+
+def get_effective_interval() -> float:
+    """Seconds between news checks as currently scheduled (check_interval before the scheduler starts)."""
+    return _effective_interval or get_config()["check_interval"] * 60
+
+
+def _target_interval(config: Config) -> float:
+    """Interval in seconds the news check should run at under this config."""
+    if config["schedule_mode"] == "adaptive":
+        return cadence.next_interval(config=config)
+    return config["check_interval"] * 60
+
+
+def apply_interval(seconds: float) -> None:
+    """
+    Change the news check job's interval if it moved by a second or more.
+
+    The schedule stays anchored to the last scheduled start: the next run is
+    that start plus the new interval, so the time a run takes is not added to
+    the period and a run that is already due is not pushed back.
+    """
+    global _effective_interval
+
+    job = scheduler.get_job(JOB_ID)
+    if abs(seconds - _effective_interval) < 1 or not job:
+        return
+
+    previous, _effective_interval = _effective_interval, seconds
+    changes = {"name": f"Check news every {seconds:g} second(s)"}
+    if job.next_run_time is None:  # Paused
+        changes["trigger"] = IntervalTrigger(seconds=seconds, timezone=scheduler.timezone)
+    else:
+        # next_run_time was set one previous interval after the last scheduled start
+        next_run = job.next_run_time - timedelta(seconds=previous) + timedelta(seconds=seconds)
+        changes["trigger"] = IntervalTrigger(seconds=seconds, start_date=next_run, timezone=scheduler.timezone)
+        changes["next_run_time"] = next_run
+
+    scheduler.modify_job(JOB_ID, **changes)
+    logger.info(f"Scheduler rescheduled - checking news every {seconds:g} second(s)")
 
-def init_scheduler(job_func) -> None:
+
+def _reschedule_on_reload(old: Config, new: Config) -> None:
+    """Reschedule the news check job when the interval settings change."""
+    keys = ("check_interval", "schedule_mode", "min_check_interval", "max_check_interval")
+    if all(old[key] == new[key] for key in keys):
+        return
+
+    apply_interval(_target_interval(new))
+
+
+def _wrap_job(job_func):
+    """Run job_func, then let the adaptive cadence pick the next interval."""
+    def run():
+        try:
+            return job_func()
+        finally:
+            config = get_config()
+            if config["schedule_mode"] == "adaptive":
+                apply_interval(_target_interval(config))
+    return run
+
+
+def _reschedule_retention_on_reload(old: Config, new: Config) -> None:
+    """Reschedule the retention job when retention_interval changes."""
+    if old["retention_interval"] == new["retention_interval"] or not scheduler.get_job(RETENTION_JOB_ID):
+        return
+
+    interval = new["retention_interval"]
+    scheduler.modify_job(RETENTION_JOB_ID, name=f"Apply retention every {interval} minute(s)")
+    scheduler.reschedule_job(RETENTION_JOB_ID, trigger="interval", minutes=interval)
+    logger.info(f"Retention rescheduled - running every {interval} minute(s)")
+
+
+def init_scheduler(job_func, retention_func=None) -> None:
     """Initialize and start the scheduler.
 
     Args:
-        job_func: The function to run periodically.
+        job_func: The function to run periodically. Ticks follow a fixed grid
+            anchored at the start time, so a slow run does not shift later ones.
+        retention_func: Optional cleanup function run on its own, slower schedule.
     """
+    global _effective_interval
+
     config = get_config()
-    interval = config["check_interval"]
+    interval = _target_interval(config)
 
     scheduler.add_job(
-        func=job_func,
+        func=_wrap_job(job_func),
         trigger="interval",
-        minutes=interval,
-        id="news_check_job",
-        name=f"Check news every {interval} minute(s)",
+        seconds=interval,
+        id=JOB_ID,
+        name=f"Check news every {interval:g} second(s)",
         replace_existing=True,
-        misfire_grace_time=120  # Allow up to 2 minutes late execution
+        misfire_grace_time=120,  # Allow up to 2 minutes late execution
+        coalesce=True,  # Run missed ticks once, not back to back
+        max_instances=2  # Let an overlapping tick reach job_func, which decides to skip it
     )
+    if retention_func is not None:
+        retention_interval = config["retention_interval"]
+        scheduler.add_job(
+            func=retention_func,
+            trigger="interval",
+            minutes=retention_interval,
+            id=RETENTION_JOB_ID,
+            name=f"Apply retention every {retention_interval} minute(s)",
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1
+        )
+
+    _effective_interval = interval
+
     scheduler.start()
-    logger.info(f"Scheduler started - checking news every {interval} minute(s)")
+    logger.info(f"Scheduler started ({config['schedule_mode']}) - checking news every {interval:g} second(s)")
+
+    add_reload_listener(_reschedule_on_reload)
+    add_reload_listener(_reschedule_retention_on_reload)
 
     # Shut down scheduler when app exits
     atexit.register(lambda: scheduler.shutdown())
@@ -1,49 +1,79 @@
-"""Naver Securities real-time news scraper."""
+"""Naver Securities news scraper and multi-feed fetch engine."""
 
+import hashlib
+import queue
+import sys
+import threading
+import time
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
-from urllib.parse import urlparse, parse_qs
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from requests.adapters import HTTPAdapter
+from typing import Callable, Collection, Generator, Iterator, List, Dict, Mapping, Optional, Sequence, Set, Tuple
+from urllib.parse import urlparse
 import logging
 
-from catch_stock_news.models import NewsItem
+from catch_stock_news.articles import canonical_article_url, canonicalize, url_identity
+from catch_stock_news.matcher import KeywordMatcher, get_matcher
+from catch_stock_news.metrics import STAGE_DURATION
+from catch_stock_news.models import MatchedNews, NewsItem
+from catch_stock_news.parsers import NewsRecord, extract_soup_records
+from catch_stock_news.breaker import CircuitOpenError, get_breaker
+from catch_stock_news.ratelimit import get_host_limiter
+from catch_stock_news.sources import Feed, REALTIME_FEED, get_page_parser, ticker_code, ticker_codes
 
 logger = logging.getLogger(__name__)
 
+BASE_URL = REALTIME_FEED.url_template.replace("&page={page}", "")
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Upper bound on pooled keep-alive connections per host, and on hosts kept pooled
+POOL_MAXSIZE = 10
+POOL_HOSTS = 10
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# Per-page cache of parsed items, keyed by page URL, least recently used first.
+# Bounded so that a deep catch-up scan does not keep every page it visited.
+PAGE_CACHE_SIZE = 64
+_page_cache: "OrderedDict[str, dict]" = OrderedDict()
+_page_cache_lock = threading.Lock()
+_page_cache_stats = {"hits": 0, "misses": 0, "not_modified": 0}
+
+# Errors that mean the news source is unreachable or failing, not a bug
+SOURCE_ERRORS = (requests.RequestException, CircuitOpenError)
+
+# Last successful poll per feed name (monotonic time), for feed min_interval
+_feed_polled_at: Dict[str, float] = {}
+_feed_polled_lock = threading.Lock()
+
 
 def convert_to_direct_news_url(url: str) -> str:
     """
-    Convert finance.naver.com/news/news_read.naver URL to direct n.news.naver.com URL.
+    Convert a Naver article URL to its canonical direct n.news.naver.com URL.
 
     Example:
         Input: /news/news_read.naver?article_id=0005240919&office_id=015&...
         Output: https://n.news.naver.com/mnews/article/015/0005240919
-    """
-    parsed = urlparse(url)
-
-    if 'news_read.naver' not in parsed.path:
-        return url
-
-    params = parse_qs(parsed.query)
-    article_id = params.get('article_id', [None])[0]
-    office_id = params.get('office_id', [None])[0]
-
-    if article_id and office_id:
-        return f"https://n.news.naver.com/mnews/article/{office_id}/{article_id}"
 
-    return url
+    Direct URLs lose any query string; URLs that are not Naver articles are
+    returned unchanged.
+    """
+    return canonical_article_url(url)
 
 
-def _parse_news_page(soup: BeautifulSoup, allowed_sources: Optional[List[str]] = None) -> List[NewsItem]:
-    """Parse news items from a single page's BeautifulSoup object."""
+def _build_items(records: List[NewsRecord], allowed_sources: Optional[List[str]] = None,
+                 feed: str = "") -> List[NewsItem]:
+    """Turn raw parser records into NewsItems, normalizing URLs and filtering sources."""
     news_items = []
 
-    article_subjects = soup.select("dd.articleSubject a, dt.articleSubject a")
-
-    for link_tag in article_subjects:
-        title = link_tag.get("title") or link_tag.get_text(strip=True)
-        href = link_tag.get("href", "")
-
+    for title, href, time_str, source_str in records:
         if not title or not href:
             continue
 
@@ -51,22 +81,8 @@ def _parse_news_page(soup: BeautifulSoup, allowed_sources: Optional[List[str]] =
         if href and not href.startswith("http"):
             href = "https://finance.naver.com" + href
 
-        # Convert to direct news URL
-        href = convert_to_direct_news_url(href)
-
-        # Find time and source elements in sibling dd.articleSummary
-        parent = link_tag.find_parent("dd") or link_tag.find_parent("dt")
-        time_str = ""
-        source_str = ""
-
-        if parent:
-            next_sibling = parent.find_next_sibling("dd", class_="articleSummary")
-            if next_sibling:
-                time_tag = next_sibling.select_one(".wdate")
-                time_str = time_tag.get_text(strip=True) if time_tag else ""
-
-                source_tag = next_sibling.select_one(".press")
-                source_str = source_tag.get_text(strip=True) if source_tag else ""
+        # Convert to the canonical direct news URL, parsing the article ids on the way
+        href, office_id, article_id = canonicalize(href)
 
         # Filter by allowed sources if specified
         if allowed_sources and source_str:
@@ -77,57 +93,310 @@ def _parse_news_page(soup: BeautifulSoup, allowed_sources: Optional[List[str]] =
             title=title,
             url=href,
             time=time_str,
-            source=source_str
+            source=sys.intern(source_str),
+            feed=feed,
+            office_id=office_id,
+            article_id=article_id
         ))
 
     return news_items
 
 
-def fetch_realtime_news(allowed_sources: Optional[List[str]] = None, max_pages: int = 3) -> List[NewsItem]:
+def _parse_news_page(soup: BeautifulSoup, allowed_sources: Optional[List[str]] = None) -> List[NewsItem]:
+    """Parse news items from a single page's BeautifulSoup object."""
+    return _build_items(extract_soup_records(soup), allowed_sources)
+
+
+def get_session() -> requests.Session:
+    """Get the shared HTTP session, creating it on first use.
+
+    The session keeps a pool of keep-alive connections per host so that
+    consecutive page requests do not pay a new TCP/TLS handshake each time.
     """
-    Fetch real-time news from Naver Securities across multiple pages.
+    global _session
 
-    Args:
-        allowed_sources: List of allowed news source names. If None, all sources are allowed.
-        max_pages: Maximum number of pages to scrape (default: 3).
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=POOL_MAXSIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(HEADERS)
+            _session = session
 
-    Returns a list of NewsItem objects containing title, url, time, and source.
+    return _session
+
+
+def get_page_cache_stats() -> Dict[str, int]:
+    """Get page cache counters.
+
+    hits counts pages whose parse was skipped (not_modified of them via an
+    HTTP 304 response), misses counts pages that had to be parsed.
     """
-    base_url = "https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258"
+    with _page_cache_lock:
+        return dict(_page_cache_stats)
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
 
-    all_news_items = []
-    seen_urls = set()
+def clear_page_cache() -> None:
+    """Drop all cached pages and reset the counters."""
+    with _page_cache_lock:
+        _page_cache.clear()
+        for key in _page_cache_stats:
+            _page_cache_stats[key] = 0
+
+
+def fetch_feed_page(
+    feed: Feed,
+    page: int,
+    allowed_sources: Optional[List[str]] = None,
+    parser: str = "auto"
+) -> List[NewsItem]:
+    """
+    Fetch and parse a single page of a feed. List pages use the given parser backend.
+
+    Requests go through the host's circuit breaker (CircuitOpenError while it
+    is open) and take a token from the host's rate limiter.
+    Pages are cached by URL. The cached validators are sent as a conditional
+    GET, and when the server answers 304 or the body hashes to the same digest
+    as last time, the previously parsed items are reused without parsing.
+    """
+    url = feed.page_url(page)
+    sources_key = tuple(allowed_sources or ())
+
+    with _page_cache_lock:
+        cached = _page_cache.get(url)
+        if cached:
+            _page_cache.move_to_end(url)
+    if cached and cached["sources"] != sources_key:
+        cached = None
+
+    headers = dict(feed.headers)
+    if cached:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    host = urlparse(url).hostname or ""
+    breaker = get_breaker(host)
+    breaker.before_request()
+    get_host_limiter(host).acquire()
 
     try:
-        for page in range(1, max_pages + 1):
-            url = f"{base_url}&page={page}"
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            response.encoding = "euc-kr"
+        with STAGE_DURATION.time(stage="fetch"):
+            response = get_session().get(url, headers=headers, timeout=10)
+    except requests.RequestException as e:
+        breaker.record_failure(str(e))
+        raise
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            page_items = _parse_news_page(soup, allowed_sources)
+    # Any error status is a failure of the source (304 answers a conditional GET)
+    if response.status_code >= 400:
+        breaker.record_failure(f"HTTP {response.status_code}")
+    else:
+        breaker.record_success()
+
+    if response.status_code == 304 and cached:
+        with _page_cache_lock:
+            _page_cache_stats["hits"] += 1
+            _page_cache_stats["not_modified"] += 1
+        return list(cached["items"])
+
+    response.raise_for_status()
+
+    digest = hashlib.blake2b(response.content, digest_size=16).digest()
+    if cached and cached["digest"] == digest:
+        with _page_cache_lock:
+            _page_cache_stats["hits"] += 1
+        return list(cached["items"])
+
+    with STAGE_DURATION.time(stage="parse"):
+        response.encoding = "euc-kr"
+        html = response.text
+
+        parse = get_page_parser(feed, parser)
+        page_items = _build_items(parse(html), allowed_sources, feed.name)
+
+        # Try alternative format if the first list page returns nothing
+        if not page_items and page == 1 and feed.page_parser == "news_list":
+            page_items = _fetch_alternative_format(BeautifulSoup(html, "html.parser"), allowed_sources, feed.name)
+
+    with _page_cache_lock:
+        _page_cache_stats["misses"] += 1
+        _page_cache[url] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "digest": digest,
+            "sources": sources_key,
+            "items": list(page_items),
+        }
+        _page_cache.move_to_end(url)
+        while len(_page_cache) > PAGE_CACHE_SIZE:
+            _page_cache.popitem(last=False)
+
+    return page_items
+
+
+def _fetch_page(
+    page: int,
+    allowed_sources: Optional[List[str]] = None,
+    parser: str = "auto"
+) -> List[NewsItem]:
+    """Fetch and parse a single page of the real-time news list."""
+    return fetch_feed_page(REALTIME_FEED, page, allowed_sources, parser)
+
+
+def _iter_pages(
+    fetch_page: Callable[[int], List[NewsItem]],
+    first_page: int,
+    last_page: int,
+    max_workers: int = 4
+) -> Iterator[Tuple[int, List[NewsItem]]]:
+    """
+    Fetch pages concurrently and yield (page, items) in page order.
 
-            # Try alternative format if first page returns nothing
-            if not page_items and page == 1:
-                page_items = _fetch_alternative_format(soup, allowed_sources)
+    At most max_workers requests are in flight at once. Closing the generator
+    early (e.g. when the caller hits an empty page) cancels the pages that
+    have not started downloading yet. With one worker, pages are fetched on
+    the calling thread.
+    """
+    if max_workers <= 1:
+        for page in range(first_page, last_page + 1):
+            yield page, fetch_page(page)
+        return
 
-            # Deduplicate by URL across pages
-            for item in page_items:
-                if item.url not in seen_urls:
-                    seen_urls.add(item.url)
-                    all_news_items.append(item)
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="news-fetch")
+    pending = {}
+    next_page = first_page
 
-            # Stop if no items found on this page (no more pages)
-            if not page_items:
-                break
+    try:
+        for page in range(first_page, last_page + 1):
+            while next_page <= last_page and len(pending) < max_workers:
+                pending[next_page] = executor.submit(fetch_page, next_page)
+                next_page += 1
+
+            yield page, pending.pop(page).result()
+    finally:
+        for future in pending.values():
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _iter_listing(
+    fetch_page: Callable[[int], List[NewsItem]],
+    max_pages: int,
+    max_workers: int,
+    stop_at_urls: Optional[Collection[str]] = None
+) -> Generator[List[NewsItem], None, bool]:
+    """
+    Walk up to max_pages pages of one listing, yielding each page's new items in page order.
 
-        logger.debug(f"Fetched {len(all_news_items)} news items from {min(page, max_pages)} page(s)")
+    When stop_at_urls is given the fetch is incremental: page 1 is fetched on
+    its own and pagination stops at the first already-seen article. Deeper
+    pages are only requested while every article on a page is new.
 
+    The generator's return value tells whether the listing was walked in
+    full. When a later page cannot be fetched (a SOURCE_ERRORS failure), the
+    walk ends there and returns False; the earlier pages have already been
+    yielded. A failing first page raises.
+    """
+    seen = set()
+    pages_fetched = 0
+    complete = True
+
+    stop_at = {url_identity(url) for url in stop_at_urls or ()}
+    page_ranges = [(1, 1), (2, max_pages)] if stop_at else [(1, max_pages)]
+
+    for first_page, last_page in page_ranges:
+        if first_page > last_page:
+            break
+
+        done = False
+        pages = _iter_pages(fetch_page, first_page, last_page, max_workers)
+        try:
+            for page, page_items in pages:
+                pages_fetched = page
+
+                # Deduplicate by article identity across pages
+                new_items = []
+                for item in page_items:
+                    identity = item.identity
+                    if identity in stop_at:
+                        done = True
+                        break
+                    if identity not in seen:
+                        seen.add(identity)
+                        new_items.append(item)
+
+                if new_items:
+                    yield new_items
+
+                # Stop if no items found on this page (no more pages)
+                if done or not page_items:
+                    done = True
+                    break
+        except SOURCE_ERRORS as e:
+            if not pages_fetched:
+                raise
+            logger.warning(f"Stopped after page {pages_fetched}: {e}")
+            complete = False
+            done = True
+        finally:
+            pages.close()
+
+        if done:
+            break
+
+    logger.debug(f"Fetched {len(seen)} news items from {pages_fetched} page(s)")
+    return complete
+
+
+def _fetch_paged(
+    fetch_page: Callable[[int], List[NewsItem]],
+    max_pages: int,
+    max_workers: int,
+    stop_at_urls: Optional[Collection[str]] = None
+) -> Tuple[List[NewsItem], bool]:
+    """Fetch one listing (see _iter_listing) into a list. Returns (items, complete)."""
+    all_news_items = []
+    listing = _iter_listing(fetch_page, max_pages, max_workers, stop_at_urls)
+    while True:
+        try:
+            all_news_items.extend(next(listing))
+        except StopIteration as stop:
+            return all_news_items, stop.value
+
+
+def fetch_realtime_news(
+    allowed_sources: Optional[List[str]] = None,
+    max_pages: int = 3,
+    max_workers: int = 4,
+    stop_at_urls: Optional[Collection[str]] = None,
+    parser: str = "auto"
+) -> List[NewsItem]:
+    """
+    Fetch real-time news from Naver Securities across multiple pages.
+
+    Pages are downloaded concurrently over a shared keep-alive session and
+    merged in page order, so a cycle costs roughly one page's latency.
+
+    When stop_at_urls is given the fetch is incremental (see _fetch_paged).
+
+    Args:
+        allowed_sources: List of allowed news source names. If None, all sources are allowed.
+        max_pages: Maximum number of pages to scrape (default: 3).
+        max_workers: Maximum number of pages fetched at the same time (default: 4).
+        stop_at_urls: URLs seen by the previous run. Articles from the first match onwards are skipped.
+        parser: HTML parser backend name, or "auto" for the fastest installed one.
+
+    Returns a list of NewsItem objects containing title, url, time, and source.
+    If a page after the first fails, the items of the earlier pages are returned.
+    """
+    try:
+        news_items, _ = _fetch_paged(
+            lambda page: _fetch_page(page, allowed_sources, parser),
+            max_pages, max(1, max_workers), stop_at_urls
+        )
+        return news_items
     except requests.RequestException as e:
         logger.error(f"Error fetching news: {e}")
         raise
@@ -135,10 +404,217 @@ def fetch_realtime_news(allowed_sources: Optional[List[str]] = None, max_pages:
         logger.error(f"Unexpected error while scraping: {e}")
         raise
 
-    return all_news_items
 
+def _feed_is_due(feed: Feed, now: float) -> bool:
+    if not feed.min_interval:
+        return True
+    with _feed_polled_lock:
+        polled_at = _feed_polled_at.get(feed.name)
+    return polled_at is None or now - polled_at >= feed.min_interval
 
-def _fetch_alternative_format(soup: BeautifulSoup, allowed_sources: Optional[List[str]] = None) -> List[NewsItem]:
+
+@dataclass
+class FetchResult:
+    """Outcome of polling several feeds."""
+
+    items: Dict[str, List[NewsItem]] = field(default_factory=dict)  # New items by feed (fetch_news only)
+    polled: List[str] = field(default_factory=list)  # Feeds fetched in full or in part, in feed order
+    incomplete: Set[str] = field(default_factory=set)  # Feeds whose later pages failed
+    failed: Dict[str, str] = field(default_factory=dict)  # Feeds that could not be fetched, with the error
+
+    @property
+    def complete(self) -> List[str]:
+        """Feeds fetched in full, whose checkpoints may advance."""
+        return [name for name in self.polled if name not in self.incomplete]
+
+
+# Pages buffered between feed fetch threads and the consumer of stream_news
+STREAM_BUFFER_PAGES = 8
+
+
+def stream_news(
+    feeds: Sequence[Feed],
+    allowed_sources: Optional[List[str]] = None,
+    max_pages: int = 3,
+    max_workers: int = 4,
+    stop_at: Optional[Mapping[str, Collection[str]]] = None,
+    parser: str = "auto",
+    result: Optional[FetchResult] = None
+) -> Iterator[Tuple[str, List[NewsItem]]]:
+    """
+    Poll several feeds, yielding (feed name, new items) for every page as soon as it arrives.
+
+    Up to max_workers feeds are fetched at once, each within its own budget
+    (max_pages, max_workers, min_interval); feeds polled less than their
+    min_interval ago are skipped. All requests share the keep-alive session
+    and go through the per-host rate limiter and circuit breaker. stop_at
+    maps feed names to the URLs seen by their previous run for incremental
+    fetching.
+
+    Pages of one feed are yielded in page order; feeds are interleaved. At
+    most STREAM_BUFFER_PAGES pages wait for the consumer, so a slow consumer
+    holds back the downloads and a deep scan never sits in memory at once.
+    Closing the generator stops the remaining fetches.
+
+    Source failures (SOURCE_ERRORS) never raise: a feed whose first page
+    fails is reported in result.failed, and a feed whose later pages fail
+    is reported in result.incomplete. Other errors raise. result is filled
+    in as the feeds finish and is final once the generator is exhausted.
+    """
+    stop_at = stop_at or {}
+    result = result if result is not None else FetchResult()
+    now = time.monotonic()
+    due = [feed for feed in feeds if _feed_is_due(feed, now)]
+    if not due:
+        return
+
+    def listing(feed: Feed) -> Generator[List[NewsItem], None, bool]:
+        return _iter_listing(
+            lambda page: fetch_feed_page(feed, page, allowed_sources, parser),
+            feed.max_pages or max_pages,
+            max(1, feed.max_workers or max_workers),
+            stop_at.get(feed.name)
+        )
+
+    def finish(feed: Feed, complete: bool) -> None:
+        result.polled.append(feed.name)
+        if not complete:
+            result.incomplete.add(feed.name)
+        with _feed_polled_lock:
+            _feed_polled_at[feed.name] = now
+
+    def fail(feed: Feed, error: Exception) -> None:
+        logger.warning(f"Could not fetch feed {feed.name}: {error}")
+        result.failed[feed.name] = str(error)
+
+    try:
+        if len(due) == 1 or max_workers <= 1:
+            # Feeds one after another on the calling thread
+            for feed in due:
+                pages = listing(feed)
+                try:
+                    while True:
+                        try:
+                            items = next(pages)
+                        except StopIteration as stop:
+                            finish(feed, stop.value)
+                            break
+                        except SOURCE_ERRORS as e:
+                            fail(feed, e)
+                            break
+                        yield feed.name, items
+                finally:
+                    pages.close()
+        else:
+            yield from _stream_concurrently(due, listing, finish, fail, max_workers)
+    finally:
+        order = {feed.name: index for index, feed in enumerate(due)}
+        result.polled.sort(key=order.__getitem__)
+
+    logger.debug(f"Polled {len(result.polled)} feed(s), {len(result.failed)} failed")
+
+
+def _stream_concurrently(
+    due: Sequence[Feed],
+    listing: Callable[[Feed], Generator[List[NewsItem], None, bool]],
+    finish: Callable[[Feed, bool], None],
+    fail: Callable[[Feed, Exception], None],
+    max_workers: int
+) -> Iterator[Tuple[str, List[NewsItem]]]:
+    """Run feed listings on worker threads and yield their pages through a bounded queue."""
+    pages: "queue.Queue[Tuple[str, Feed, object]]" = queue.Queue(maxsize=STREAM_BUFFER_PAGES)
+    stopped = threading.Event()
+
+    def put(message: Tuple[str, Feed, object]) -> bool:
+        while not stopped.is_set():
+            try:
+                pages.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce(feed: Feed) -> None:
+        walk = listing(feed)
+        try:
+            while True:
+                try:
+                    items = next(walk)
+                except StopIteration as stop:
+                    put(("done", feed, stop.value))
+                    return
+                if not put(("items", feed, items)):
+                    return  # Consumer went away
+        except SOURCE_ERRORS as e:
+            put(("failed", feed, e))
+        except Exception as e:
+            put(("error", feed, e))
+        finally:
+            walk.close()
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(due)), thread_name_prefix="feed-fetch")
+    try:
+        for feed in due:
+            executor.submit(produce, feed)
+
+        remaining = len(due)
+        while remaining:
+            kind, feed, payload = pages.get()
+            if kind == "items":
+                yield feed.name, payload
+                continue
+
+            remaining -= 1
+            if kind == "done":
+                finish(feed, payload)
+            elif kind == "failed":
+                fail(feed, payload)
+            else:
+                logger.error(f"Error fetching feed {feed.name}: {payload}")
+                raise payload
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_news(
+    feeds: Sequence[Feed],
+    allowed_sources: Optional[List[str]] = None,
+    max_pages: int = 3,
+    max_workers: int = 4,
+    stop_at: Optional[Mapping[str, Collection[str]]] = None,
+    parser: str = "auto"
+) -> FetchResult:
+    """
+    Poll several feeds (see stream_news) and collect their new items by feed name.
+
+    Every polled feed has an entry in items, possibly empty.
+    """
+    result = FetchResult()
+    collected: Dict[str, List[NewsItem]] = {}
+    for feed_name, items in stream_news(feeds, allowed_sources, max_pages, max_workers, stop_at, parser, result):
+        collected.setdefault(feed_name, []).extend(items)
+
+    result.items = {name: collected.get(name, []) for name in result.polled}
+    logger.debug(f"Fetched {sum(len(items) for items in result.items.values())} news items "
+                 f"from {len(result.items)} feed(s)")
+    return result
+
+
+def merge_feed_items(results: Mapping[str, List[NewsItem]]) -> List[NewsItem]:
+    """Merge per-feed items into one stream, keeping the first occurrence of each article."""
+    merged = []
+    seen = set()
+    for items in results.values():
+        for item in items:
+            if item.identity not in seen:
+                seen.add(item.identity)
+                merged.append(item)
+    return merged
+
+
+def _fetch_alternative_format(soup: BeautifulSoup, allowed_sources: Optional[List[str]] = None,
+                              feed: str = "") -> List[NewsItem]:
     """Try alternative HTML structure for news parsing."""
     news_items = []
 
@@ -158,15 +634,18 @@ def _fetch_alternative_format(soup: BeautifulSoup, allowed_sources: Optional[Lis
             if href and not href.startswith("http"):
                 href = "https://finance.naver.com" + href
 
-            # Convert to direct news URL
-            href = convert_to_direct_news_url(href)
+            # Convert to the canonical direct news URL
+            href, office_id, article_id = canonicalize(href)
 
             if title and href and len(title) > 5:  # Filter out navigation links
                 news_items.append(NewsItem(
                     title=title,
                     url=href,
                     time="",
-                    source=""
+                    source="",
+                    feed=feed,
+                    office_id=office_id,
+                    article_id=article_id
                 ))
 
         if news_items:
@@ -175,28 +654,34 @@ def _fetch_alternative_format(soup: BeautifulSoup, allowed_sources: Optional[Lis
     return news_items
 
 
-def find_matching_news(news_items: List[NewsItem], keywords: List[str]) -> List[Dict]:
+def find_matching_news(news_items: List[NewsItem], keywords: Sequence[str],
+                       matcher: Optional[KeywordMatcher] = None) -> List[MatchedNews]:
     """
     Find news items that contain any of the given keywords.
 
-    Returns a list of dicts with news info and matched keywords.
+    Matching is case-insensitive and runs every title through a compiled
+    multi-keyword automaton, which is rebuilt only when keywords change.
+
+    A precompiled matcher for keywords may be passed in to skip the lookup.
+    Items from a ticker feed also match the ticker code keyword of that feed.
+
+    Returns the matching items with their matched keywords.
     """
+    if matcher is None:
+        matcher = get_matcher(keywords)
+    tickers = set(ticker_codes(keywords))
     matched = []
 
     for news in news_items:
-        matched_keywords = []
-        for keyword in keywords:
-            if keyword.lower() in news.title.lower():
-                matched_keywords.append(keyword)
+        matched_keywords = matcher.match(news.title)
+
+        # Articles listed on a watched ticker's own news page match its code
+        code = ticker_code(news.feed)
+        if code in tickers and code not in matched_keywords:
+            matched_keywords = matched_keywords + [code]
 
         if matched_keywords:
-            matched.append({
-                "title": news.title,
-                "url": news.url,
-                "time": news.time,
-                "source": news.source,
-                "matched_keywords": matched_keywords
-            })
+            matched.append(MatchedNews(news, tuple(matched_keywords)))
 
     return matched
 
@@ -1,19 +1,47 @@
-"""News checking service - core business logic."""
+"""News checking service - core business logic.
+
+A news check is a chain of generator stages over page-sized batches:
+
+    stream_news -> _unique_items -> _match_items -> _drop_sent -> _persist -> dispatcher
+
+Each page is matched, deduplicated, stored and handed to the notification
+dispatcher before the next one is pulled, while the scraper keeps
+downloading the following pages in the background. Matches on page 1 are
+therefore notified without waiting for the rest of the scan, and a deep
+catch-up scan only holds a few pages in memory at a time.
+"""
 
 import logging
+import time
 import traceback
 from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-from catch_stock_news.config import get_config
+from catch_stock_news.breaker import CLOSED, OPEN, CircuitBreaker, add_state_listener
+from catch_stock_news.cadence import cadence
+from catch_stock_news.config import Config, get_config
 from catch_stock_news.database import (
-    get_keywords, is_news_sent, is_similar_news_sent,
-    mark_news_sent, save_alert, cleanup_old_sent_news
+    SIMILARITY_WINDOW, get_sent_article_keys, get_sent_urls, are_similar_news_sent,
+    save_alerts_and_mark_sent,
+    get_scrape_checkpoints, save_scrape_checkpoints
+)
+from catch_stock_news.keyword_registry import keyword_registry
+from catch_stock_news.metrics import (
+    STAGE_DURATION, CYCLE_DURATION, CYCLES, ITEMS, LAST_CYCLE_DURATION, LAST_CYCLE_ITEMS, LAST_CYCLE_TIMESTAMP
 )
-from catch_stock_news.scraper import fetch_realtime_news, find_matching_news
-from catch_stock_news.notifier import send_slack_notification, send_error_notification
+from catch_stock_news.matcher import KeywordMatcher
+from catch_stock_news.models import MatchedNews, NewsItem
+from catch_stock_news.scraper import FetchResult, stream_news, find_matching_news
+from catch_stock_news.sources import resolve_feeds
+from catch_stock_news.notifier import send_error_notification
+from catch_stock_news.dispatcher import dispatcher
 
 logger = logging.getLogger(__name__)
 
+# Number of newest article URLs remembered for incremental scraping. Keeping a
+# few lets the next run stop correctly even if the newest article is removed.
+CHECKPOINT_SIZE = 5
+
 
 def is_notification_time() -> bool:
     """Check if current time is within notification window."""
@@ -26,97 +54,241 @@ def is_notification_time() -> bool:
         logger.debug("Weekend notifications disabled")
         return False
 
-    # Check time window
-    start_str = config["notification_start"]
-    end_str = config["notification_end"]
-
-    if not start_str or not end_str:
-        return True  # No time restriction
+    # Check time window (parsed once when the config is loaded)
+    if config["notification_window"] is None:
+        return True  # No time restriction, or invalid times (warned at load)
 
-    try:
-        start_time = datetime.strptime(start_str, "%H:%M").time()
-        end_time = datetime.strptime(end_str, "%H:%M").time()
-        current_time = now.time()
-
-        if start_time <= current_time <= end_time:
-            return True
-        else:
-            logger.debug(f"Outside notification window ({start_str} - {end_str})")
-            return False
-    except ValueError as e:
-        logger.warning(f"Invalid time format in config: {e}")
+    start_time, end_time = config["notification_window"]
+    if start_time <= now.time() <= end_time:
         return True
+    else:
+        logger.debug(f"Outside notification window ({config['notification_start']} - {config['notification_end']})")
+        return False
 
 
-def check_news_job():
-    """Background job to check for news matching keywords."""
-    logger.info("Running news check...")
+def _merge_checkpoint(newest_urls: List[str], last_seen_urls: List[str]) -> List[str]:
+    """Build the next checkpoint: newest fetched URLs first, then older markers."""
+    urls = []
+    for url in newest_urls[:CHECKPOINT_SIZE] + last_seen_urls:
+        if url not in urls:
+            urls.append(url)
+    return urls[:CHECKPOINT_SIZE]
 
-    config = get_config()
 
-    # Get only enabled keywords
-    keywords_data = get_keywords(only_enabled=True)
-    if not keywords_data:
-        logger.info("No enabled keywords configured. Skipping check.")
+def _save_checkpoints(config: Config, fetched: FetchResult, newest: Dict[str, List[str]],
+                      last_seen: Dict[str, List[str]], keyword_version: int) -> None:
+    """
+    Advance the checkpoint of every feed that was fetched in full, stamped
+    with the keyword version the cycle matched against.
+
+    Feeds that stopped early keep their old checkpoint, so the next run
+    fetches the pages that failed again.
+    """
+    if not config["incremental_scraping"] or not fetched.complete:
         return
 
-    keywords = [k["keyword"] for k in keywords_data]
+    with STAGE_DURATION.time(stage="db_write"):
+        save_scrape_checkpoints({
+            feed: _merge_checkpoint(newest.get(feed, []), last_seen.get(feed, []))
+            for feed in fetched.complete
+        }, keyword_version)
+
 
+def _on_circuit_change(breaker: CircuitBreaker, old: str, new: str) -> None:
+    """Send one error notification per outage: when a host's breaker first opens."""
+    if old == CLOSED and new == OPEN:
+        send_error_notification(
+            f"뉴스 소스 연결 실패: {breaker.host} (연속 {breaker.failures}회 실패, 잠시 수집을 중단합니다)",
+            breaker.last_error
+        )
+    elif new == CLOSED:
+        logger.info(f"News source {breaker.host} recovered")
+
+
+add_state_listener(_on_circuit_change)
+
+
+def _record_cycle(result: str, duration: float, counts: Dict[str, int]) -> None:
+    """Export the cycle's duration and item counts."""
+    CYCLES.inc(result=result)
+    CYCLE_DURATION.observe(duration)
+    LAST_CYCLE_DURATION.set(duration)
+    LAST_CYCLE_TIMESTAMP.set(time.time())
+    for outcome, count in counts.items():
+        ITEMS.inc(count, outcome=outcome)
+        LAST_CYCLE_ITEMS.set(count, outcome=outcome)
+
+
+def check_news_job() -> str:
+    """Background job to check for news matching keywords. Returns the cycle result: ok, skipped or error."""
+    logger.info("Running news check...")
+
+    start = time.perf_counter()
+    counts = {"fetched": 0, "matched": 0, "duplicate": 0, "queued": 0}
+    result = "error"
     try:
-        # Fetch latest news with source filter and multi-page support
-        allowed_sources = config["allowed_sources"] if config["allowed_sources"] else None
-        news_items = fetch_realtime_news(
-            allowed_sources=allowed_sources,
-            max_pages=config["max_pages"]
+        result = _check_news(counts)
+    finally:
+        duration = time.perf_counter() - start
+        _record_cycle(result, duration, counts)
+        # With incremental scraping every fetched article is new, which gives the arrival rate
+        measurable = result == "ok" and get_config()["incremental_scraping"]
+        cadence.observe(counts["fetched"] if measurable else None)
+        logger.info(
+            f"News check {result} in {duration:.2f}s: fetched {counts['fetched']}, matched {counts['matched']}, "
+            f"duplicate {counts['duplicate']}, queued {counts['queued']}"
         )
-        logger.info(f"Fetched {len(news_items)} news items.")
+    return result
 
-        if not news_items:
-            return
 
-        # Find matching news
-        matched_news = find_matching_news(news_items, keywords)
-        logger.info(f"Found {len(matched_news)} matching news items.")
+def _unique_items(pages: Iterable[Tuple[str, List[NewsItem]]], newest: Dict[str, List[str]],
+                  counts: Dict[str, int]) -> Iterator[List[NewsItem]]:
+    """
+    Stage 1: drop articles already seen this cycle in another feed (by article key, else URL).
 
-        # Check if we should send notifications
-        should_notify = is_notification_time()
+    Also records the newest URLs of every feed for its checkpoint.
+    """
+    seen = set()
+    for feed, items in pages:
+        head = newest.setdefault(feed, [])
+        head.extend(item.url for item in items[:CHECKPOINT_SIZE - len(head)])
+
+        unique = []
+        for item in items:
+            identity = item.identity
+            if identity not in seen:
+                seen.add(identity)
+                unique.append(item)
 
-        # Send notifications for new matches
+        counts["fetched"] += len(unique)
+        if unique:
+            yield unique
+
+
+def _match_items(batches: Iterable[List[NewsItem]], keywords: List[str], matcher: KeywordMatcher,
+                 counts: Dict[str, int]) -> Iterator[List[MatchedNews]]:
+    """Stage 2: keep the articles whose titles match a keyword."""
+    for news_items in batches:
+        with STAGE_DURATION.time(stage="match"):
+            matched_news = find_matching_news(news_items, keywords, matcher)
+        counts["matched"] += len(matched_news)
+        if matched_news:
+            yield matched_news
+
+
+def _drop_sent(batches: Iterable[List[MatchedNews]], threshold: float, counts: Dict[str, int],
+               window: int = SIMILARITY_WINDOW) -> Iterator[List[MatchedNews]]:
+    """
+    Stage 3: drop news already sent (article key, else URL) or similar to sent
+    news (title), in bulk.
+
+    Every batch is checked after the previous one has been stored, so
+    duplicates across pages are caught as well.
+    """
+    for matched_news in batches:
+        with STAGE_DURATION.time(stage="dedup"):
+            sent_keys = get_sent_article_keys([news.item.article_key for news in matched_news if news.item.article_key])
+            sent_urls = get_sent_urls([news.url for news in matched_news if not news.item.article_key])
+        unsent_news = []
         for news in matched_news:
-            # Check URL duplicate
-            if is_news_sent(news["url"]):
-                logger.debug(f"Already sent (URL): {news['title'][:50]}...")
-                continue
-
-            # Check title similarity
-            if is_similar_news_sent(news["title"], config["similarity_threshold"]):
-                logger.debug(f"Already sent (similar title): {news['title'][:50]}...")
-                continue
-
-            # Save to database for web UI
-            save_alert(
-                title=news["title"],
-                url=news["url"],
-                matched_keywords=news["matched_keywords"],
-                news_time=news["time"],
-                news_source=news.get("source", "")
-            )
-
-            # Send Slack notification only during notification hours
+            key = news.item.article_key
+            if (key in sent_keys) if key else (news.url in sent_urls):
+                logger.debug(f"Already sent (article): {news.title[:50]}...")
+            else:
+                unsent_news.append(news)
+
+        with STAGE_DURATION.time(stage="similarity"):
+            similar_flags = are_similar_news_sent([news.title for news in unsent_news], threshold, window)
+        new_news = []
+        for news, similar in zip(unsent_news, similar_flags):
+            if similar:
+                logger.debug(f"Already sent (similar title): {news.title[:50]}...")
+            else:
+                new_news.append(news)
+
+        counts["duplicate"] += len(matched_news) - len(new_news)
+        if new_news:
+            yield new_news
+
+
+def _persist(batches: Iterable[List[MatchedNews]],
+             queue_notifications: bool) -> Iterator[Tuple[List[int], List[MatchedNews]]]:
+    """
+    Stage 4: save alerts, mark them as sent and, if queue_notifications is
+    set, add Slack notifications to the outbox, in one transaction per batch.
+    Yields (outbox IDs, news).
+    """
+    for new_news in batches:
+        with STAGE_DURATION.time(stage="db_write"):
+            outbox_ids = save_alerts_and_mark_sent(new_news, queue_notifications=queue_notifications)
+        yield outbox_ids, new_news
+
+
+def _check_news(counts: Dict[str, int]) -> str:
+    """Run one news check, filling counts. Returns the cycle result: ok, skipped or error."""
+    config = get_config()
+
+    # Matcher for the enabled keywords (cached until the keywords change).
+    # The version is read first, so a change in between only causes a full scan.
+    keyword_version = keyword_registry.version
+    matcher = keyword_registry.get_matcher()
+    keywords = matcher.keywords
+    if not keywords:
+        logger.info("No enabled keywords configured. Skipping check.")
+        return "skipped"
+
+    try:
+        # Poll the configured feeds (plus one feed per ticker keyword) concurrently
+        feeds = resolve_feeds(config["news_feeds"], keywords)
+        allowed_sources = config["allowed_sources"] if config["allowed_sources"] else None
+        last_seen = {}
+        if config["incremental_scraping"]:
+            last_seen = get_scrape_checkpoints([feed.name for feed in feeds], keyword_version)
+        should_notify = is_notification_time()
+
+        fetched = FetchResult()
+        newest: Dict[str, List[str]] = {}
+        pages = stream_news(
+            feeds,
+            allowed_sources=allowed_sources,
+            max_pages=config["max_pages"],
+            max_workers=config["fetch_workers"],
+            stop_at=last_seen,
+            parser=config["parser_backend"],
+            result=fetched
+        )
+        batches = _unique_items(pages, newest, counts)
+        batches = _match_items(batches, keywords, matcher, counts)
+        batches = _drop_sent(batches, config["similarity_threshold"], counts, config["similarity_window"])
+
+        # Hand notifications to the dispatcher as each batch is stored;
+        # delivery happens in the background
+        for outbox_ids, new_news in _persist(batches, should_notify):
             if should_notify:
-                send_slack_notification(news)
-                logger.info(f"Sent notification for: {news['title'][:50]}...")
+                for outbox_id, news in zip(outbox_ids, new_news):
+                    dispatcher.enqueue(outbox_id, news)
+                    logger.info(f"Queued notification for: {news.title[:50]}...")
+                counts["queued"] += len(outbox_ids)
             else:
-                logger.info(f"Saved (outside notification hours): {news['title'][:50]}...")
+                for news in new_news:
+                    logger.info(f"Saved (outside notification hours): {news.title[:50]}...")
+
+        # Unreachable sources are reported once per outage by the circuit
+        # breaker listener, not on every cycle
+        if fetched.failed and not fetched.polled:
+            logger.warning(f"No news feed could be fetched: {', '.join(fetched.failed)}")
+            return "error"
+
+        logger.info(f"Fetched {counts['fetched']} news items, {counts['matched']} matching.")
 
-            # Mark as sent with title for similarity check
-            mark_news_sent(news["url"], news["title"])
+        # Remember the newest articles only once they have been processed
+        _save_checkpoints(config, fetched, newest, last_seen, keyword_version)
 
-        # Cleanup old records periodically
-        cleanup_old_sent_news(days=7)
+        return "ok"
 
     except Exception as e:
         error_msg = f"Error during news check: {str(e)}"
         logger.error(error_msg)
         logger.error(traceback.format_exc())
         send_error_notification(error_msg, traceback.format_exc())
+        return "error"
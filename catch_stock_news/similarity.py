@@ -0,0 +1,177 @@
+"""In-memory index for near-duplicate news title detection.
+
+``difflib.SequenceMatcher.ratio()`` can never exceed ``quick_ratio()``,
+which only depends on how many characters two titles have in common
+(as multisets). The index uses that bound to find, without looking at
+individual titles, exactly the stored titles whose quick_ratio reaches the
+threshold; only those are verified with the exact ratio. Results are
+therefore identical to comparing against every stored title.
+
+Each stored title occupies a slot, i.e. one bit position. For every
+(character, n) pair the index keeps a bitmap (a Python int) of the titles
+containing that character at least n times. Adding the bitmaps for each
+character occurrence of a query into bit-sliced counters yields, for all
+titles at once, the size of their character multiset intersection with the
+query. Counting and thresholding are a few dozen big-integer operations per
+query, independent of how many titles are stored.
+"""
+
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+def _min_shared(threshold: float, total: int) -> int:
+    """Smallest shared character count s for which 2 * s / total >= threshold."""
+    if total == 0:
+        return 0
+
+    shared = max(0, int(threshold * total / 2))
+    while shared > 0 and 2.0 * (shared - 1) / total >= threshold:
+        shared -= 1
+    while 2.0 * shared / total < threshold:
+        shared += 1
+    return shared
+
+
+def _occurrences(title: str) -> List[Tuple[str, int]]:
+    """(character, n) for the n-th occurrence of every character in title."""
+    return [(char, n) for char, count in Counter(title).items() for n in range(1, count + 1)]
+
+
+class TitleSimilarityIndex:
+    """Character-multiset bitmap index over stored titles."""
+
+    def __init__(self, titles: Optional[Iterable[str]] = None):
+        self._titles: List[Optional[str]] = []
+        self._slots: Dict[Hashable, int] = {}
+        self._free_slots: List[int] = []
+        self._occupied = 0
+        self._char_bitmaps: Dict[Tuple[str, int], int] = {}
+        self._length_bitmaps: Dict[int, int] = {}
+        self._next_key = 0
+
+        for title in titles or ():
+            self.add(title)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add(self, title: str, key: Optional[Hashable] = None) -> Hashable:
+        """Add a title. Returns its key (generated if not given)."""
+        if key is None:
+            key = ("auto", self._next_key)
+            self._next_key += 1
+        elif key in self._slots:
+            self.remove(key)
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._titles[slot] = title
+        else:
+            slot = len(self._titles)
+            self._titles.append(title)
+
+        bit = 1 << slot
+        self._slots[key] = slot
+        self._occupied |= bit
+        for occurrence in _occurrences(title):
+            self._char_bitmaps[occurrence] = self._char_bitmaps.get(occurrence, 0) | bit
+        self._length_bitmaps[len(title)] = self._length_bitmaps.get(len(title), 0) | bit
+
+        return key
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a title by key. Unknown keys are ignored."""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+
+        title = self._titles[slot]
+        mask = ~(1 << slot)
+        self._occupied &= mask
+        for occurrence in _occurrences(title):
+            bitmap = self._char_bitmaps[occurrence] & mask
+            if bitmap:
+                self._char_bitmaps[occurrence] = bitmap
+            else:
+                del self._char_bitmaps[occurrence]
+        bitmap = self._length_bitmaps[len(title)] & mask
+        if bitmap:
+            self._length_bitmaps[len(title)] = bitmap
+        else:
+            del self._length_bitmaps[len(title)]
+
+        self._titles[slot] = None
+        self._free_slots.append(slot)
+
+    def _count_shared(self, title: str) -> List[int]:
+        """Bit-sliced counters of the shared character count of every stored title."""
+        planes: List[int] = []
+
+        for occurrence in _occurrences(title):
+            carry = self._char_bitmaps.get(occurrence, 0)
+            for i, plane in enumerate(planes):
+                if not carry:
+                    break
+                planes[i] = plane ^ carry
+                carry &= plane
+            if carry:
+                planes.append(carry)
+
+        return planes
+
+    def _at_least(self, planes: List[int], value: int) -> int:
+        """Bitmap of stored titles whose counter is >= value."""
+        if value <= 0:
+            return self._occupied
+        if value >= 1 << len(planes):
+            return 0
+
+        greater = 0
+        equal = self._occupied
+        for i in range(len(planes) - 1, -1, -1):
+            if (value >> i) & 1:
+                equal &= planes[i]
+            else:
+                greater |= equal & planes[i]
+                equal &= ~planes[i]
+
+        return greater | equal
+
+    def _candidates(self, title: str, threshold: float) -> int:
+        """Bitmap of stored titles whose quick_ratio with title is >= threshold."""
+        length = len(title)
+        planes = self._count_shared(title)
+
+        # Group the admissible stored lengths by the shared count they need
+        masks: Dict[int, int] = {}
+        for other_length, bitmap in self._length_bitmaps.items():
+            total = length + other_length
+            if total and 2.0 * min(length, other_length) / total < threshold:
+                continue
+            required = _min_shared(threshold, total)
+            masks[required] = masks.get(required, 0) | bitmap
+
+        candidates = 0
+        for required, mask in masks.items():
+            candidates |= self._at_least(planes, required) & mask
+        return candidates
+
+    def find_similar(self, title: str, threshold: float = 0.8) -> Optional[str]:
+        """Return a stored title with ratio >= threshold, or None."""
+        candidates = self._candidates(title, threshold)
+
+        while candidates:
+            lowest = candidates & -candidates
+            candidates ^= lowest
+            other = self._titles[lowest.bit_length() - 1]
+
+            if SequenceMatcher(None, title, other).ratio() >= threshold:
+                return other
+
+        return None
+
+    def is_similar(self, title: str, threshold: float = 0.8) -> bool:
+        """Check if any stored title has a similarity ratio >= threshold."""
+        return self.find_similar(title, threshold) is not None
@@ -0,0 +1,121 @@
+"""Registry of news feeds.
+
+Each feed declares how to request its pages (URL template and extra
+headers), which page parser reads them and its politeness budget: how many
+pages it may request per cycle, how many at once, and how often it may be
+polled at all. NEWS_FEEDS selects the registered feeds to watch; the
+special name "tickers" adds one feed per ticker code in the keyword list.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Sequence
+
+from catch_stock_news.parsers import NewsRecord, get_backend, parse_item_news
+
+logger = logging.getLogger(__name__)
+
+NAVER_FINANCE = "https://finance.naver.com"
+
+# Six-digit KRX ticker code, e.g. 005930
+TICKER_PATTERN = re.compile(r"^\d{6}$")
+
+
+@dataclass(frozen=True)
+class Feed:
+    """A paginated news listing."""
+
+    name: str
+    url_template: str  # Formatted with page (and code for ticker feeds)
+    page_parser: str = "news_list"
+    code: str = ""
+    referer: str = ""
+    max_pages: Optional[int] = None  # None: MAX_PAGES
+    max_workers: Optional[int] = None  # Concurrent pages; None: FETCH_WORKERS
+    min_interval: float = 0.0  # Seconds between polls of this feed
+
+    def page_url(self, page: int) -> str:
+        return self.url_template.format(page=page, code=self.code)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Referer": self.referer.format(code=self.code)} if self.referer else {}
+
+
+def _section_feed(name: str, section_id3: str) -> Feed:
+    return Feed(
+        name=name,
+        url_template=f"{NAVER_FINANCE}/news/news_list.naver?mode=LSS3D&section_id=101&section_id2=258"
+                     f"&section_id3={section_id3}&page={{page}}",
+        max_pages=1,
+        min_interval=120,
+    )
+
+
+REALTIME_FEED = Feed(
+    name="realtime",
+    url_template=f"{NAVER_FINANCE}/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258&page={{page}}",
+)
+
+FEEDS: Dict[str, Feed] = {
+    feed.name: feed for feed in (
+        REALTIME_FEED,
+        _section_feed("market", "401"),      # 시황·전망
+        _section_feed("company", "402"),     # 기업·종목분석
+        _section_feed("global", "403"),      # 해외증시
+        _section_feed("disclosure", "406"),  # 공시·메모
+    )
+}
+
+# Template for per-ticker feeds: the ticker's news tab, one page every 5 minutes
+TICKER_FEED = Feed(
+    name="ticker",
+    url_template=f"{NAVER_FINANCE}/item/news_news.naver?code={{code}}&page={{page}}",
+    page_parser="item_news",
+    referer=f"{NAVER_FINANCE}/item/news.naver?code={{code}}",
+    max_pages=1,
+    max_workers=1,
+    min_interval=300,
+)
+
+
+# Per-ticker feeds are named TICKER_FEED_PREFIX + code, e.g. "ticker:005930"
+TICKER_FEED_PREFIX = "ticker:"
+
+
+def ticker_feed(code: str) -> Feed:
+    """Feed for one ticker's news page."""
+    return replace(TICKER_FEED, name=f"{TICKER_FEED_PREFIX}{code}", code=code)
+
+
+def ticker_code(feed_name: str) -> Optional[str]:
+    """Ticker code of a per-ticker feed name, or None for other feeds."""
+    if feed_name.startswith(TICKER_FEED_PREFIX):
+        return feed_name[len(TICKER_FEED_PREFIX):]
+    return None
+
+
+def ticker_codes(keywords: Sequence[str]) -> List[str]:
+    """Keywords that are KRX ticker codes, in keyword order."""
+    return [keyword for keyword in keywords if TICKER_PATTERN.match(keyword)]
+
+
+def resolve_feeds(names: Sequence[str], keywords: Sequence[str] = ()) -> List[Feed]:
+    """Turn NEWS_FEEDS names into feeds. Unknown names are skipped with a warning."""
+    feeds = []
+    for name in names:
+        if name == "tickers":
+            feeds.extend(ticker_feed(code) for code in ticker_codes(keywords))
+        elif name in FEEDS:
+            feeds.append(FEEDS[name])
+        else:
+            logger.warning(f"Unknown news feed '{name}' in NEWS_FEEDS. Skipping it.")
+    return feeds
+
+
+def get_page_parser(feed: Feed, backend: str = "auto") -> Callable[[str], List[NewsRecord]]:
+    """Parse function for a feed's pages. List pages use the configured parser backend."""
+    if feed.page_parser == "item_news":
+        return parse_item_news
+    return get_backend(backend)[1]
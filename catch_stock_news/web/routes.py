@@ -3,19 +3,34 @@
 import os
 import logging
 
-from flask import Blueprint, render_template, request, jsonify
+from flask import Blueprint, Response, render_template, request, jsonify
 
-from catch_stock_news.config import get_config
+from catch_stock_news.breaker import get_breaker_stats
+from catch_stock_news.cadence import cadence
+from catch_stock_news.config import get_config, reload_config
 from catch_stock_news.database import (
-    add_keyword, delete_keyword, get_keywords, toggle_keyword,
-    get_alerts, clear_all_alerts
+    add_keyword, delete_keyword, toggle_keyword, set_keywords_enabled,
+    get_alerts, get_alerts_page, search_alerts, clear_all_alerts, get_keyword_stats, get_keyword_alerts
 )
+from catch_stock_news.keyword_io import (
+    MAX_KEYWORD_LENGTH, parse_csv, parse_json, import_keywords, export_csv, export_json
+)
+from catch_stock_news.keyword_registry import keyword_registry
 from catch_stock_news.notifier import get_webhook_url
-from catch_stock_news.services.news_checker import check_news_job, is_notification_time
-from catch_stock_news.scheduler import scheduler
+from catch_stock_news.dispatcher import dispatcher
+from catch_stock_news.metrics import render as render_metrics
+from catch_stock_news.retention import get_last_run as get_last_retention_run
+from catch_stock_news.scraper import get_page_cache_stats
+from catch_stock_news.runner import cycle_runner
+from catch_stock_news.services.news_checker import is_notification_time
+from catch_stock_news.scheduler import scheduler, get_effective_interval
 
 logger = logging.getLogger(__name__)
 
+# Alerts per page in the web UI and the default for /alerts/page
+ALERTS_PAGE_SIZE = 20
+MAX_ALERTS_PAGE_SIZE = 200
+
 bp = Blueprint(
     "main",
     __name__,
@@ -26,10 +41,13 @@ bp = Blueprint(
 @bp.route("/")
 def index():
     """Main page - keyword management UI."""
-    keywords = get_keywords()
-    alerts = get_alerts(limit=50)
+    keywords = keyword_registry.get_keywords()
+    alerts_page = get_alerts_page(limit=ALERTS_PAGE_SIZE)
     config = get_config()
-    return render_template("index.html", keywords=keywords, alerts=alerts, config=config)
+    return render_template(
+        "index.html", keywords=keywords, alerts=alerts_page["alerts"],
+        next_cursor=alerts_page["next_cursor"], config=config
+    )
 
 
 @bp.route("/keywords", methods=["POST"])
@@ -37,14 +55,15 @@ def create_keyword():
     """Add a new keyword."""
     data = request.get_json()
     keyword = data.get("keyword", "").strip()
+    tag = (data.get("tag") or "").strip() or None
 
     if not keyword:
         return jsonify({"error": "키워드를 입력해주세요."}), 400
 
-    if len(keyword) > 100:
-        return jsonify({"error": "키워드는 100자 이하로 입력해주세요."}), 400
+    if len(keyword) > MAX_KEYWORD_LENGTH:
+        return jsonify({"error": f"키워드는 {MAX_KEYWORD_LENGTH}자 이하로 입력해주세요."}), 400
 
-    if add_keyword(keyword):
+    if add_keyword(keyword, tag):
         logger.info(f"Keyword added: {keyword}")
         return jsonify({"message": f"'{keyword}' 키워드가 추가되었습니다."}), 201
     else:
@@ -80,26 +99,121 @@ def toggle_keyword_status(keyword_id):
 @bp.route("/keywords", methods=["GET"])
 def list_keywords():
     """Get all keywords as JSON."""
-    keywords = get_keywords()
+    keywords = keyword_registry.get_keywords()
     return jsonify(keywords)
 
 
+@bp.route("/keywords/stats", methods=["GET"])
+def keyword_stats():
+    """Get alert hit counts and the latest hit time per keyword."""
+    return jsonify(get_keyword_stats())
+
+
+@bp.route("/keywords/<int:keyword_id>/alerts", methods=["GET"])
+def keyword_alerts(keyword_id):
+    """Get recent alerts for a keyword. Pass before_id (last id seen) for older ones."""
+    try:
+        limit = max(1, min(int(request.args.get("limit", ALERTS_PAGE_SIZE)), MAX_ALERTS_PAGE_SIZE))
+        before_id = request.args.get("before_id")
+        before_id = int(before_id) if before_id else None
+    except ValueError:
+        return jsonify({"error": "limit과 before_id는 숫자여야 합니다."}), 400
+
+    return jsonify(get_keyword_alerts(keyword_id, limit=limit, before_id=before_id))
+
+
+@bp.route("/keywords/import", methods=["POST"])
+def import_keywords_bulk():
+    """
+    Bulk import keywords from an uploaded CSV/JSON file ("file" field) or a
+    JSON body. An optional "tag" (form field or query) applies to untagged rows.
+    """
+    default_tag = (request.values.get("tag") or "").strip() or None
+
+    try:
+        upload = request.files.get("file")
+        if upload is not None:
+            text = upload.read().decode("utf-8-sig")
+            if upload.filename.lower().endswith(".json") or upload.mimetype == "application/json":
+                rows = parse_json(text)
+            else:
+                rows = parse_csv(text)
+        elif request.is_json:
+            rows = parse_json(request.get_json())
+        else:
+            rows = parse_csv(request.get_data(as_text=True))
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"error": f"파일을 읽을 수 없습니다: {str(e)}"}), 400
+
+    if not rows:
+        return jsonify({"error": "가져올 키워드가 없습니다."}), 400
+
+    summary = import_keywords(rows, default_tag=default_tag)
+    logger.info(
+        f"Keywords imported: {summary['added']} added, {summary['exists']} existing, "
+        f"{summary['duplicate']} duplicate, {summary['invalid']} invalid"
+    )
+    return jsonify(summary), 200
+
+
+@bp.route("/keywords/export", methods=["GET"])
+def export_keywords():
+    """Stream all keywords as CSV (default) or JSON."""
+    if request.args.get("format") == "json":
+        return Response(
+            export_json(), mimetype="application/json",
+            headers={"Content-Disposition": "attachment; filename=keywords.json"}
+        )
+
+    return Response(
+        export_csv(), mimetype="text/csv",
+        headers={"Content-Disposition": "attachment; filename=keywords.csv"}
+    )
+
+
+@bp.route("/keywords/bulk-toggle", methods=["POST"])
+def bulk_toggle_keywords():
+    """Enable or disable every keyword matching a tag and/or GLOB pattern."""
+    data = request.get_json() or {}
+    tag = data.get("tag")
+    pattern = data.get("pattern")
+
+    if "enabled" not in data or not isinstance(data["enabled"], bool):
+        return jsonify({"error": "enabled 값(true/false)을 지정해주세요."}), 400
+    if not tag and not pattern:
+        return jsonify({"error": "tag 또는 pattern을 지정해주세요."}), 400
+
+    updated = set_keywords_enabled(data["enabled"], tag=tag or None, pattern=pattern or None)
+    status_text = "활성화" if data["enabled"] else "비활성화"
+    logger.info(f"Bulk toggle (tag={tag}, pattern={pattern}): {updated} keywords {status_text}")
+    return jsonify({
+        "message": f"{updated}개 키워드가 {status_text}되었습니다.",
+        "updated": updated
+    }), 200
+
+
 @bp.route("/check-now", methods=["POST"])
 def check_now():
-    """Manually trigger a news check."""
-    try:
-        check_news_job()
-        return jsonify({"message": "뉴스 확인 완료"}), 200
-    except Exception as e:
-        logger.error(f"Manual check failed: {e}")
-        return jsonify({"error": str(e)}), 500
+    """Request a news check. Runs in the background; poll /check-now/<run_id> for the result."""
+    run, started = cycle_runner.trigger()
+    message = "뉴스 확인을 시작했습니다." if started else "진행 중인 확인이 끝나면 이어서 확인합니다."
+    return jsonify({"message": message, "run": run}), 202
+
+
+@bp.route("/check-now/<run_id>", methods=["GET"])
+def check_now_status(run_id):
+    """Get the status of a requested news check."""
+    run = cycle_runner.get_run(run_id)
+    if run is None:
+        return jsonify({"error": "확인 작업을 찾을 수 없습니다."}), 404
+    return jsonify(run)
 
 
 @bp.route("/status", methods=["GET"])
 def status():
     """Get system status."""
     webhook_configured = bool(get_webhook_url())
-    keywords = get_keywords()
+    keywords = keyword_registry.get_keywords()
     config = get_config()
 
     return jsonify({
@@ -108,11 +222,42 @@ def status():
         "keyword_count": len(keywords),
         "enabled_keyword_count": len([k for k in keywords if k.get("enabled", True)]),
         "check_interval": config["check_interval"],
+        "schedule": {
+            "mode": config["schedule_mode"],
+            "effective_interval_seconds": get_effective_interval(),
+            **cadence.get_stats()
+        },
         "notification_window": f"{config['notification_start']} - {config['notification_end']}" if config['notification_start'] else "24/7",
-        "is_notification_time": is_notification_time()
+        "is_notification_time": is_notification_time(),
+        "page_cache": get_page_cache_stats(),
+        "notifications": dispatcher.get_stats(),
+        "cycles": cycle_runner.get_stats(),
+        "sources": get_breaker_stats(),
+        "retention": get_last_retention_run()
     })
 
 
+@bp.route("/metrics", methods=["GET"])
+def metrics():
+    """Export metrics in the Prometheus text format."""
+    return Response(render_metrics(), mimetype="text/plain; version=0.0.4")
+
+
+@bp.route("/config/reload", methods=["POST"])
+def config_reload():
+    """Re-read configuration from the environment."""
+    try:
+        config = reload_config(reload_env_file=True)
+    except ValueError as e:
+        logger.error(f"Config reload failed: {e}")
+        return jsonify({"error": f"설정을 다시 불러오지 못했습니다: {str(e)}"}), 400
+
+    return jsonify({
+        "message": "설정을 다시 불러왔습니다.",
+        "check_interval": config["check_interval"]
+    }), 200
+
+
 @bp.route("/alerts", methods=["GET"])
 def list_alerts():
     """Get all alerts as JSON."""
@@ -120,6 +265,51 @@ def list_alerts():
     return jsonify(alerts)
 
 
+@bp.route("/alerts/page", methods=["GET"])
+def list_alerts_page():
+    """
+    Get one page of alerts, newest first.
+
+    Query parameters: limit, cursor (next_cursor of the previous page),
+    keyword, source, since and until (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS, UTC).
+    """
+    try:
+        limit = int(request.args.get("limit", ALERTS_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "limit은 숫자여야 합니다."}), 400
+    limit = max(1, min(limit, MAX_ALERTS_PAGE_SIZE))
+
+    try:
+        page = get_alerts_page(
+            limit=limit,
+            cursor=request.args.get("cursor") or None,
+            keyword=request.args.get("keyword") or None,
+            source=request.args.get("source") or None,
+            since=request.args.get("since") or None,
+            until=request.args.get("until") or None,
+        )
+    except ValueError as e:
+        return jsonify({"error": f"잘못된 요청입니다: {str(e)}"}), 400
+
+    return jsonify(page)
+
+
+@bp.route("/alerts/search", methods=["GET"])
+def search_alerts_route():
+    """Search alert titles. Query parameters: q, limit, offset."""
+    query = request.args.get("q", "").strip()
+    if not query:
+        return jsonify({"error": "검색어를 입력해주세요."}), 400
+
+    try:
+        limit = max(1, min(int(request.args.get("limit", ALERTS_PAGE_SIZE)), MAX_ALERTS_PAGE_SIZE))
+        offset = max(0, int(request.args.get("offset", 0)))
+    except ValueError:
+        return jsonify({"error": "limit과 offset은 숫자여야 합니다."}), 400
+
+    return jsonify(search_alerts(query, limit=limit, offset=offset))
+
+
 @bp.route("/alerts", methods=["DELETE"])
 def clear_alerts():
     """Clear all alerts."""
@@ -6,10 +6,28 @@ import pytest
 os.environ.setdefault("SLACK_WEBHOOK_URL", "")
 os.environ.setdefault("CHECK_INTERVAL_MINUTES", "1")
 
-from catch_stock_news.database import init_db, DATABASE_PATH
+from catch_stock_news.breaker import reset_breakers
+from catch_stock_news.config import reload_config
+from catch_stock_news.database import init_db, close_connections, DATABASE_PATH
+from catch_stock_news.keyword_registry import keyword_registry
 from catch_stock_news.web import create_app
 
 
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """Reload the config snapshot after each test, once env changes are undone."""
+    yield
+    reload_config()
+
+
+@pytest.fixture(autouse=True)
+def closed_breakers():
+    """Start every test with closed circuit breakers."""
+    reset_breakers()
+    yield
+    reset_breakers()
+
+
 @pytest.fixture()
 def app(tmp_path, monkeypatch):
     """Create a Flask test app with a temporary database."""
@@ -19,7 +37,10 @@ def app(tmp_path, monkeypatch):
 
     app = create_app()
     app.config["TESTING"] = True
-    return app
+    yield app
+
+    keyword_registry.close()
+    close_connections()
 
 
 @pytest.fixture()
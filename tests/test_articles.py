@@ -0,0 +1,52 @@
+"""Tests for canonical article identity."""
+
+import pytest
+
+from catch_stock_news.articles import (
+    ARTICLE_ID_BITS, article_key, canonical_article_url, parse_article_id, url_article_key, url_identity
+)
+from catch_stock_news.models import NewsItem
+
+CANONICAL = "https://n.news.naver.com/mnews/article/015/0005240919"
+
+
+@pytest.mark.parametrize("url", [
+    "/news/news_read.naver?article_id=0005240919&office_id=015&mode=LSS2D&page=1",
+    "https://finance.naver.com/news/news_read.naver?office_id=015&article_id=0005240919",
+    "/item/news_read.naver?article_id=0005240919&office_id=015&code=005930&page=1&sm=title_entity_id.basic",
+    "https://n.news.naver.com/mnews/article/015/0005240919",
+    "https://n.news.naver.com/mnews/article/015/0005240919?sid=101",
+    "https://m.news.naver.com/article/015/0005240919",
+    "https://news.naver.com/main/read.naver?mode=LSD&oid=015&aid=0005240919",
+])
+def test_article_url_variants_share_one_identity(url):
+    assert parse_article_id(url) == (15, 5240919)
+    assert url_article_key(url) == 15 << ARTICLE_ID_BITS | 5240919
+    assert canonical_article_url(url) == CANONICAL
+
+
+@pytest.mark.parametrize("url", [
+    "https://example.com/some/path",
+    "/news/news_read.naver?something=else",
+    "/news/news_read.naver?article_id=0005240919",
+    "https://n.news.naver.com/1",
+])
+def test_other_urls_have_no_key(url):
+    assert url_article_key(url) == 0
+    assert url_identity(url) == url
+    assert canonical_article_url(url) == url
+
+
+def test_article_key_fits_sqlite_integer():
+    assert article_key(999, 9_999_999_999) < 2 ** 63
+    assert article_key(0, 5240919) == 0
+    assert article_key(15, 1 << ARTICLE_ID_BITS) == 0
+
+
+def test_news_item_identity():
+    keyed = NewsItem(title="a", url=CANONICAL, time="", office_id=15, article_id=5240919)
+    plain = NewsItem(title="b", url="https://example.com/b", time="")
+
+    assert keyed.identity == keyed.article_key == url_article_key(CANONICAL)
+    assert plain.article_key == 0
+    assert plain.identity == plain.url
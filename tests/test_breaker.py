@@ -0,0 +1,93 @@
+"""Tests for scraper circuit breakers."""
+
+import pytest
+
+from catch_stock_news import breaker as breaker_module
+from catch_stock_news.breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, add_state_listener, get_breaker
+)
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("catch_stock_news.breaker.time.monotonic", lambda: now[0])
+    monkeypatch.setattr("catch_stock_news.breaker.random.uniform", lambda low, high: 0.0)
+    return now
+
+
+@pytest.fixture()
+def transitions(monkeypatch):
+    seen = []
+    monkeypatch.setattr(breaker_module, "_listeners", [])
+    add_state_listener(lambda breaker, old, new: seen.append((old, new)))
+    return seen
+
+
+def test_opens_after_consecutive_failures(clock, transitions):
+    breaker = CircuitBreaker("example.com", failure_threshold=3, cooldown=60)
+
+    breaker.record_failure("HTTP 503")
+    breaker.record_failure("HTTP 503")
+    breaker.record_success()  # Resets the count
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record_failure("HTTP 503")
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_request()
+    assert excinfo.value.retry_in == 60
+    assert transitions == [(CLOSED, OPEN)]
+
+
+def test_half_open_probe_closes_on_success(clock, transitions):
+    breaker = CircuitBreaker("example.com", failure_threshold=1, cooldown=60)
+    breaker.record_failure("timeout")
+
+    clock[0] += 60
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+
+    # Only one probe at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_request()
+    assert transitions == [(CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED)]
+
+
+def test_failed_probe_reopens_with_longer_cooldown(clock, transitions):
+    breaker = CircuitBreaker("example.com", failure_threshold=1, cooldown=60, max_cooldown=100)
+    breaker.record_failure("timeout")
+
+    clock[0] += 60
+    breaker.before_request()
+    breaker.record_failure("timeout")
+    assert breaker.state == OPEN
+    assert breaker.get_stats()["retry_in"] == 100  # Doubled, capped at max_cooldown
+
+    # Only the first opening of an outage starts at CLOSED
+    assert [change for change in transitions if change == (CLOSED, OPEN)] == [(CLOSED, OPEN)]
+
+
+def test_failures_while_open_are_ignored(clock):
+    breaker = CircuitBreaker("example.com", failure_threshold=1, cooldown=60)
+    breaker.record_failure("timeout")
+    clock[0] += 30
+    breaker.record_failure("late response")  # In flight before the breaker opened
+
+    assert breaker.get_stats()["retry_in"] == 30
+
+
+def test_get_breaker_uses_config(monkeypatch):
+    monkeypatch.setenv("BREAKER_FAILURE_THRESHOLD", "2")
+    monkeypatch.setenv("BREAKER_COOLDOWN_SECONDS", "15")
+    from catch_stock_news.config import reload_config
+    reload_config()
+
+    breaker = get_breaker("example.com")
+    assert breaker is get_breaker("example.com")
+    assert (breaker.failure_threshold, breaker.base_cooldown) == (2, 15)
@@ -0,0 +1,116 @@
+"""Tests for the adaptive polling cadence."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from catch_stock_news import scheduler as scheduler_module
+from catch_stock_news.cadence import AdaptiveCadence, get_market_session
+from catch_stock_news.config import reload_config
+
+# 2024-06-03 is a Monday
+MONDAY = datetime(2024, 6, 3)
+
+
+@pytest.mark.parametrize("when, session", [
+    (MONDAY.replace(hour=8, minute=30), "pre_market"),
+    (MONDAY.replace(hour=9), "regular"),
+    (MONDAY.replace(hour=15, minute=29), "regular"),
+    (MONDAY.replace(hour=15, minute=30), "after_hours"),
+    (MONDAY.replace(hour=18), "closed"),
+    (MONDAY.replace(hour=3), "closed"),
+    (MONDAY + timedelta(days=5, hours=10), "weekend"),
+])
+def test_market_session(when, session):
+    assert get_market_session(when) == session
+
+
+@pytest.fixture()
+def adaptive_env(monkeypatch):
+    monkeypatch.setenv("SCHEDULE_MODE", "adaptive")
+    monkeypatch.setenv("CHECK_INTERVAL_MINUTES", "2")
+    monkeypatch.setenv("MIN_CHECK_INTERVAL_SECONDS", "20")
+    monkeypatch.setenv("MAX_CHECK_INTERVAL_MINUTES", "30")
+    return reload_config()
+
+
+def test_interval_without_arrivals_follows_session(adaptive_env):
+    cadence = AdaptiveCadence()
+
+    assert cadence.next_interval(MONDAY.replace(hour=10)) == 120
+    assert cadence.next_interval(MONDAY.replace(hour=16)) == 360
+    assert cadence.next_interval(MONDAY.replace(hour=22)) == 1800
+    assert cadence.next_interval(MONDAY + timedelta(days=6)) == 1800
+
+
+def test_interval_shortens_during_bursts(adaptive_env):
+    cadence = AdaptiveCadence()
+    start = MONDAY.replace(hour=9)
+
+    cadence.observe(0, start)
+    assert cadence.rate is None
+    cadence.observe(20, start + timedelta(minutes=1))
+    assert cadence.rate == 20
+
+    # 20 articles per minute: 10 articles arrive in 30 seconds
+    assert cadence.next_interval(start) == 30
+
+    # Bursts never go below the minimum, and shorten the interval in any session
+    cadence.observe(200, start + timedelta(minutes=2))
+    assert cadence.next_interval(start) == 20
+    assert cadence.next_interval(MONDAY.replace(hour=22)) == 20
+
+    # Quiet cycles decay the rate back up to the session ceiling
+    for minute in range(3, 40):
+        cadence.observe(0, start + timedelta(minutes=minute))
+    assert cadence.next_interval(start) == 120
+
+
+def test_unknown_counts_do_not_inflate_rate(adaptive_env):
+    cadence = AdaptiveCadence()
+    start = MONDAY.replace(hour=9)
+
+    cadence.observe(5, start)
+    cadence.observe(None, start + timedelta(minutes=10))
+    cadence.observe(5, start + timedelta(minutes=11))
+    assert cadence.rate == 5
+
+
+def test_adaptive_job_reschedules_after_each_run(adaptive_env, monkeypatch):
+    applied = []
+    monkeypatch.setattr(scheduler_module, "apply_interval", applied.append)
+    monkeypatch.setattr(scheduler_module.cadence, "next_interval", lambda config=None: 45.0)
+
+    job = scheduler_module._wrap_job(lambda: "ok")
+    assert job() == "ok"
+    assert applied == [45.0]
+
+
+def test_fixed_job_keeps_interval(monkeypatch):
+    applied = []
+    monkeypatch.setattr(scheduler_module, "apply_interval", applied.append)
+
+    scheduler_module._wrap_job(lambda: "ok")()
+    assert applied == []
+
+
+def test_apply_interval_counts_from_the_previous_scheduled_start(monkeypatch):
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    test_scheduler = BackgroundScheduler()
+    test_scheduler.start(paused=True)
+    monkeypatch.setattr(scheduler_module, "scheduler", test_scheduler)
+    monkeypatch.setattr(scheduler_module, "_effective_interval", 60.0)
+    try:
+        started = datetime.now(test_scheduler.timezone).replace(microsecond=0) + timedelta(hours=1)
+        test_scheduler.add_job(lambda: None, "interval", seconds=60, id=scheduler_module.JOB_ID,
+                               next_run_time=started + timedelta(seconds=60))
+
+        # The run that started at `started` ends (however long it took) and picks 90s
+        scheduler_module.apply_interval(90.0)
+
+        job = test_scheduler.get_job(scheduler_module.JOB_ID)
+        assert job.next_run_time == started + timedelta(seconds=90)
+        assert job.trigger.get_next_fire_time(job.next_run_time, job.next_run_time) == started + timedelta(seconds=180)
+    finally:
+        test_scheduler.shutdown(wait=False)
@@ -1,6 +1,11 @@
 """Tests for configuration module."""
 
 import os
+from datetime import time
+
+import pytest
+
+from catch_stock_news.config import get_config, reload_config, add_reload_listener
 
 
 def test_get_config_defaults(monkeypatch):
@@ -12,17 +17,24 @@ def test_get_config_defaults(monkeypatch):
     monkeypatch.delenv("ALLOWED_NEWS_SOURCES", raising=False)
     monkeypatch.delenv("TITLE_SIMILARITY_THRESHOLD", raising=False)
     monkeypatch.delenv("MAX_PAGES", raising=False)
+    monkeypatch.delenv("FETCH_WORKERS", raising=False)
+    monkeypatch.delenv("INCREMENTAL_SCRAPING", raising=False)
+    monkeypatch.delenv("PARSER_BACKEND", raising=False)
 
-    from catch_stock_news.config import get_config
+    reload_config()
     config = get_config()
 
     assert config["check_interval"] == 1
     assert config["notification_start"] == ""
     assert config["notification_end"] == ""
     assert config["enable_weekend"] is False
-    assert config["allowed_sources"] == []
+    assert config["allowed_sources"] == ()
     assert config["similarity_threshold"] == 0.8
+    assert config["similarity_window"] == 1000
     assert config["max_pages"] == 3
+    assert config["fetch_workers"] == 4
+    assert config["incremental_scraping"] is False
+    assert config["parser_backend"] == "auto"
 
 
 def test_get_config_custom_values(monkeypatch):
@@ -34,14 +46,63 @@ def test_get_config_custom_values(monkeypatch):
     monkeypatch.setenv("ALLOWED_NEWS_SOURCES", "연합뉴스,한국경제")
     monkeypatch.setenv("TITLE_SIMILARITY_THRESHOLD", "0.9")
     monkeypatch.setenv("MAX_PAGES", "5")
+    monkeypatch.setenv("FETCH_WORKERS", "2")
 
-    from catch_stock_news.config import get_config
+    reload_config()
     config = get_config()
 
     assert config["check_interval"] == 5
     assert config["notification_start"] == "09:00"
     assert config["notification_end"] == "18:00"
     assert config["enable_weekend"] is True
-    assert config["allowed_sources"] == ["연합뉴스", "한국경제"]
+    assert config["allowed_sources"] == ("연합뉴스", "한국경제")
     assert config["similarity_threshold"] == 0.9
     assert config["max_pages"] == 5
+    assert config["fetch_workers"] == 2
+    assert config["notification_window"] == (time(9, 0), time(18, 0))
+
+
+def test_get_config_is_cached_until_reload(monkeypatch):
+    monkeypatch.setenv("MAX_PAGES", "2")
+    config = reload_config()
+    assert get_config() is config
+
+    monkeypatch.setenv("MAX_PAGES", "7")
+    assert get_config()["max_pages"] == 2
+    assert reload_config()["max_pages"] == 7
+    assert get_config()["max_pages"] == 7
+
+
+def test_config_is_immutable():
+    with pytest.raises(AttributeError):
+        get_config().max_pages = 10
+
+
+def test_invalid_notification_window_means_no_restriction(monkeypatch):
+    monkeypatch.setenv("NOTIFICATION_START_TIME", "invalid")
+    monkeypatch.setenv("NOTIFICATION_END_TIME", "18:00")
+    assert reload_config()["notification_window"] is None
+
+
+def test_reload_notifies_listeners(monkeypatch):
+    calls = []
+    monkeypatch.setattr("catch_stock_news.config._reload_listeners", [])
+    add_reload_listener(lambda old, new: calls.append((old["check_interval"], new["check_interval"])))
+    add_reload_listener(lambda old, new: 1 / 0)  # failing listeners are logged, not raised
+
+    monkeypatch.setenv("CHECK_INTERVAL_MINUTES", "1")
+    reload_config()
+    monkeypatch.setenv("CHECK_INTERVAL_MINUTES", "3")
+    reload_config()
+
+    assert calls[-1] == (1, 3)
+
+
+def test_reload_rejects_unparseable_values(monkeypatch):
+    monkeypatch.setenv("MAX_PAGES", "4")
+    reload_config()
+    monkeypatch.setenv("MAX_PAGES", "many")
+
+    with pytest.raises(ValueError):
+        reload_config()
+    assert get_config()["max_pages"] == 4
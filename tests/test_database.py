@@ -1,10 +1,16 @@
 """Tests for database module."""
 
+import pytest
+
+from catch_stock_news import database
 from catch_stock_news.database import (
     add_keyword, delete_keyword, get_keywords, toggle_keyword,
     is_news_sent, is_similar_news_sent, mark_news_sent,
     save_alert, get_alerts, clear_all_alerts, cleanup_old_sent_news,
+    get_scrape_checkpoint, save_scrape_checkpoint,
+    get_sent_urls, are_similar_news_sent, save_alerts_and_mark_sent,
 )
+from catch_stock_news.models import MatchedNews, NewsItem
 
 
 def test_add_and_get_keywords(app):
@@ -102,3 +108,327 @@ def test_cleanup_old_sent_news(app):
     deleted = cleanup_old_sent_news(days=7)
     assert deleted == 0
     assert is_news_sent("https://example.com/old") is True
+
+
+def test_scrape_checkpoint_roundtrip(app):
+    assert get_scrape_checkpoint() == []
+
+    save_scrape_checkpoint(["https://example.com/2", "https://example.com/1"])
+    assert get_scrape_checkpoint() == ["https://example.com/2", "https://example.com/1"]
+
+    save_scrape_checkpoint(["https://example.com/3"])
+    assert get_scrape_checkpoint() == ["https://example.com/3"]
+    assert get_scrape_checkpoint(feed="other") == []
+
+
+def test_similar_news_index_follows_cleanup(app):
+    from catch_stock_news.database import get_connection
+
+    mark_news_sent("https://example.com/new", "현대차 신차 출시 발표")
+    assert is_similar_news_sent("현대차 신차 출시 발표", threshold=0.8) is True
+
+    conn = get_connection()
+    conn.execute("UPDATE sent_news SET sent_at = datetime('now', '-30 days')")
+    conn.commit()
+    conn.close()
+
+    assert cleanup_old_sent_news(days=7) == 1
+    assert is_similar_news_sent("현대차 신차 출시 발표", threshold=0.8) is False
+
+
+def test_similar_news_index_covers_the_newest_window(app):
+    mark_news_sent("https://example.com/1", "삼성전자 실적 발표 예정")
+    mark_news_sent("https://example.com/2", "현대차 신차 출시 발표")
+    assert is_similar_news_sent("삼성전자 실적 발표 예정일", threshold=0.8, window=2) is True
+
+    # A newer row pushes the oldest title out of the window
+    mark_news_sent("https://example.com/3", "카카오 주가 급등")
+    assert is_similar_news_sent("삼성전자 실적 발표 예정일", threshold=0.8, window=2) is False
+    assert is_similar_news_sent("현대차 신차 출시 발표", threshold=0.8, window=2) is True
+
+    # A wider window loads older titles again
+    assert is_similar_news_sent("삼성전자 실적 발표 예정일", threshold=0.8, window=3) is True
+
+
+def test_similar_news_index_sees_deletes_by_other_processes(app):
+    import sqlite3
+
+    mark_news_sent("https://example.com/1", "현대차 신차 출시 발표")
+    assert is_similar_news_sent("현대차 신차 출시 발표", threshold=0.8) is True
+
+    # E.g. the CLI removing rows outside the connection pool
+    other = sqlite3.connect(database.DATABASE_PATH)
+    other.execute("DELETE FROM sent_news")
+    other.commit()
+    other.close()
+
+    assert is_similar_news_sent("현대차 신차 출시 발표", threshold=0.8) is False
+
+
+def test_get_sent_urls(app):
+    mark_news_sent("https://example.com/1", "뉴스1")
+    mark_news_sent("https://example.com/2", "뉴스2")
+
+    sent = get_sent_urls(["https://example.com/1", "https://example.com/3"])
+    assert sent == {"https://example.com/1"}
+    assert get_sent_urls([]) == set()
+
+
+def test_are_similar_news_sent_includes_earlier_batch_titles(app):
+    mark_news_sent("https://example.com/1", "삼성전자 실적 발표 예정")
+
+    flags = are_similar_news_sent([
+        "삼성전자 실적 발표 예정일",
+        "현대차 신차 출시 발표",
+        "현대차 신차 출시 발표!",
+        "완전히 다른 뉴스 제목입니다",
+    ], threshold=0.8)
+    assert flags == [True, False, True, False]
+
+
+def test_save_alerts_and_mark_sent(app):
+    save_alerts_and_mark_sent([
+        MatchedNews(NewsItem(title="뉴스1", url="https://a.com", time="12:00", source="한국경제"), ("삼성전자", "반도체")),
+        MatchedNews(NewsItem(title="뉴스2", url="https://b.com", time="12:01"), ("현대차",)),
+    ])
+
+    alerts = get_alerts()
+    assert {a["title"] for a in alerts} == {"뉴스1", "뉴스2"}
+    assert {a["matched_keywords"] for a in alerts} == {"삼성전자, 반도체", "현대차"}
+    assert is_news_sent("https://a.com") is True
+    assert is_news_sent("https://b.com") is True
+
+
+def _insert_alerts(rows):
+    """Insert alerts with explicit created_at values: (title, keywords, source, created_at)."""
+    conn = database.get_connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO alerts (title, url, matched_keywords, news_time, news_source, created_at) VALUES (?, ?, ?, '', ?, ?)",
+            [(title, f"https://n.news.naver.com/{title}", keywords, source, created_at)
+             for title, keywords, source, created_at in rows]
+        )
+    conn.close()
+
+
+def test_get_alerts_page_walks_history_with_cursor(app):
+    # Several alerts share a timestamp, so ordering must fall back to id
+    _insert_alerts([(f"a{n}", "삼성전자", "연합뉴스", f"2024-01-{1 + n // 3:02d} 09:00:00") for n in range(10)])
+
+    seen = []
+    cursor = None
+    while True:
+        page = database.get_alerts_page(limit=4, cursor=cursor)
+        seen.extend(alert["title"] for alert in page["alerts"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [f"a{n}" for n in reversed(range(10))]
+    assert [alert["title"] for alert in database.get_alerts(limit=3)] == ["a9", "a8", "a7"]
+
+
+def test_get_alerts_page_filters(app):
+    _insert_alerts([
+        ("a", "삼성전자", "연합뉴스", "2024-01-01 09:00:00"),
+        ("b", "삼성전자우, 현대차", "한국경제", "2024-01-02 09:00:00"),
+        ("c", "현대차, 삼성전자", "연합뉴스", "2024-01-03 23:59:59"),
+        ("d", "100%_성장", "연합뉴스", "2024-01-04 09:00:00"),
+    ])
+
+    def titles(**filters):
+        return [alert["title"] for alert in database.get_alerts_page(**filters)["alerts"]]
+
+    assert titles(keyword="삼성전자") == ["c", "a"]
+    assert titles(keyword="100%_성장") == ["d"]
+    assert titles(keyword="100") == []
+    assert titles(source="연합뉴스") == ["d", "c", "a"]
+    assert titles(since="2024-01-02", until="2024-01-03") == ["c", "b"]
+    assert titles(since="2024-01-02 12:00:00") == ["d", "c"]
+
+
+def test_get_alerts_page_rejects_bad_cursor(app):
+    with pytest.raises(ValueError):
+        database.get_alerts_page(cursor="not-a-cursor")
+
+
+def test_alerts_query_uses_created_at_index(app):
+    conn = database.get_connection()
+    plan = " ".join(
+        row["detail"] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM alerts WHERE (created_at, id) < (?, ?) "
+            "ORDER BY created_at DESC, id DESC LIMIT 10",
+            ("2024-01-01 00:00:00", 1)
+        )
+    )
+    conn.close()
+    assert "idx_alerts_created_at" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_alert_keywords_linked_on_insert(app):
+    add_keyword("삼성전자")
+    add_keyword("현대차")
+    ids = {k["keyword"]: k["id"] for k in get_keywords()}
+
+    save_alerts_and_mark_sent([
+        MatchedNews(NewsItem(title="a", url="https://n.news.naver.com/a", time=""), ("삼성전자", "현대차")),
+        MatchedNews(NewsItem(title="b", url="https://n.news.naver.com/b", time=""), ("삼성전자",)),
+    ])
+    save_alert("c", "https://n.news.naver.com/c", ["현대차", "삭제된 키워드"], "")
+
+    assert [a["title"] for a in database.get_keyword_alerts(ids["삼성전자"])] == ["b", "a"]
+    assert [a["title"] for a in database.get_keyword_alerts(ids["현대차"], limit=1)] == ["c"]
+
+    stats = {s["keyword"]: s for s in database.get_keyword_stats()}
+    assert (stats["삼성전자"]["hits"], stats["현대차"]["hits"]) == (2, 2)
+    assert stats["현대차"]["last_hit_at"] is not None
+
+    # Deleting an alert or a keyword removes its links
+    clear_all_alerts()
+    assert database.get_keyword_alerts(ids["삼성전자"]) == []
+    assert delete_keyword(ids["현대차"]) is True
+
+
+def test_alert_keywords_backfilled_from_existing_alerts(app):
+    add_keyword("삼성전자")
+    add_keyword("삼성")
+    _insert_alerts([
+        ("a", "삼성전자", "", "2024-01-01 09:00:00"),
+        ("b", "삼성전자우, 삼성", "", "2024-01-02 09:00:00"),
+    ])
+
+    conn = database.get_connection()
+    conn.execute("DROP TABLE alert_keywords")
+    conn.commit()
+    conn.close()
+    database.init_db()
+
+    stats = {s["keyword"]: s["hits"] for s in database.get_keyword_stats()}
+    assert stats == {"삼성전자": 1, "삼성": 1}
+    assert [a["title"] for a in database.get_alerts_page(keyword="삼성")["alerts"]] == ["b"]
+
+
+def _search_titles(query, **kwargs):
+    return [alert["title"] for alert in database.search_alerts(query, **kwargs)["alerts"]]
+
+
+def test_search_alerts_full_text(app):
+    for title in [
+        "삼성전자 2분기 실적 발표",
+        "삼성전자 주가 급등, 삼성전자 시가총액 1위",
+        "현대차 신차 출시",
+        "SK하이닉스 HBM 공급 확대",
+        "50% 할인_이벤트",
+    ]:
+        save_alert(title, f"https://n.news.naver.com/{title}", [], "")
+
+    # Ranked: the title mentioning the term twice comes first
+    assert _search_titles("삼성전자") == ["삼성전자 주가 급등, 삼성전자 시가총액 1위", "삼성전자 2분기 실적 발표"]
+    assert _search_titles("삼성전자 실적") == ["삼성전자 2분기 실적 발표"]  # every term is required
+    assert _search_titles("삼성전자 실") == ["삼성전자 2분기 실적 발표"]
+    assert _search_titles("hbm") == ["SK하이닉스 HBM 공급 확대"]
+    assert _search_titles("차") == ["현대차 신차 출시"]
+    assert _search_titles("인_이") == ["50% 할인_이벤트"]
+    assert _search_titles("%") == ["50% 할인_이벤트"]
+    assert _search_titles("_") == ["50% 할인_이벤트"]
+    assert _search_titles('"삼성') == []
+    assert _search_titles("   ") == []
+
+
+def test_search_alerts_pagination_and_sync(app):
+    ids = [save_alert(f"코스피 마감 시황 {n}", f"https://n.news.naver.com/{n}", [], "") for n in range(5)]
+
+    first = database.search_alerts("코스피 마감", limit=3)
+    second = database.search_alerts("코스피 마감", limit=3, offset=first["next_offset"])
+    assert len(first["alerts"]) == 3 and first["next_offset"] == 3
+    assert len(second["alerts"]) == 2 and second["next_offset"] is None
+
+    database.delete_alert(ids[0])
+    assert len(database.search_alerts("코스피 마감", limit=10)["alerts"]) == 4
+    clear_all_alerts()
+    assert _search_titles("코스피 마감") == []
+
+
+def test_search_index_built_for_existing_alerts(app):
+    _insert_alerts([("기존 알림 제목", "", "", "2024-01-01 09:00:00")])
+
+    conn = database.get_connection()
+    for name in ("alerts_fts_insert", "alerts_fts_delete", "alerts_fts_update"):
+        conn.execute(f"DROP TRIGGER {name}")
+    conn.execute("DROP TABLE alerts_fts")
+    conn.commit()
+    conn.close()
+    database.init_db()
+
+    assert _search_titles("알림 제목") == ["기존 알림 제목"]
+
+
+def test_search_alerts_beyond_rank_window(app, monkeypatch):
+    monkeypatch.setattr(database, "SEARCH_RANK_WINDOW", 3)
+    ids = [save_alert(f"코스피 마감 {n}", f"https://n.news.naver.com/{n}", [], "") for n in range(7)]
+
+    seen = []
+    offset = 0
+    while offset is not None:
+        page = database.search_alerts("코스피", limit=2, offset=offset)
+        seen.extend(alert["id"] for alert in page["alerts"])
+        offset = page["next_offset"]
+
+    # The newest 3 matches are ranked first, then older ones newest first
+    assert sorted(seen[:3]) == sorted(ids[4:])
+    assert seen[3:] == list(reversed(ids[:4]))
+
+
+def test_sent_news_dedups_by_article_key(app):
+    mark_news_sent("https://n.news.naver.com/mnews/article/015/0005240919", "삼성전자 실적")
+    mark_news_sent("https://example.com/a", "다른 뉴스")
+
+    noisy = "https://n.news.naver.com/mnews/article/015/0005240919?sid=101"
+    assert is_news_sent(noisy) is True
+    assert get_sent_urls([noisy, "https://example.com/a", "https://example.com/b"]) == {
+        noisy, "https://example.com/a"
+    }
+    assert database.get_sent_article_keys([15 << 40 | 5240919, 15 << 40 | 1]) == {15 << 40 | 5240919}
+
+    # Another URL of a sent article is ignored
+    save_alerts_and_mark_sent([MatchedNews(NewsItem(title="삼성전자 실적", url=noisy, time="",
+                                                    office_id=15, article_id=5240919), ("삼성전자",))])
+    conn = database.get_connection()
+    assert conn.execute("SELECT COUNT(*) FROM sent_news").fetchone()[0] == 2
+    plan = " ".join(row[3] for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT article_key FROM sent_news WHERE article_key IN (?, ?)", (1, 2)
+    ))
+    conn.close()
+    assert "idx_sent_news_article_key" in plan
+
+
+def test_init_db_backfills_article_keys(app):
+    conn = database.get_connection()
+    conn.executescript("""
+        DROP TABLE sent_news;
+        CREATE TABLE sent_news (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            news_url TEXT NOT NULL,
+            news_title TEXT,
+            sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE UNIQUE INDEX idx_sent_news_url ON sent_news(news_url);
+        INSERT INTO sent_news (news_url, news_title) VALUES
+            ('https://n.news.naver.com/mnews/article/015/0005240919', 'a'),
+            ('https://n.news.naver.com/mnews/article/015/0005240919?sid=101', 'a'),
+            ('https://example.com/b', 'b');
+    """)
+    conn.close()
+
+    database.init_db()
+
+    conn = database.get_connection()
+    rows = [tuple(row) for row in conn.execute("SELECT news_title, article_key FROM sent_news ORDER BY id")]
+    url_index = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'idx_sent_news_url'").fetchone()[0]
+    conn.close()
+
+    assert rows == [("a", 15 << 40 | 5240919), ("a", None), ("b", None)]
+    assert "WHERE article_key IS NULL" in url_index
+    assert is_news_sent("/news/news_read.naver?article_id=0005240919&office_id=015") is True
+    assert is_news_sent("https://example.com/b") is True
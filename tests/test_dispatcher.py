@@ -0,0 +1,236 @@
+"""Tests for the notification dispatcher."""
+
+import time
+
+import pytest
+import requests
+
+from catch_stock_news import database, dispatcher as dispatcher_module
+from catch_stock_news.database import save_alerts_and_mark_sent, get_due_notifications
+from catch_stock_news.dispatcher import NotificationDispatcher
+from catch_stock_news.models import MatchedNews, NewsItem
+
+
+class _FakeResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+
+
+class _FakeSession:
+    """Returns queued responses (or raises queued exceptions) in order."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.posts = []
+
+    def post(self, url, json=None, timeout=None):
+        self.posts.append(json)
+        response = self.responses.pop(0) if self.responses else _FakeResponse(200)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _news(n):
+    return MatchedNews(NewsItem(title=f"뉴스 {n}", url=f"https://n.news.naver.com/{n}", time="12:00"), ("뉴스",))
+
+
+def _outbox_rows():
+    conn = database.get_connection()
+    rows = [dict(row) for row in conn.execute("SELECT * FROM notification_outbox ORDER BY id")]
+    conn.close()
+    return rows
+
+
+@pytest.fixture()
+def webhook(monkeypatch):
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", "https://hooks.slack.test/x")
+
+
+def test_outbox_rows_written_with_alerts(app):
+    ids = save_alerts_and_mark_sent([_news(1), _news(2)], queue_notifications=True)
+
+    assert len(ids) == 2
+    rows = get_due_notifications(time.time())
+    assert [row["id"] for row in rows] == ids
+    assert rows[0]["news_info"]["title"] == "뉴스 1"
+
+    assert save_alerts_and_mark_sent([_news(3)]) == []
+    assert len(get_due_notifications(time.time())) == 2
+
+
+def test_successful_delivery_deletes_outbox_row(app, webhook):
+    [outbox_id] = save_alerts_and_mark_sent([_news(1)], queue_notifications=True)
+    session = _FakeSession([_FakeResponse(200)])
+    dispatcher = NotificationDispatcher(session=session)
+
+    dispatcher._deliver([(outbox_id, _news(1), 0)])
+
+    assert len(session.posts) == 1
+    assert _outbox_rows() == []
+    assert dispatcher.get_stats()["sent"] == 1
+
+
+def test_server_error_is_retried_with_backoff(app, webhook):
+    [outbox_id] = save_alerts_and_mark_sent([_news(1)], queue_notifications=True)
+    dispatcher = NotificationDispatcher(session=_FakeSession([_FakeResponse(503)]), base_backoff=10)
+
+    dispatcher._deliver([(outbox_id, _news(1), 0)])
+
+    [row] = _outbox_rows()
+    assert row["status"] == "pending"
+    assert row["attempts"] == 1
+    assert time.time() + 4 < row["next_attempt_at"] <= time.time() + 10
+    assert get_due_notifications(time.time()) == []
+
+
+def test_network_error_gives_up_after_max_attempts(app, webhook):
+    [outbox_id] = save_alerts_and_mark_sent([_news(1)], queue_notifications=True)
+    session = _FakeSession([requests.ConnectionError("boom")])
+    dispatcher = NotificationDispatcher(session=session, max_attempts=3)
+
+    dispatcher._deliver([(outbox_id, _news(1), 2)])
+
+    [row] = _outbox_rows()
+    assert row["status"] == "failed"
+    assert row["attempts"] == 3
+    assert "boom" in row["last_error"]
+
+
+def test_rate_limit_honors_retry_after(app, webhook):
+    [outbox_id] = save_alerts_and_mark_sent([_news(1)], queue_notifications=True)
+    session = _FakeSession([_FakeResponse(429, {"Retry-After": "20"})])
+    dispatcher = NotificationDispatcher(session=session)
+
+    dispatcher._deliver([(outbox_id, _news(1), 0)])
+
+    [row] = _outbox_rows()
+    assert row["attempts"] == 0
+    assert row["next_attempt_at"] == pytest.approx(time.time() + 20, abs=2)
+    assert 18 < dispatcher.get_stats()["paused_for"] <= 20
+
+
+def test_client_error_is_not_retried(app, webhook):
+    [outbox_id] = save_alerts_and_mark_sent([_news(1)], queue_notifications=True)
+    dispatcher = NotificationDispatcher(session=_FakeSession([_FakeResponse(400)]))
+
+    dispatcher._deliver([(outbox_id, _news(1), 0)])
+
+    [row] = _outbox_rows()
+    assert row["status"] == "failed"
+    assert row["attempts"] == 1
+
+
+def test_running_dispatcher_drains_outbox(app, webhook, monkeypatch):
+    """Rows left in the outbox (e.g. before a restart) are delivered by the sweeper."""
+    monkeypatch.setattr(dispatcher_module, "SWEEP_INTERVAL", 0.05)
+    save_alerts_and_mark_sent([_news(1), _news(2), _news(3)], queue_notifications=True)
+    session = _FakeSession([])
+    dispatcher = NotificationDispatcher(workers=2, session=session)
+
+    dispatcher.start()
+    try:
+        deadline = time.time() + 5
+        while _outbox_rows() and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        dispatcher.stop()
+
+    assert _outbox_rows() == []
+    assert sorted(post["text"] for post in session.posts) == [
+        "증권 뉴스 알림: 뉴스 1", "증권 뉴스 알림: 뉴스 2", "증권 뉴스 알림: 뉴스 3"
+    ]
+
+
+def test_stale_sweep_does_not_resend_delivered_notification(app, webhook, monkeypatch):
+    """A sweep that read a row before its delivery finished re-queues it; the claim stops a second post."""
+    monkeypatch.setattr(dispatcher_module, "SWEEP_INTERVAL", 0.02)
+    [outbox_id] = save_alerts_and_mark_sent([_news(1)], queue_notifications=True)
+    stale = get_due_notifications(time.time())
+    sweeps = []
+
+    def stale_sweep(now, limit=100):
+        sweeps.append(now)
+        return stale if _outbox_rows() == [] else []
+
+    monkeypatch.setattr(dispatcher_module, "get_due_notifications", stale_sweep)
+    session = _FakeSession([])
+    dispatcher = NotificationDispatcher(workers=2, session=session)
+
+    dispatcher.start()
+    try:
+        dispatcher.enqueue(outbox_id, _news(1))
+        deadline = time.time() + 5
+        while (_outbox_rows() or len(sweeps) < 10) and time.time() < deadline:
+            time.sleep(0.02)
+        dispatcher._queue.join()
+    finally:
+        dispatcher.stop()
+
+    assert len(session.posts) == 1
+    assert dispatcher.get_stats()["sent"] == 1
+
+
+def test_start_releases_rows_claimed_before_a_restart(app, webhook, monkeypatch):
+    monkeypatch.setattr(dispatcher_module, "SWEEP_INTERVAL", 0.05)
+    [outbox_id] = save_alerts_and_mark_sent([_news(1)], queue_notifications=True)
+    assert database.claim_notifications([outbox_id]) == [outbox_id]
+    assert database.claim_notifications([outbox_id]) == []
+    session = _FakeSession([])
+    dispatcher = NotificationDispatcher(session=session)
+
+    dispatcher.start()
+    try:
+        deadline = time.time() + 5
+        while _outbox_rows() and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        dispatcher.stop()
+
+    assert _outbox_rows() == []
+    assert len(session.posts) == 1
+
+
+def test_enqueue_skips_duplicates_and_full_queue(app):
+    dispatcher = NotificationDispatcher(workers=0, queue_size=1, session=_FakeSession([]))
+    assert dispatcher.enqueue(1, _news(1)) is False  # not running
+
+    dispatcher.start()
+    try:
+        assert dispatcher.enqueue(1, _news(1)) is True
+        assert dispatcher.enqueue(1, _news(1)) is False
+        assert dispatcher.enqueue(2, _news(2)) is False
+    finally:
+        dispatcher.stop()
+
+
+def test_burst_is_coalesced_into_one_digest(app, webhook):
+    ids = save_alerts_and_mark_sent([_news(n) for n in range(5)], queue_notifications=True)
+    session = _FakeSession([])
+    dispatcher = NotificationDispatcher(workers=1, batch_size=10, flush_seconds=0.2, session=session)
+
+    dispatcher.start()
+    try:
+        for n, outbox_id in enumerate(ids):
+            dispatcher.enqueue(outbox_id, _news(n))
+        deadline = time.time() + 5
+        while _outbox_rows() and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        dispatcher.stop()
+
+    assert _outbox_rows() == []
+    assert len(session.posts) == 1
+    assert session.posts[0]["text"].startswith("증권 뉴스 알림 5건")
+    assert dispatcher.get_stats()["messages"] == 1
+
+
+def test_failed_digest_retries_every_item(app, webhook):
+    ids = save_alerts_and_mark_sent([_news(1), _news(2)], queue_notifications=True)
+    dispatcher = NotificationDispatcher(session=_FakeSession([_FakeResponse(500)]))
+
+    dispatcher._deliver([(ids[0], _news(1), 0), (ids[1], _news(2), 1)])
+
+    assert [row["attempts"] for row in _outbox_rows()] == [1, 2]
@@ -0,0 +1,107 @@
+"""Tests for bulk keyword import/export."""
+
+import csv
+import io
+import json
+
+from catch_stock_news import cli
+from catch_stock_news.database import add_keyword, get_keywords, set_keywords_enabled
+from catch_stock_news.keyword_io import (
+    parse_csv, parse_json, import_keywords, export_csv, export_json, normalize_keyword
+)
+
+
+def test_parse_csv_with_header_and_optional_columns():
+    rows = parse_csv("keyword,tag,enabled\n삼성전자,KOSPI,true\n 카카오 \n\n셀트리온,,false\n")
+
+    assert rows == [
+        {"keyword": "삼성전자", "tag": "KOSPI", "enabled": "true"},
+        {"keyword": " 카카오 ", "tag": None, "enabled": None},
+        {"keyword": "셀트리온", "tag": "", "enabled": "false"},
+    ]
+
+
+def test_parse_json_forms():
+    assert parse_json('["삼성전자"]') == [{"keyword": "삼성전자", "tag": None, "enabled": None}]
+    assert parse_json({"keywords": [{"keyword": "카카오", "tag": "KOSPI", "enabled": False}]}) == [
+        {"keyword": "카카오", "tag": "KOSPI", "enabled": False}
+    ]
+
+
+def test_normalize_keyword():
+    assert normalize_keyword("  삼성   전자 ") == "삼성 전자"
+
+
+def test_import_keywords_reports_every_row(app):
+    add_keyword("삼성전자")
+
+    summary = import_keywords(parse_csv(
+        "삼성전자\n카카오,KOSPI\n카카오\n" + "가" * 101 + "\n셀트리온,,maybe\n에코프로,KOSDAQ,false\n"
+    ) + parse_json([" "]), default_tag="watch")
+
+    assert [(r["keyword"], r["status"]) for r in summary["results"]] == [
+        ("삼성전자", "exists"),
+        ("카카오", "added"),
+        ("카카오", "duplicate"),
+        ("가" * 101, "invalid"),
+        ("셀트리온", "invalid"),
+        ("에코프로", "added"),
+        ("", "invalid"),
+    ]
+    assert (summary["added"], summary["exists"], summary["duplicate"], summary["invalid"]) == (2, 1, 1, 3)
+
+    stored = {k["keyword"]: k for k in get_keywords()}
+    assert stored["카카오"]["tag"] == "KOSPI"
+    assert stored["에코프로"]["enabled"] == 0
+    assert stored["에코프로"]["tag"] == "KOSDAQ"
+    assert stored["삼성전자"]["tag"] is None
+
+
+def test_import_thousands_of_keywords(app):
+    rows = [{"keyword": f"종목{n}"} for n in range(3000)]
+
+    summary = import_keywords(rows, default_tag="KOSPI")
+
+    assert summary["added"] == 3000
+    assert len(get_keywords()) == 3000
+
+
+def test_export_round_trip(app):
+    import_keywords([{"keyword": "삼성전자", "tag": "KOSPI"}, {"keyword": "카카오", "enabled": "false"}])
+
+    exported = list(csv.DictReader(io.StringIO("".join(export_csv()))))
+    assert [(r["keyword"], r["tag"], r["enabled"]) for r in exported] == [
+        ("삼성전자", "KOSPI", "true"), ("카카오", "", "false")
+    ]
+
+    data = json.loads("".join(export_json()))
+    assert [(item["keyword"], item["enabled"]) for item in data] == [("삼성전자", True), ("카카오", False)]
+
+
+def test_set_keywords_enabled_by_tag_and_pattern(app):
+    import_keywords([
+        {"keyword": "삼성전자", "tag": "KOSPI"},
+        {"keyword": "LG전자", "tag": "KOSPI"},
+        {"keyword": "에코프로", "tag": "KOSDAQ"},
+    ])
+
+    assert set_keywords_enabled(False, tag="KOSPI") == 2
+    assert set_keywords_enabled(True, pattern="*삼성*") == 1
+    assert set_keywords_enabled(True, tag="KOSPI", pattern="LG*") == 1
+
+    assert sorted(k["keyword"] for k in get_keywords(only_enabled=True)) == ["LG전자", "삼성전자", "에코프로"]
+
+
+def test_cli_import_export_and_toggle(app, tmp_path, capsys):
+    source = tmp_path / "watchlist.csv"
+    source.write_text("keyword,tag\n삼성전자,KOSPI\n에코프로,KOSDAQ\n", encoding="utf-8")
+
+    assert cli.main(["import", str(source)]) == 0
+    assert "추가 2" in capsys.readouterr().out
+
+    assert cli.main(["disable", "--tag", "KOSDAQ"]) == 0
+    assert [k["keyword"] for k in get_keywords(only_enabled=True)] == ["삼성전자"]
+
+    target = tmp_path / "out.json"
+    assert cli.main(["export", "--format", "json", "--output", str(target)]) == 0
+    assert len(json.loads(target.read_text(encoding="utf-8"))) == 2
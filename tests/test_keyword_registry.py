@@ -0,0 +1,72 @@
+"""Tests for the keyword registry."""
+
+import sqlite3
+
+from catch_stock_news import database
+from catch_stock_news.database import (
+    add_keyword, delete_keyword, toggle_keyword, get_keywords, get_keyword_version
+)
+from catch_stock_news.keyword_registry import KeywordRegistry
+
+
+def test_registry_matches_database(app):
+    registry = KeywordRegistry()
+    add_keyword("삼성전자")
+    add_keyword("현대차")
+    toggle_keyword(next(k["id"] for k in get_keywords() if k["keyword"] == "현대차"))
+
+    assert registry.get_keywords() == get_keywords()
+    assert registry.get_keywords(only_enabled=True) == get_keywords(only_enabled=True)
+    assert registry.get_enabled_keywords() == ("삼성전자",)
+    assert registry.get_matcher().match("삼성전자 현대차") == ["삼성전자"]
+
+
+def test_registry_reloads_only_after_changes(app):
+    registry = KeywordRegistry()
+    add_keyword("삼성전자")
+
+    registry.get_keywords()
+    registry.get_enabled_keywords()
+    registry.get_matcher()
+    assert registry.loads == 1
+
+    # Unrelated writes do not reload the keywords
+    database.mark_news_sent("https://n.news.naver.com/1", "뉴스")
+    registry.get_keywords()
+    assert registry.loads == 1
+
+    for change in (
+        lambda: add_keyword("현대차"),
+        lambda: toggle_keyword(get_keywords()[0]["id"]),
+        lambda: delete_keyword(get_keywords()[0]["id"]),
+    ):
+        version = get_keyword_version()
+        change()
+        assert get_keyword_version() > version
+        registry.get_keywords()
+
+    assert registry.loads == 4
+
+
+def test_registry_sees_changes_from_other_connections(app):
+    registry = KeywordRegistry()
+    assert registry.get_enabled_keywords() == ()
+
+    # A separate, unpooled connection stands in for another process
+    conn = sqlite3.connect(database.DATABASE_PATH)
+    conn.execute("INSERT INTO keywords (keyword, enabled) VALUES ('카카오', 1)")
+    conn.commit()
+    conn.close()
+
+    assert registry.get_enabled_keywords() == ("카카오",)
+
+
+def test_registry_follows_database_path(app, tmp_path, monkeypatch):
+    registry = KeywordRegistry()
+    add_keyword("삼성전자")
+    assert registry.get_enabled_keywords() == ("삼성전자",)
+
+    monkeypatch.setattr("catch_stock_news.database.DATABASE_PATH", str(tmp_path / "other.db"))
+    database.init_db()
+    assert registry.get_enabled_keywords() == ()
+    registry.close()
@@ -0,0 +1,47 @@
+"""Tests for the multi-keyword matcher."""
+
+import random
+
+from catch_stock_news.matcher import KeywordMatcher, get_matcher
+
+
+def _naive_match(text, keywords):
+    return [keyword for keyword in keywords if keyword.lower() in text.lower()]
+
+
+def test_match_basic():
+    matcher = KeywordMatcher(["삼성전자", "현대차", "LG"])
+    assert matcher.match("삼성전자 LG전자 실적 비교") == ["삼성전자", "LG"]
+    assert matcher.match("날씨 정보") == []
+
+
+def test_match_case_insensitive_and_keyword_order():
+    matcher = KeywordMatcher(["lg전자", "LG", "Lg전자"])
+    assert matcher.match("LG전자 신제품") == ["lg전자", "LG", "Lg전자"]
+
+
+def test_match_overlapping_keywords():
+    matcher = KeywordMatcher(["he", "she", "his", "hers"])
+    assert matcher.match("ushers") == ["he", "she", "hers"]
+
+
+def test_match_empty_keyword_matches_everything():
+    matcher = KeywordMatcher(["", "없음"])
+    assert matcher.match("아무 제목") == [""]
+
+
+def test_match_parity_with_naive_substring_search():
+    rng = random.Random(42)
+    alphabet = "가나다라abAB "
+    keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(200)]
+    matcher = KeywordMatcher(keywords)
+
+    for _ in range(500):
+        title = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert matcher.match(title) == _naive_match(title, keywords)
+
+
+def test_get_matcher_rebuilds_only_on_change():
+    first = get_matcher(["삼성전자", "현대차"])
+    assert get_matcher(["삼성전자", "현대차"]) is first
+    assert get_matcher(["삼성전자"]) is not first
@@ -0,0 +1,52 @@
+"""Tests for the Prometheus metrics module."""
+
+import pytest
+
+from catch_stock_news.metrics import Counter, Gauge, Histogram
+
+
+def test_counter_and_gauge_render():
+    counter = Counter("test_items_total", "Items.", ["outcome"])
+    counter.inc(outcome="matched")
+    counter.inc(2, outcome="matched")
+    counter.inc(outcome='a"b')
+    gauge = Gauge("test_last_seconds", "Last duration.")
+    gauge.set(0.25)
+
+    assert counter.get(outcome="matched") == 3
+    assert counter.render().splitlines() == [
+        "# HELP test_items_total Items.",
+        "# TYPE test_items_total counter",
+        'test_items_total{outcome="a\\"b"} 1',
+        'test_items_total{outcome="matched"} 3',
+    ]
+    assert gauge.render().splitlines()[-1] == "test_last_seconds 0.25"
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("test_seconds", "Durations.", ["stage"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, stage="fetch")
+
+    lines = histogram.render().splitlines()[2:]
+    assert lines == [
+        'test_seconds_bucket{stage="fetch",le="0.1"} 2',
+        'test_seconds_bucket{stage="fetch",le="1"} 3',
+        'test_seconds_bucket{stage="fetch",le="+Inf"} 4',
+        'test_seconds_sum{stage="fetch"} 3.65',
+        'test_seconds_count{stage="fetch"} 4',
+    ]
+
+
+def test_histogram_time_records_failures():
+    histogram = Histogram("test_block_seconds", "Blocks.")
+    with pytest.raises(RuntimeError):
+        with histogram.time():
+            raise RuntimeError("boom")
+    assert histogram.get_count() == 1
+
+
+def test_labels_must_match():
+    counter = Counter("test_labeled_total", "Labeled.", ["result"])
+    with pytest.raises(ValueError):
+        counter.inc(outcome="ok")
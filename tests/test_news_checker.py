@@ -1,6 +1,25 @@
 """Tests for news checker service."""
 
-from catch_stock_news.services.news_checker import is_notification_time
+import pytest
+
+from catch_stock_news import database
+from catch_stock_news.config import reload_config
+from catch_stock_news.database import add_keyword, get_alerts, mark_news_sent
+from catch_stock_news.models import NewsItem
+from catch_stock_news.services import news_checker
+from catch_stock_news.services.news_checker import check_news_job, is_notification_time
+
+
+def _stream(pages, incomplete=(), failed=None):
+    """Fake stream_news yielding (feed, items) pages and filling in the fetch result."""
+    def stream_news(feeds, result=None, **kwargs):
+        yield from pages
+        for feed, _ in pages:
+            if feed not in result.polled:
+                result.polled.append(feed)
+        result.incomplete.update(incomplete)
+        result.failed.update(failed or {})
+    return stream_news
 
 
 def test_notification_time_no_window(monkeypatch):
@@ -8,6 +27,7 @@ def test_notification_time_no_window(monkeypatch):
     monkeypatch.delenv("NOTIFICATION_START_TIME", raising=False)
     monkeypatch.delenv("NOTIFICATION_END_TIME", raising=False)
     monkeypatch.setenv("ENABLE_WEEKEND_NOTIFICATIONS", "true")
+    reload_config()
     assert is_notification_time() is True
 
 
@@ -16,4 +36,264 @@ def test_notification_time_invalid_format(monkeypatch):
     monkeypatch.setenv("NOTIFICATION_START_TIME", "invalid")
     monkeypatch.setenv("NOTIFICATION_END_TIME", "also-invalid")
     monkeypatch.setenv("ENABLE_WEEKEND_NOTIFICATIONS", "true")
+    reload_config()
     assert is_notification_time() is True
+
+
+def test_check_news_job_dedups_and_records_in_one_batch(app, monkeypatch):
+    add_keyword("삼성전자")
+    mark_news_sent("https://n.news.naver.com/sent", "삼성전자 이미 보낸 뉴스")
+
+    items = [
+        NewsItem(title="삼성전자 이미 보낸 뉴스", url="https://n.news.naver.com/sent", time="12:00"),
+        NewsItem(title="삼성전자 실적 발표 예정", url="https://n.news.naver.com/1", time="12:01"),
+        NewsItem(title="삼성전자 실적 발표 예정!", url="https://n.news.naver.com/2", time="12:02"),
+        NewsItem(title="현대차 신차 출시", url="https://n.news.naver.com/3", time="12:03"),
+    ]
+    monkeypatch.setattr(news_checker, "stream_news", _stream([("realtime", items)]))
+    monkeypatch.setattr(news_checker, "is_notification_time", lambda: True)
+    queued = []
+    monkeypatch.setattr(
+        news_checker.dispatcher, "enqueue",
+        lambda outbox_id, news: queued.append((outbox_id, news.url))
+    )
+
+    batches = []
+    original = database.save_alerts_and_mark_sent
+
+    def save(news_list, queue_notifications=False):
+        batches.append(len(news_list))
+        return original(news_list, queue_notifications)
+
+    monkeypatch.setattr(news_checker, "save_alerts_and_mark_sent", save)
+
+    check_news_job()
+
+    assert [url for _, url in queued] == ["https://n.news.naver.com/1"]
+    assert [row["id"] for row in database.get_due_notifications(float("inf"))] == [queued[0][0]]
+    assert batches == [1]
+    assert [alert["url"] for alert in get_alerts()] == ["https://n.news.naver.com/1"]
+
+
+def test_check_news_job_exports_cycle_metrics(app, monkeypatch):
+    from catch_stock_news import metrics
+
+    add_keyword("삼성전자")
+    mark_news_sent("https://n.news.naver.com/sent", "삼성전자 이미 보낸 뉴스")
+    items = [
+        NewsItem(title="삼성전자 이미 보낸 뉴스", url="https://n.news.naver.com/sent", time="12:00"),
+        NewsItem(title="삼성전자 신규 투자", url="https://n.news.naver.com/1", time="12:01"),
+        NewsItem(title="현대차 신차 출시", url="https://n.news.naver.com/2", time="12:02"),
+    ]
+    monkeypatch.setattr(news_checker, "stream_news", _stream([("realtime", items)]))
+    monkeypatch.setattr(news_checker, "is_notification_time", lambda: True)
+    monkeypatch.setattr(news_checker.dispatcher, "enqueue", lambda outbox_id, news: True)
+
+    ok_cycles = metrics.CYCLES.get(result="ok")
+    matches = metrics.STAGE_DURATION.get_count(stage="match")
+
+    check_news_job()
+
+    assert metrics.CYCLES.get(result="ok") == ok_cycles + 1
+    assert metrics.STAGE_DURATION.get_count(stage="match") == matches + 1
+    assert {outcome: metrics.LAST_CYCLE_ITEMS.get(outcome=outcome)
+            for outcome in ("fetched", "matched", "duplicate", "queued")} == {
+        "fetched": 3, "matched": 2, "duplicate": 1, "queued": 1
+    }
+    assert metrics.LAST_CYCLE_DURATION.get() > 0
+
+
+def test_check_news_job_keeps_a_checkpoint_per_feed(app, monkeypatch):
+    add_keyword("005930")
+    add_keyword("반도체")
+    monkeypatch.setenv("NEWS_FEEDS", "realtime,tickers")
+    monkeypatch.setenv("INCREMENTAL_SCRAPING", "true")
+    reload_config()
+
+    polled = []
+    stream = _stream([
+        ("realtime", [NewsItem(title="반도체 수출 증가", url="https://n.news.naver.com/r1", time="", feed="realtime")]),
+        ("ticker:005930", [NewsItem(title="외국인 순매수", url="https://n.news.naver.com/t1", time="",
+                                    feed="ticker:005930")]),
+    ])
+
+    def stream_news(feeds, **kwargs):
+        polled.append([feed.name for feed in feeds])
+        return stream(feeds, **kwargs)
+
+    monkeypatch.setattr(news_checker, "stream_news", stream_news)
+    monkeypatch.setattr(news_checker, "is_notification_time", lambda: False)
+
+    check_news_job()
+
+    assert polled == [["realtime", "ticker:005930"]]
+    assert database.get_scrape_checkpoint("realtime") == ["https://n.news.naver.com/r1"]
+    assert database.get_scrape_checkpoint("ticker:005930") == ["https://n.news.naver.com/t1"]
+    assert {alert["url"]: alert["matched_keywords"] for alert in get_alerts()} == {
+        "https://n.news.naver.com/r1": "반도체",
+        "https://n.news.naver.com/t1": "005930",
+    }
+
+
+def test_check_news_job_keeps_checkpoint_of_incomplete_feed(app, monkeypatch):
+    add_keyword("반도체")
+    monkeypatch.setenv("INCREMENTAL_SCRAPING", "true")
+    reload_config()
+    database.save_scrape_checkpoints({"realtime": ["https://n.news.naver.com/old"]}, database.get_keyword_version())
+    items = [NewsItem(title="반도체 수출 증가", url="https://n.news.naver.com/r1", time="", feed="realtime")]
+    monkeypatch.setattr(news_checker, "stream_news", _stream([("realtime", items)], incomplete={"realtime"}))
+    monkeypatch.setattr(news_checker, "is_notification_time", lambda: False)
+
+    assert check_news_job() == "ok"
+
+    # The partial page results are processed, but the failed pages are fetched again next time
+    assert [alert["url"] for alert in get_alerts()] == ["https://n.news.naver.com/r1"]
+    assert database.get_scrape_checkpoint("realtime") == ["https://n.news.naver.com/old"]
+
+
+def test_check_news_job_does_not_notify_per_cycle_when_sources_fail(app, monkeypatch):
+    add_keyword("반도체")
+    monkeypatch.setattr(news_checker, "stream_news", _stream([], failed={"realtime": "Circuit open"}))
+    notified = []
+    monkeypatch.setattr(news_checker, "send_error_notification", lambda *args: notified.append(args))
+
+    assert check_news_job() == "error"
+    assert check_news_job() == "error"
+    assert notified == []
+
+
+def test_source_outage_sends_one_error_notification(app, monkeypatch):
+    import requests
+    from catch_stock_news import scraper
+
+    add_keyword("반도체")
+    monkeypatch.setenv("BREAKER_FAILURE_THRESHOLD", "2")
+    reload_config()
+    monkeypatch.setattr(scraper, "_feed_polled_at", {})
+    requests_sent = []
+
+    class Session:
+        def get(self, url, headers=None, timeout=None):
+            requests_sent.append(url)
+            raise requests.ConnectionError("down")
+
+    monkeypatch.setattr(scraper, "get_session", lambda: Session())
+    notified = []
+    monkeypatch.setattr(news_checker, "send_error_notification", lambda *args: notified.append(args))
+
+    for _ in range(4):
+        assert check_news_job() == "error"
+
+    # Two failures open the breaker; later cycles skip the network
+    assert len(requests_sent) == 2
+    assert len(notified) == 1
+    assert "finance.naver.com" in notified[0][0]
+
+
+@pytest.mark.parametrize("status_code", [401, 403])
+def test_blocked_source_sends_one_error_notification_per_outage(app, monkeypatch, status_code):
+    import requests
+    from catch_stock_news import scraper
+
+    add_keyword("반도체")
+    monkeypatch.setenv("BREAKER_FAILURE_THRESHOLD", "2")
+    monkeypatch.setenv("BREAKER_COOLDOWN_SECONDS", "0")  # Probe again on every cycle
+    monkeypatch.setenv("MAX_PAGES", "1")  # One request per cycle, so a probe is never refused mid-listing
+    reload_config()
+    monkeypatch.setattr(scraper, "_feed_polled_at", {})
+    status = [status_code]
+
+    class Response:
+        headers = {}
+        content = b"<dl></dl>"
+        encoding = None
+        text = "<dl></dl>"
+
+        def __init__(self):
+            self.status_code = status[0]
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.HTTPError(f"{self.status_code} Client Error")
+
+    class Session:
+        def get(self, url, headers=None, timeout=None):
+            return Response()
+
+    monkeypatch.setattr(scraper, "get_session", lambda: Session())
+    notified = []
+    monkeypatch.setattr(news_checker, "send_error_notification", lambda *args: notified.append(args))
+
+    for _ in range(5):
+        assert check_news_job() == "error"
+    assert len(notified) == 1
+    assert f"HTTP {status_code}" in notified[0][1]
+
+    # Failed probes do not notify again. The source recovers, then starts refusing again: a new outage
+    status[0] = 200
+    assert check_news_job() == "ok"
+    status[0] = status_code
+    for _ in range(5):
+        check_news_job()
+    assert len(notified) == 2
+
+
+def test_check_news_job_scans_in_full_after_keywords_change(app, monkeypatch):
+    add_keyword("반도체")
+    monkeypatch.setenv("INCREMENTAL_SCRAPING", "true")
+    reload_config()
+    stop_at = []
+
+    def stream_news(feeds, result=None, **kwargs):
+        stop_at.append(kwargs["stop_at"]["realtime"])
+        yield "realtime", [NewsItem(title="2차전지 증설", url="https://n.news.naver.com/1", time="", feed="realtime")]
+        result.polled.append("realtime")
+
+    monkeypatch.setattr(news_checker, "stream_news", stream_news)
+    monkeypatch.setattr(news_checker, "is_notification_time", lambda: False)
+
+    check_news_job()
+    check_news_job()
+    # An article behind the checkpoint was never matched against a new keyword
+    add_keyword("2차전지")
+    check_news_job()
+    check_news_job()
+
+    assert stop_at == [[], ["https://n.news.naver.com/1"], [], ["https://n.news.naver.com/1"]]
+    assert [alert["url"] for alert in get_alerts()] == ["https://n.news.naver.com/1"]
+
+
+def test_incremental_scraping_is_off_by_default(app, monkeypatch):
+    add_keyword("반도체")
+    database.save_scrape_checkpoints({"realtime": ["https://n.news.naver.com/old"]}, database.get_keyword_version())
+    stop_at = []
+
+    def stream_news(feeds, result=None, **kwargs):
+        stop_at.append(kwargs["stop_at"])
+        yield from ()
+
+    monkeypatch.setattr(news_checker, "stream_news", stream_news)
+    check_news_job()
+    assert stop_at == [{}]
+
+
+def test_check_news_job_notifies_each_page_before_fetching_the_next(app, monkeypatch):
+    add_keyword("반도체")
+    monkeypatch.setenv("INCREMENTAL_SCRAPING", "true")
+    reload_config()
+    events = []
+
+    def stream_news(feeds, result=None, **kwargs):
+        for page, title in ((1, "반도체 수출 사상 최대"), (2, "반도체 장비 국산화 속도")):
+            events.append(f"fetched page {page}")
+            yield "realtime", [NewsItem(title=title, url=f"https://n.news.naver.com/{page}", time="", feed="realtime")]
+        result.polled.append("realtime")
+
+    monkeypatch.setattr(news_checker, "stream_news", stream_news)
+    monkeypatch.setattr(news_checker, "is_notification_time", lambda: True)
+    monkeypatch.setattr(news_checker.dispatcher, "enqueue",
+                        lambda outbox_id, news: events.append(f"queued {news.url[-1]}"))
+
+    assert check_news_job() == "ok"
+    assert events == ["fetched page 1", "queued 1", "fetched page 2", "queued 2"]
+    assert database.get_scrape_checkpoint("realtime") == ["https://n.news.naver.com/1", "https://n.news.naver.com/2"]
@@ -1,6 +1,12 @@
 """Tests for notifier module."""
 
-from catch_stock_news.notifier import get_webhook_url
+import pytest
+
+from catch_stock_news import notifier
+from catch_stock_news.notifier import (
+    get_webhook_url, build_digest_message, send_batch_notification,
+    MAX_DIGEST_ITEMS, MAX_MESSAGE_BLOCKS
+)
 
 
 def test_get_webhook_url_empty(monkeypatch):
@@ -11,3 +17,70 @@ def test_get_webhook_url_empty(monkeypatch):
 def test_get_webhook_url_set(monkeypatch):
     monkeypatch.setenv("SLACK_WEBHOOK_URL", "https://hooks.slack.com/test")
     assert get_webhook_url() == "https://hooks.slack.com/test"
+
+
+def _news(n, keywords=("삼성전자",)):
+    return {
+        "title": f"뉴스 {n}",
+        "url": f"https://n.news.naver.com/{n}",
+        "time": "12:00",
+        "source": "연합뉴스",
+        "matched_keywords": list(keywords),
+    }
+
+
+def test_build_digest_message_groups_by_keyword():
+    news_list = [_news(1), _news(2, ["현대차"]), _news(3)]
+    message = build_digest_message(news_list)
+
+    texts = [block["text"]["text"] for block in message["blocks"] if block["type"] == "section"]
+    assert texts[0] == "*🔑 삼성전자*"
+    assert texts[1].startswith("• <https://n.news.naver.com/1|뉴스 1>")
+    assert texts[2].startswith("• <https://n.news.naver.com/3|뉴스 3>")
+    assert texts[3] == "*🔑 현대차*"
+    assert "12:00 · 연합뉴스" in texts[4]
+
+
+def test_build_digest_message_respects_block_limit():
+    news_list = [_news(n, [f"키워드{n}"]) for n in range(MAX_DIGEST_ITEMS)]
+    assert len(build_digest_message(news_list)["blocks"]) <= MAX_MESSAGE_BLOCKS
+
+    with pytest.raises(ValueError):
+        build_digest_message(news_list + [_news(99)])
+
+
+def test_send_batch_notification_packs_items(monkeypatch):
+    monkeypatch.setenv("SLACK_WEBHOOK_URL", "https://hooks.slack.com/test")
+    posts = []
+
+    class _Response:
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(notifier.requests, "post", lambda url, json, timeout: posts.append(json) or _Response())
+
+    news_list = [_news(n) for n in range(MAX_DIGEST_ITEMS + 5)]
+    assert send_batch_notification(news_list) == len(news_list)
+    assert len(posts) == 2
+
+
+def test_messages_accept_matched_news():
+    from catch_stock_news.models import MatchedNews, NewsItem
+
+    matched = MatchedNews(NewsItem(title="뉴스 1", url="https://n.news.naver.com/1", time="12:00",
+                                   source="연합뉴스"), ("삼성전자",))
+    assert notifier.build_news_message(matched) == notifier.build_news_message(_news(1))
+    assert build_digest_message([matched, _news(2)]) == build_digest_message([_news(1), _news(2)])
+
+
+def test_messages_escape_mrkdwn_in_titles():
+    news = dict(_news(1), title="<속보> S&P500 | 나스닥 >1%", source="A&B")
+
+    digest = build_digest_message([news, _news(2)])
+    texts = [block["text"]["text"] for block in digest["blocks"] if block["type"] == "section"]
+    assert texts[1].startswith("• <https://n.news.naver.com/1|&lt;속보&gt; S&amp;P500 ｜ 나스닥 &gt;1%>")
+    assert "12:00 · A&amp;B" in texts[1]
+
+    message = notifier.build_news_message(news)
+    assert message["blocks"][1]["text"]["text"] == "*&lt;속보&gt; S&amp;P500 ｜ 나스닥 &gt;1%*"
+    assert message["text"] == "증권 뉴스 알림: &lt;속보&gt; S&amp;P500 ｜ 나스닥 &gt;1%"
@@ -0,0 +1,98 @@
+"""Parity tests for the HTML parser backends."""
+
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from catch_stock_news.parsers import BACKENDS, available_backends, get_backend
+from catch_stock_news.scraper import _build_items, _parse_news_page
+
+FIXTURE = Path(__file__).parent / "fixtures" / "news_list.html"
+
+
+@pytest.fixture(scope="module")
+def html():
+    return FIXTURE.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def reference_items(html):
+    return _parse_news_page(BeautifulSoup(html, "html.parser"))
+
+
+def test_reference_output(reference_items):
+    assert len(reference_items) == 7
+
+    first = reference_items[0]
+    assert first.title == "삼성전자, 4분기 영업이익 2.8조…시장 기대 하회"
+    assert first.url == "https://n.news.naver.com/mnews/article/015/0005240919"
+    assert first.time == "2024-01-02 15:31"
+    assert first.source == "한국경제"
+
+    # Title falls back to the link text; summary without press keeps an empty source
+    assert reference_items[5].title == "카카오 <공시> 자기주식 처분 결정"
+    assert reference_items[5].source == ""
+
+    # Subject without a following summary
+    assert reference_items[6].time == ""
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backend_parity(backend, html, reference_items):
+    _, parse = get_backend(backend)
+    assert _build_items(parse(html)) == reference_items
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backend_parity_with_source_filter(backend, html):
+    reference = _parse_news_page(BeautifulSoup(html, "html.parser"), ["연합뉴스", "이데일리"])
+    _, parse = get_backend(backend)
+    assert _build_items(parse(html), ["연합뉴스", "이데일리"]) == reference
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backend_empty_document(backend):
+    _, parse = get_backend(backend)
+    assert parse("") == []
+    assert parse("<html><body><p>점검 중</p></body></html>") == []
+
+
+def test_get_backend_auto_picks_fastest_available():
+    name, _ = get_backend("auto")
+    assert name == available_backends()[0]
+
+
+def test_get_backend_unknown_falls_back():
+    name, parse = get_backend("no-such-parser")
+    assert name == "html.parser"
+    assert parse is BACKENDS["html.parser"]
+
+
+ITEM_NEWS_HTML = """
+<table class="type5">
+  <tr><th>제목</th><th>정보제공</th><th>날짜</th></tr>
+  <tr>
+    <td class="title"><a href="/item/news_read.naver?article_id=0000000009&office_id=008&code=005930" class="tit">삼성전자, 신규 투자 발표</a></td>
+    <td class="info">머니투데이</td>
+    <td class="date">2024.06.03 10:15</td>
+  </tr>
+  <tr class="relation_lst"><td colspan="3"></td></tr>
+</table>
+"""
+
+
+def test_parse_item_news():
+    from catch_stock_news.parsers import parse_item_news
+
+    records = parse_item_news(ITEM_NEWS_HTML)
+    assert records == [(
+        "삼성전자, 신규 투자 발표",
+        "/item/news_read.naver?article_id=0000000009&office_id=008&code=005930",
+        "2024.06.03 10:15",
+        "머니투데이",
+    )]
+
+    items = _build_items(records, feed="ticker:005930")
+    assert items[0].url == "https://n.news.naver.com/mnews/article/008/0000000009"
+    assert items[0].feed == "ticker:005930"
@@ -0,0 +1,29 @@
+"""Tests for request rate limiting."""
+
+from catch_stock_news.ratelimit import TokenBucket
+
+
+def test_token_bucket_allows_burst_then_paces(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("catch_stock_news.ratelimit.time.monotonic", lambda: clock[0])
+    bucket = TokenBucket(rate=2, capacity=2)
+
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0.5
+
+    clock[0] += 0.5
+    assert bucket.try_acquire() == 0
+
+
+def test_zero_rate_is_unlimited():
+    bucket = TokenBucket(rate=0)
+    for _ in range(100):
+        assert bucket.acquire() == 0
+
+
+def test_host_limiters_are_independent():
+    from catch_stock_news.ratelimit import get_host_limiter
+
+    assert get_host_limiter("a.example") is get_host_limiter("a.example")
+    assert get_host_limiter("a.example") is not get_host_limiter("b.example")
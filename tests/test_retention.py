@@ -0,0 +1,115 @@
+"""Tests for retention and compaction."""
+
+import gzip
+import json
+
+from catch_stock_news import database, retention
+from catch_stock_news.config import reload_config
+from catch_stock_news.database import (
+    add_keyword, save_alert, mark_news_sent, is_news_sent, get_alerts, get_connection, search_alerts
+)
+
+
+def _age(table: str, column: str, days: int, where: str = "1") -> None:
+    conn = get_connection()
+    conn.execute(f"UPDATE {table} SET {column} = datetime('now', '-{days} days') WHERE {where}")
+    conn.commit()
+    conn.close()
+
+
+def test_cleanup_old_sent_news_in_batches(app):
+    for n in range(7):
+        mark_news_sent(f"https://example.com/{n}", f"뉴스 {n}")
+    _age("sent_news", "sent_at", 10, "id <= 5")
+
+    assert database.cleanup_old_sent_news(days=7, batch_size=2) == 5
+    assert is_news_sent("https://example.com/6") is True
+    assert is_news_sent("https://example.com/0") is False
+
+
+def test_prune_alerts_archives_by_month(app, tmp_path):
+    add_keyword("삼성")
+    old_id = save_alert("삼성전자 오래된 뉴스", "https://a.com/old", ["삼성"], "09:00")
+    save_alert("삼성전자 새 뉴스", "https://a.com/new", ["삼성"], "10:00")
+    conn = get_connection()
+    conn.execute("UPDATE alerts SET created_at = '2024-01-15 03:00:00' WHERE id = ?", (old_id,))
+    conn.commit()
+    conn.close()
+
+    archive_dir = tmp_path / "archive"
+    result = retention.prune_alerts(days=30, archive_dir=str(archive_dir), batch_size=1)
+    assert result == {"archived": 1, "deleted": 1}
+
+    assert [a["title"] for a in get_alerts()] == ["삼성전자 새 뉴스"]
+    assert [a["title"] for a in search_alerts("오래된")["alerts"]] == []
+
+    conn = get_connection()
+    links = conn.execute("SELECT count(*) FROM alert_keywords WHERE alert_id = ?", (old_id,)).fetchone()[0]
+    conn.close()
+    assert links == 0
+
+    # A second run appends another gzip member to the same monthly file
+    retention.archive_alerts([{"id": 99, "title": "추가", "created_at": "2024-01-20 00:00:00"}], str(archive_dir))
+    with gzip.open(archive_dir / "alerts-2024-01.jsonl.gz", "rt", encoding="utf-8") as f:
+        archived = [json.loads(line) for line in f]
+    assert [a["title"] for a in archived] == ["삼성전자 오래된 뉴스", "추가"]
+    assert archived[0]["matched_keywords"] == "삼성"
+
+
+def test_run_retention_uses_config(app, monkeypatch):
+    save_alert("오래된 알림", "https://a.com/1", [], "09:00")
+    _age("alerts", "created_at", 100)
+    mark_news_sent("https://example.com/old", "오래된 뉴스")
+    _age("sent_news", "sent_at", 10)
+
+    # Alerts are kept by default
+    result = retention.run_retention()
+    assert result["sent_news_deleted"] == 1
+    assert result["alerts_deleted"] == 0
+    assert len(get_alerts()) == 1
+    assert retention.get_last_run() == result
+
+    monkeypatch.setenv("ALERT_RETENTION_DAYS", "90")
+    reload_config()
+    result = retention.run_retention()
+    assert result["alerts_deleted"] == 1
+    assert result["alerts_archived"] == 0
+    assert get_alerts() == []
+
+
+def test_compact_database_reclaims_free_pages(app):
+    for n in range(300):
+        save_alert("긴 제목 " * 50, f"https://a.com/{n}", [], "09:00")
+    database.clear_all_alerts()
+
+    result = database.compact_database()
+    assert result["incremental"] is True
+    assert result["freed_pages"] > 0
+    assert result["free_pages"] == 0
+
+
+def test_run_retention_skips_overlapping_runs(app):
+    assert retention._run_lock.acquire(blocking=False)
+    try:
+        assert retention.run_retention() == {"skipped": True}
+    finally:
+        retention._run_lock.release()
+
+
+def test_vacuum_converts_legacy_database(tmp_path, monkeypatch):
+    import sqlite3
+
+    from catch_stock_news import cli
+
+    db_path = str(tmp_path / "legacy.db")
+    legacy = sqlite3.connect(db_path)
+    legacy.execute("CREATE TABLE legacy (id INTEGER PRIMARY KEY)")
+    legacy.commit()
+    legacy.close()
+    monkeypatch.setattr("catch_stock_news.database.DATABASE_PATH", db_path)
+
+    assert cli.main(["vacuum"]) == 0
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    conn.close()
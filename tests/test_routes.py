@@ -12,9 +12,13 @@ def test_status_endpoint(client):
     assert resp.status_code == 200
     data = resp.get_json()
     assert "scheduler_running" in data
+    assert data["schedule"]["mode"] == "fixed"
+    assert data["schedule"]["effective_interval_seconds"] == 60
     assert "webhook_configured" in data
     assert "keyword_count" in data
     assert "is_notification_time" in data
+    assert "page_cache" in data
+    assert "notifications" in data
 
 
 def test_add_keyword(client):
@@ -90,3 +94,126 @@ def test_clear_alerts(client):
     resp = client.delete("/alerts")
     assert resp.status_code == 200
     assert "삭제" in resp.get_json()["message"]
+
+
+def test_config_reload(client, monkeypatch):
+    monkeypatch.setenv("CHECK_INTERVAL_MINUTES", "7")
+    resp = client.post("/config/reload")
+    assert resp.status_code == 200
+    assert resp.get_json()["check_interval"] == 7
+    assert client.get("/status").get_json()["check_interval"] == 7
+
+
+def test_config_reload_rejects_invalid_values(client, monkeypatch):
+    monkeypatch.setenv("CHECK_INTERVAL_MINUTES", "often")
+    resp = client.post("/config/reload")
+    assert resp.status_code == 400
+
+
+def test_import_and_export_keywords(client):
+    import io
+
+    resp = client.post(
+        "/keywords/import",
+        data={"file": (io.BytesIO("삼성전자\n카카오\n삼성전자\n".encode("utf-8")), "list.csv"), "tag": "KOSPI"},
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert (data["added"], data["duplicate"]) == (2, 1)
+
+    resp = client.post("/keywords/import", json=[{"keyword": "카카오"}, {"keyword": "셀트리온"}])
+    assert (resp.get_json()["added"], resp.get_json()["exists"]) == (1, 1)
+
+    resp = client.get("/keywords/export")
+    assert resp.mimetype == "text/csv"
+    assert resp.get_data(as_text=True).splitlines()[1].startswith("삼성전자,KOSPI,true")
+
+    resp = client.get("/keywords/export?format=json")
+    assert len(resp.get_json()) == 3
+
+
+def test_bulk_toggle_keywords(client):
+    client.post("/keywords/import", json=[{"keyword": "삼성전자", "tag": "KOSPI"}, {"keyword": "카카오"}])
+
+    resp = client.post("/keywords/bulk-toggle", json={"enabled": False, "tag": "KOSPI"})
+    assert resp.get_json()["updated"] == 1
+    assert [k["keyword"] for k in client.get("/keywords").get_json() if k["enabled"]] == ["카카오"]
+
+    assert client.post("/keywords/bulk-toggle", json={"enabled": False}).status_code == 400
+
+
+def test_alerts_page_endpoint(client):
+    from catch_stock_news.database import save_alert
+
+    for n in range(25):
+        save_alert(f"뉴스 {n}", f"https://n.news.naver.com/{n}", ["삼성전자"], "12:00", "연합뉴스")
+
+    first = client.get("/alerts/page").get_json()
+    assert len(first["alerts"]) == 20
+    second = client.get(f"/alerts/page?cursor={first['next_cursor']}").get_json()
+    assert len(second["alerts"]) == 5
+    assert second["next_cursor"] is None
+    assert {a["id"] for a in first["alerts"]}.isdisjoint(a["id"] for a in second["alerts"])
+
+    assert len(client.get("/alerts/page?keyword=현대차").get_json()["alerts"]) == 0
+    assert client.get("/alerts/page?cursor=bogus").status_code == 400
+    assert client.get("/alerts/page?since=yesterday").status_code == 400
+
+    page = client.get("/").data.decode("utf-8")
+    assert page.count('class="alert-item"') == 20
+    assert 'id="loadMoreAlerts"' in page
+
+
+def test_keyword_stats_and_alerts(client):
+    from catch_stock_news.database import save_alert
+
+    client.post("/keywords", json={"keyword": "삼성전자"})
+    keyword_id = client.get("/keywords").get_json()[0]["id"]
+    for n in range(3):
+        save_alert(f"뉴스 {n}", f"https://n.news.naver.com/{n}", ["삼성전자"], "12:00")
+
+    stats = client.get("/keywords/stats").get_json()
+    assert stats[0]["keyword"] == "삼성전자" and stats[0]["hits"] == 3
+
+    recent = client.get(f"/keywords/{keyword_id}/alerts?limit=2").get_json()
+    assert [a["title"] for a in recent] == ["뉴스 2", "뉴스 1"]
+    older = client.get(f"/keywords/{keyword_id}/alerts?before_id={recent[-1]['id']}").get_json()
+    assert [a["title"] for a in older] == ["뉴스 0"]
+
+
+def test_alerts_search_endpoint(client):
+    from catch_stock_news.database import save_alert
+
+    save_alert("삼성전자 실적 발표", "https://n.news.naver.com/1", ["삼성전자"], "12:00")
+
+    data = client.get("/alerts/search?q=실적 발표").get_json()
+    assert [a["title"] for a in data["alerts"]] == ["삼성전자 실적 발표"]
+    assert data["next_offset"] is None
+    assert client.get("/alerts/search?q=").status_code == 400
+
+
+def test_metrics_endpoint(client):
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/plain"
+    body = resp.get_data(as_text=True)
+    assert "# TYPE news_stage_duration_seconds histogram" in body
+    assert "# TYPE news_cycles_total counter" in body
+
+
+def test_check_now_returns_pollable_run(client, monkeypatch):
+    from catch_stock_news.runner import cycle_runner
+
+    monkeypatch.setattr(cycle_runner, "job_func", lambda: "skipped")
+
+    resp = client.post("/check-now")
+    assert resp.status_code == 202
+    run_id = resp.get_json()["run"]["id"]
+
+    cycle_runner.wait(run_id, timeout=5)
+    run = client.get(f"/check-now/{run_id}").get_json()
+    assert run["status"] == "done"
+    assert run["result"] == "skipped"
+
+    assert client.get("/check-now/unknown").status_code == 404
@@ -0,0 +1,101 @@
+"""Tests for the single-flight cycle runner."""
+
+import threading
+
+from catch_stock_news.runner import CycleRunner
+
+
+class _BlockingJob:
+    """Job that blocks until released, counting how often it ran."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls = 0
+        self.concurrent = 0
+        self.max_concurrent = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            self.concurrent += 1
+            self.max_concurrent = max(self.max_concurrent, self.concurrent)
+        self.started.set()
+        self.release.wait(5)
+        with self._lock:
+            self.concurrent -= 1
+        return "ok"
+
+
+def test_manual_trigger_runs_in_background():
+    job = _BlockingJob()
+    job.release.set()
+    runner = CycleRunner(job)
+
+    run, started = runner.trigger()
+    assert started is True
+    finished = runner.wait(run["id"], timeout=5)
+
+    assert finished["status"] == "done"
+    assert finished["result"] == "ok"
+    assert finished["duration_seconds"] is not None
+    assert runner.get_stats()["running"] is None
+    assert job.calls == 1
+
+
+def test_triggers_during_a_run_coalesce_into_one_follow_up():
+    job = _BlockingJob()
+    runner = CycleRunner(job)
+
+    first, _ = runner.trigger()
+    assert job.started.wait(5)
+
+    queued, started = runner.trigger()
+    again, started_again = runner.trigger()
+    assert started is False and started_again is False
+    assert again["id"] == queued["id"]
+    assert queued["status"] == "queued"
+
+    # A scheduled tick during the run is skipped instead of overlapping
+    assert runner.run_scheduled() is None
+
+    job.release.set()
+    assert runner.wait(queued["id"], timeout=5)["status"] == "done"
+
+    assert job.calls == 2
+    assert job.max_concurrent == 1
+    stats = runner.get_stats()
+    assert stats["overlaps_skipped"] == 1
+    assert stats["coalesced"] == 1
+    assert stats["runs"] == 2
+
+
+def test_scheduled_run_executes_queued_manual_run_after_it():
+    job = _BlockingJob()
+    runner = CycleRunner(job)
+
+    thread = threading.Thread(target=runner.run_scheduled)
+    thread.start()
+    assert job.started.wait(5)
+
+    queued, started = runner.trigger()
+    assert started is False
+
+    job.release.set()
+    thread.join(5)
+    assert runner.get_run(queued["id"])["status"] == "done"
+    assert job.calls == 2
+
+
+def test_failed_run_is_reported():
+    def job():
+        raise RuntimeError("boom")
+
+    runner = CycleRunner(job)
+    run_id = runner.run_scheduled()
+
+    run = runner.get_run(run_id)
+    assert run["status"] == "failed"
+    assert run["result"] == "error"
+    assert runner.get_run("unknown") is None
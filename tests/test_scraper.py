@@ -1,6 +1,16 @@
 """Tests for scraper module."""
 
-from catch_stock_news.scraper import convert_to_direct_news_url, find_matching_news
+import threading
+
+import pytest
+import requests
+
+from catch_stock_news import scraper
+from catch_stock_news.scraper import (
+    convert_to_direct_news_url, fetch_realtime_news, find_matching_news, get_session,
+    clear_page_cache, get_page_cache_stats, fetch_news, merge_feed_items
+)
+from catch_stock_news.sources import REALTIME_FEED, resolve_feeds
 from catch_stock_news.models import NewsItem
 
 
@@ -34,9 +44,10 @@ def test_find_matching_news_basic():
     matched = find_matching_news(items, ["삼성전자", "현대차"])
 
     assert len(matched) == 2
-    assert matched[0]["title"] == "삼성전자 실적 발표"
-    assert matched[0]["matched_keywords"] == ["삼성전자"]
-    assert matched[1]["matched_keywords"] == ["현대차"]
+    assert matched[0].title == "삼성전자 실적 발표"
+    assert matched[0].item is items[0]
+    assert matched[0].matched_keywords == ("삼성전자",)
+    assert matched[1].matched_keywords == ("현대차",)
 
 
 def test_find_matching_news_case_insensitive():
@@ -53,7 +64,7 @@ def test_find_matching_news_multiple_keywords():
     ]
     matched = find_matching_news(items, ["삼성전자", "LG전자"])
     assert len(matched) == 1
-    assert set(matched[0]["matched_keywords"]) == {"삼성전자", "LG전자"}
+    assert set(matched[0].matched_keywords) == {"삼성전자", "LG전자"}
 
 
 def test_find_matching_news_no_match():
@@ -62,3 +73,246 @@ def test_find_matching_news_no_match():
     ]
     matched = find_matching_news(items, ["삼성전자"])
     assert matched == []
+
+
+def _fake_pages(pages):
+    """Build a _fetch_page replacement serving items from a {page: titles} map."""
+    requested = []
+    lock = threading.Lock()
+
+    def fetch_page(page, allowed_sources=None, parser="auto"):
+        with lock:
+            requested.append(page)
+        return [
+            NewsItem(title=title, url=f"https://n.news.naver.com/{title}", time="12:00")
+            for title in pages.get(page, [])
+        ]
+
+    return fetch_page, requested
+
+
+def test_fetch_realtime_news_merges_pages_in_order(monkeypatch):
+    fetch_page, _ = _fake_pages({1: ["a", "b"], 2: ["b", "c"], 3: ["d"]})
+    monkeypatch.setattr(scraper, "_fetch_page", fetch_page)
+
+    items = fetch_realtime_news(max_pages=3, max_workers=3)
+    assert [item.title for item in items] == ["a", "b", "c", "d"]
+
+
+def test_fetch_realtime_news_stops_at_empty_page(monkeypatch):
+    fetch_page, requested = _fake_pages({1: ["a"], 2: [], 3: ["c"], 4: ["d"]})
+    monkeypatch.setattr(scraper, "_fetch_page", fetch_page)
+
+    items = fetch_realtime_news(max_pages=10, max_workers=2)
+    assert [item.title for item in items] == ["a"]
+    assert max(requested) <= 3
+
+
+def test_get_session_is_shared():
+    assert get_session() is get_session()
+
+
+def test_fetch_realtime_news_incremental_stops_at_seen(monkeypatch):
+    fetch_page, requested = _fake_pages({1: ["new1", "new2", "old1", "old2"], 2: ["old3"]})
+    monkeypatch.setattr(scraper, "_fetch_page", fetch_page)
+
+    items = fetch_realtime_news(
+        max_pages=5, max_workers=4, stop_at_urls=["https://n.news.naver.com/old1"]
+    )
+    assert [item.title for item in items] == ["new1", "new2"]
+    assert requested == [1]
+
+
+def test_fetch_realtime_news_incremental_goes_deeper_when_page_is_new(monkeypatch):
+    fetch_page, requested = _fake_pages({1: ["a", "b"], 2: ["c", "seen"], 3: ["d"]})
+    monkeypatch.setattr(scraper, "_fetch_page", fetch_page)
+
+    items = fetch_realtime_news(
+        max_pages=5, max_workers=1, stop_at_urls=["https://n.news.naver.com/seen"]
+    )
+    assert [item.title for item in items] == ["a", "b", "c"]
+    assert requested == [1, 2]
+
+
+PAGE_HTML = """
+<dl>
+  <dd class="articleSubject"><a href="/news/news_read.naver?article_id=0000000001&office_id=015" title="캐시 테스트 뉴스">캐시 테스트 뉴스</a></dd>
+  <dd class="articleSummary">요약 <span class="press">한국경제</span> <span class="wdate">2024-01-01 12:00</span></dd>
+</dl>
+""".encode("euc-kr")
+
+
+class _FakeResponse:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = None
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8")
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+
+def test_page_cache_reuses_items_for_identical_body(monkeypatch):
+    clear_page_cache()
+    session = _FakeSession([_FakeResponse(content=PAGE_HTML), _FakeResponse(content=PAGE_HTML)])
+    monkeypatch.setattr(scraper, "get_session", lambda: session)
+
+    first = fetch_realtime_news(max_pages=1)
+    second = fetch_realtime_news(max_pages=1)
+
+    assert first == second
+    assert first[0].source == "한국경제"
+    assert get_page_cache_stats() == {"hits": 1, "misses": 1, "not_modified": 0}
+
+
+def test_page_cache_honors_etag(monkeypatch):
+    clear_page_cache()
+    session = _FakeSession([
+        _FakeResponse(content=PAGE_HTML, headers={"ETag": '"v1"'}),
+        _FakeResponse(status_code=304),
+    ])
+    monkeypatch.setattr(scraper, "get_session", lambda: session)
+
+    first = fetch_realtime_news(max_pages=1)
+    second = fetch_realtime_news(max_pages=1)
+
+    assert first == second
+    assert session.requests[1]["If-None-Match"] == '"v1"'
+    assert get_page_cache_stats() == {"hits": 1, "misses": 1, "not_modified": 1}
+
+
+def _feed_session(pages):
+    """Session serving PAGE_HTML-like list pages from a {url fragment: titles} map."""
+    class Session:
+        def __init__(self):
+            self.urls = []
+            self.lock = threading.Lock()
+
+        def get(self, url, headers=None, timeout=None):
+            with self.lock:
+                self.urls.append(url)
+            for fragment, titles in pages.items():
+                if fragment in url:
+                    if titles is None:
+                        raise requests.ConnectionError("down")
+                    body = "".join(
+                        f'<dd class="articleSubject"><a href="https://n.news.naver.com/{title}">{title}</a></dd>'
+                        for title in titles
+                    )
+                    return _FakeResponse(content=f"<dl>{body}</dl>".encode("euc-kr"))
+            return _FakeResponse(content=b"<dl></dl>")
+
+    return Session()
+
+
+def test_fetch_news_merges_feeds_and_respects_budgets(monkeypatch):
+    clear_page_cache()
+    monkeypatch.setattr(scraper, "_feed_polled_at", {})
+    session = _feed_session({"LSS2D": ["a", "b"], "section_id3=406": ["b", "c"]})
+    monkeypatch.setattr(scraper, "get_session", lambda: session)
+    feeds = resolve_feeds(["realtime", "disclosure"])
+
+    results = fetch_news(feeds, max_pages=1).items
+    assert {feed: [item.title for item in items] for feed, items in results.items()} == {
+        "realtime": ["a", "b"], "disclosure": ["b", "c"]
+    }
+    assert [item.title for item in merge_feed_items(results)] == ["a", "b", "c"]
+    assert results["disclosure"][0].feed == "disclosure"
+
+    # The disclosure feed may only be polled every few minutes
+    assert list(fetch_news(feeds, max_pages=1).items) == ["realtime"]
+
+
+def test_fetch_news_isolates_failing_feed(monkeypatch):
+    clear_page_cache()
+    monkeypatch.setattr(scraper, "_feed_polled_at", {})
+    session = _feed_session({"LSS2D": ["a"], "section_id3=406": None})
+    monkeypatch.setattr(scraper, "get_session", lambda: session)
+
+    result = fetch_news(resolve_feeds(["realtime", "disclosure"]), max_pages=1)
+    assert list(result.items) == ["realtime"]
+    assert list(result.failed) == ["disclosure"]
+    assert result.complete == ["realtime"]
+
+
+def test_fetch_news_keeps_pages_before_a_failure(monkeypatch):
+    clear_page_cache()
+    monkeypatch.setattr(scraper, "_feed_polled_at", {})
+
+    def get(url, headers=None, timeout=None):
+        if "page=2" in url:
+            raise requests.ConnectionError("down")
+        return _FakeResponse(content=b'<dl><dd class="articleSubject"><a href="https://n.news.naver.com/a">a</a></dd></dl>')
+
+    monkeypatch.setattr(scraper, "get_session", lambda: type("Session", (), {"get": staticmethod(get)})())
+
+    result = fetch_news(resolve_feeds(["realtime"]), max_pages=3, max_workers=1)
+    assert [item.title for item in result.items["realtime"]] == ["a"]
+    assert result.incomplete == {"realtime"}
+    assert result.complete == []
+
+
+def test_ticker_feed_items_match_ticker_keyword():
+    items = [
+        NewsItem(title="반도체 업황 회복", url="https://a.com/1", time="", feed="ticker:005930"),
+        NewsItem(title="반도체 업황 회복", url="https://a.com/2", time="", feed="realtime"),
+    ]
+    matched = find_matching_news(items, ["005930", "반도체"])
+    assert [news.matched_keywords for news in matched] == [("반도체", "005930"), ("반도체",)]
+
+
+def test_stream_news_yields_pages_as_they_arrive_and_stops_when_closed(monkeypatch):
+    clear_page_cache()
+    monkeypatch.setattr(scraper, "_feed_polled_at", {})
+    session = _feed_session({"LSS2D": ["a"], "section_id3=401": ["m"], "section_id3=406": ["d"]})
+    monkeypatch.setattr(scraper, "get_session", lambda: session)
+
+    result = scraper.FetchResult()
+    stream = scraper.stream_news(resolve_feeds(["realtime", "market", "disclosure"]), max_pages=1, result=result)
+    feed, items = next(stream)
+    assert feed in ("realtime", "market", "disclosure")
+    stream.close()
+
+    assert sorted(feed for feed, _ in scraper.stream_news(resolve_feeds(["realtime"]), max_pages=1)) == ["realtime"]
+
+
+def test_page_cache_is_bounded(monkeypatch):
+    clear_page_cache()
+    monkeypatch.setattr(scraper, "PAGE_CACHE_SIZE", 2)
+    monkeypatch.setattr(scraper, "get_session", lambda: _feed_session({"LSS2D": ["a"]}))
+
+    for page in (1, 2, 3):
+        scraper._fetch_page(page)
+    assert list(scraper._page_cache) == [REALTIME_FEED.page_url(2), REALTIME_FEED.page_url(3)]
+    clear_page_cache()
+
+
+def test_build_items_parses_article_ids_and_interns_sources():
+    from catch_stock_news.scraper import _build_items
+
+    records = [
+        ("삼성전자 실적", "/news/news_read.naver?article_id=0005240919&office_id=015", "12:00", "".join(["한국", "경제"])),
+        ("현대차 신차", "https://example.com/article", "12:01", "".join(["한국", "경제"])),
+    ]
+    first, second = _build_items(records)
+
+    assert (first.office_id, first.article_id) == (15, 5240919)
+    assert (second.office_id, second.article_id) == (0, 0)
+    assert first.source is second.source
+    with pytest.raises(AttributeError):
+        first.title = "changed"
@@ -0,0 +1,65 @@
+"""Tests for the title similarity index."""
+
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from catch_stock_news.similarity import TitleSimilarityIndex
+
+WORDS = ["삼성전자", "실적", "발표", "예정", "코스피", "상승", "하락", "외국인", "매수",
+         "[속보]", "SK하이닉스", " ", "HBM", "증설", "현대차", "美", "공장", "…"]
+
+
+def _random_title(rng):
+    return "".join(rng.choice(WORDS) for _ in range(rng.randint(1, 8)))
+
+
+def _mutate(rng, title):
+    chars = list(title)
+    for _ in range(rng.randint(0, 3)):
+        op = rng.choice(["insert", "delete", "replace"])
+        pos = rng.randrange(len(chars) + 1)
+        if op == "insert" or not chars:
+            chars.insert(pos, rng.choice("가나다 ,.AB"))
+        elif op == "delete":
+            del chars[min(pos, len(chars) - 1)]
+        else:
+            chars[min(pos, len(chars) - 1)] = rng.choice("가나다 ,.AB")
+    return "".join(chars)
+
+
+def test_exact_and_dissimilar_titles():
+    index = TitleSimilarityIndex(["삼성전자 실적 발표 예정"])
+    assert index.is_similar("삼성전자 실적 발표 예정", 0.8)
+    assert index.is_similar("삼성전자 실적 발표 예정일", 0.8)
+    assert not index.is_similar("완전히 다른 뉴스 제목입니다", 0.8)
+
+
+def test_remove():
+    index = TitleSimilarityIndex()
+    key = index.add("현대차 신차 출시")
+    assert index.is_similar("현대차 신차 출시", 0.8)
+
+    index.remove(key)
+    assert len(index) == 0
+    assert not index.is_similar("현대차 신차 출시", 0.8)
+
+
+def test_short_and_empty_titles():
+    index = TitleSimilarityIndex(["", "A"])
+    assert index.is_similar("", 0.8)
+    assert index.is_similar("A", 0.8)
+    assert not index.is_similar("B", 0.8)
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.7, 0.8, 0.9, 1.0])
+def test_parity_with_brute_force(threshold):
+    rng = random.Random(threshold)
+    stored = [_random_title(rng) for _ in range(150)]
+    index = TitleSimilarityIndex(stored)
+
+    queries = [_random_title(rng) for _ in range(60)] + [_mutate(rng, rng.choice(stored)) for _ in range(60)]
+    for query in queries:
+        expected = any(SequenceMatcher(None, query, title).ratio() >= threshold for title in stored)
+        assert index.is_similar(query, threshold) is expected, query
@@ -0,0 +1,24 @@
+"""Tests for the feed registry."""
+
+from catch_stock_news.sources import FEEDS, REALTIME_FEED, resolve_feeds, ticker_code, ticker_codes, ticker_feed
+
+
+def test_ticker_codes_are_six_digit_keywords():
+    assert ticker_codes(["삼성전자", "005930", "12345", "000660"]) == ["005930", "000660"]
+
+
+def test_resolve_feeds_expands_tickers_and_skips_unknown():
+    feeds = resolve_feeds(["realtime", "tickers", "disclosure", "nope"], ["삼성전자", "005930"])
+    assert [feed.name for feed in feeds] == ["realtime", "ticker:005930", "disclosure"]
+
+
+def test_feed_urls():
+    assert REALTIME_FEED.page_url(2).endswith("mode=LSS2D&section_id=101&section_id2=258&page=2")
+    assert "section_id3=406" in FEEDS["disclosure"].page_url(1)
+
+    feed = ticker_feed("005930")
+    assert feed.page_url(1) == "https://finance.naver.com/item/news_news.naver?code=005930&page=1"
+    assert feed.headers == {"Referer": "https://finance.naver.com/item/news.naver?code=005930"}
+    assert feed.min_interval > 0
+    assert ticker_code(feed.name) == "005930"
+    assert ticker_code("realtime") is None